@@ -448,8 +448,8 @@ class ProductionNewsAgent:
         """Check agent health"""
         try:
             # Test AI model
-            test_response = self.fetcher.model.generate_content("Say 'OK'")
-            ai_healthy = "ok" in test_response.text.lower()
+            test_response = self.fetcher.llm.generate("Say 'OK'", 'health_check', expected_output_tokens=5, retries=0)
+            ai_healthy = "ok" in test_response.lower()
         except:
             ai_healthy = False
         
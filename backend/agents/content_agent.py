@@ -4,12 +4,16 @@ Specializes in extracting full article content
 """
 
 import time
-from typing import List, Dict, Any
-from newspaper import Article
+from typing import List, Dict, Any, Optional, Callable
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlparse
 import sys
 import threading
 
 from .base_agent import BaseAgent
+from services.article_extractor import download_and_parse, empty_content
+from services.content_store import ContentStore, get_content_store
 
 
 class LoadingSpinner:
@@ -47,17 +51,69 @@ class ContentAgent(BaseAgent):
     Agent specialized in extracting full article content
     """
     
-    def __init__(self, show_loading: bool = True):
-        """Initialize Content Agent"""
+    def __init__(
+        self,
+        show_loading: bool = True,
+        max_workers: int = 8,
+        per_domain: int = 2,
+        timeout: float = 10,
+        content_store: Optional[ContentStore] = None
+    ):
+        """
+        Initialize Content Agent
+        
+        Args:
+            show_loading: Whether to show loading indicators
+            max_workers: Articles extracted concurrently
+            per_domain: Max concurrent downloads from one domain (politeness)
+            timeout: Per-article timeout in seconds
+            content_store: Store of extracted content (defaults to the shared one)
+        """
         super().__init__("ContentAgent", show_loading)
+        
+        self.max_workers = max_workers
+        self.per_domain = per_domain
+        self.timeout = timeout
+        self.content_store = content_store or get_content_store()
+        
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="ContentAgent"
+        )
+        self.domain_lock = threading.Lock()
+        
+        # Downloads waiting for a domain slot - they hold no worker thread
+        self.domain_queues: Dict[str, deque] = {}
+        self.domain_active: Dict[str, int] = {}
+        
+        # Hedged duplicates bypass the domain queue and run on their own
+        # small pool; with every hedge permit taken, no hedge is sent
+        hedge_workers = max(1, max_workers // 4)
+        self.hedge_executor = ThreadPoolExecutor(
+            max_workers=hedge_workers,
+            thread_name_prefix="ContentAgentHedge"
+        )
+        self.hedge_slots = threading.Semaphore(hedge_workers)
+        
+        # Recent download latencies (seconds) - the p95 is the hedge delay
+        self.stats_lock = threading.Lock()
+        self.latencies = deque(maxlen=200)
+        self.race_stats = {
+            'races': 0,
+            'early_stops': 0,
+            'hedged_requests': 0,
+        }
     
     def process(self, data: Any, **kwargs) -> List[Dict]:
         """
         Extract full content from articles
         
         Args:
-            data: List of article dicts with 'url'
-            kwargs: max_to_extract (default 10)
+            data: List of article dicts with 'url' (ranked)
+            kwargs: max_to_extract (default 10), timeout (per article, seconds),
+                race (default False) - extract from up to max_candidates
+                (default 2 * max_to_extract) articles at once and stop once
+                max_to_extract succeed
             
         Returns:
             List of enriched article dicts
@@ -78,7 +134,20 @@ class ContentAgent(BaseAgent):
             spinner.start()
         
         try:
-            enriched_articles = self._extract_content(data[:max_to_extract])
+            timeout = kwargs.get('timeout', self.timeout)
+            
+            if kwargs.get('race'):
+                max_candidates = kwargs.get('max_candidates', max_to_extract * 2)
+                enriched_articles = self._extract_racing(
+                    data[:max_candidates],
+                    max_to_extract,
+                    timeout=timeout
+                )
+            else:
+                enriched_articles = self._extract_content(
+                    data[:max_to_extract],
+                    timeout=timeout
+                )
             
             if spinner:
                 spinner.stop()
@@ -92,63 +161,327 @@ class ContentAgent(BaseAgent):
                 spinner.stop()
             raise e
     
-    def _extract_content(self, articles: List[Dict]) -> List[Dict]:
-        """Extract full content from articles"""
+    def _extract_content(self, articles: List[Dict], timeout: float = None) -> List[Dict]:
+        """
+        Extract full content from articles concurrently
+        
+        Downloads run in parallel (bounded per domain); results keep the
+        input (ranked) order. Articles that miss the deadline are returned
+        without full content.
+        """
+        timeout = timeout or self.timeout
+        futures = {}
+        
+        for i, article in enumerate(articles):
+            url = article.get('url')
+            
+            if not url:
+                self.logger.warning(f"Article {i + 1} has no URL, skipping")
+                continue
+            
+            futures[i] = self._submit_polite(url, timeout)
+        
+        # Everything was submitted at once, so one deadline covers the batch
+        # (queued articles get the time of the slot they wait for)
+        deadline = self._batch_timeout([articles[i]['url'] for i in futures], timeout)
+        wait(list(futures.values()), timeout=deadline)
         
         enriched = []
         
-        for i, article in enumerate(articles, 1):
-            try:
-                url = article.get('url')
-                
-                if not url:
-                    self.logger.warning(f"Article {i} has no URL, skipping")
-                    enriched.append(article)
-                    continue
-                
-                # Extract content
-                full_content = self._extract_from_url(url)
-                
-                # Add to article
-                article['full_text'] = full_content['full_text'][:500]  # First 500 chars
-                article['authors'] = full_content['authors']
-                article['publish_date'] = full_content['publish_date']
-                article['top_image'] = full_content['top_image']
-                article['has_full_content'] = bool(full_content['full_text'])
-                
+        for i, article in enumerate(articles):
+            future = futures.get(i)
+            
+            if future is None:
                 enriched.append(article)
-                
-                # Small delay between requests
-                time.sleep(0.5)
-                
-            except Exception as e:
-                self.logger.warning(f"Failed to extract content from article {i}: {e}")
+                continue
+            
+            if not future.done():
+                future.cancel()
+                self.logger.warning(f"Content extraction timed out for article {i + 1}")
                 article['has_full_content'] = False
                 enriched.append(article)
+                continue
+            
+            try:
+                self._apply_content(article, future.result())
+            except Exception as e:
+                self.logger.warning(f"Failed to extract content from article {i + 1}: {e}")
+                article['has_full_content'] = False
+            
+            enriched.append(article)
         
         return enriched
     
-    def _extract_from_url(self, url: str) -> Dict[str, Any]:
-        """Extract content from a single URL"""
+    def _extract_racing(self, articles: List[Dict], target: int, timeout: float = None) -> List[Dict]:
+        """
+        Extract from all candidates at once, stop once `target` succeed
+        
+        Candidates are in rank order. After `target` successes the race
+        waits a short grace period for higher-ranked candidates still in
+        flight, then returns the best-ranked successes (failures fill up
+        the result if fewer than `target` succeed). Downloads running past
+        the recent p95 latency get one hedged duplicate request.
+        """
+        timeout = timeout or self.timeout
+        self._count('races')
+        
+        hedge_after = self._hedge_delay()
+        grace = hedge_after or 1.0
+        deadline = time.time() + self._batch_timeout(
+            [article['url'] for article in articles if article.get('url')], timeout
+        )
+        
+        started: Dict[int, float] = {}
+        owner = {}
+        live: Dict[int, int] = {}
+        results: Dict[int, Dict[str, Any]] = {}
+        failed = set()
+        hedged = set()
         
+        for i, article in enumerate(articles):
+            if not article.get('url'):
+                failed.add(i)
+                continue
+            future = self._submit_polite(
+                article['url'], timeout,
+                on_start=lambda i=i: started.setdefault(i, time.time())
+            )
+            owner[future] = i
+            live[i] = 1
+        
+        pending = set(owner)
+        enough_at = None
+        
+        while pending:
+            now = time.time()
+            if now >= deadline:
+                break
+            
+            # Poll while hedging or in the grace period, else block
+            poll = 0.1 if (hedge_after or enough_at) else deadline - now
+            done, pending = wait(
+                pending,
+                timeout=min(deadline - now, poll),
+                return_when=FIRST_COMPLETED
+            )
+            
+            for future in done:
+                i = owner[future]
+                live[i] -= 1
+                if i in results:
+                    continue
+                try:
+                    content = future.result()
+                except Exception:
+                    content = None
+                if content and content['full_text']:
+                    results[i] = content
+                elif live[i] == 0:
+                    failed.add(i)
+            
+            # Hedge downloads that run past the usual latency
+            if hedge_after:
+                now = time.time()
+                for future in list(pending):
+                    i = owner[future]
+                    if i in results or i in hedged or i not in started:
+                        continue
+                    if now - started[i] >= hedge_after:
+                        hedge = self._submit_hedge(articles[i]['url'], timeout)
+                        if hedge is None:
+                            continue
+                        owner[hedge] = i
+                        live[i] += 1
+                        pending.add(hedge)
+                        hedged.add(i)
+                        self._count('hedged_requests')
+            
+            # Stop once `target` succeeded and no better-ranked one is pending
+            wins = sorted(results)
+            if len(wins) >= target:
+                enough_at = enough_at or time.time()
+                nth = wins[target - 1]
+                undecided = [i for i in range(nth) if i not in results and i not in failed]
+                if not undecided or time.time() - enough_at >= grace:
+                    break
+        
+        if pending:
+            self._count('early_stops')
+            for future in pending:
+                future.cancel()
+        
+        chosen = sorted(results)[:target]
+        if len(chosen) < target:
+            rest = [i for i in range(len(articles)) if i not in results]
+            chosen = sorted(chosen + rest[:target - len(chosen)])
+        
+        enriched = []
+        for i in chosen:
+            article = articles[i]
+            if i in results:
+                self._apply_content(article, results[i])
+            else:
+                article['has_full_content'] = False
+            enriched.append(article)
+        
+        self.logger.debug(
+            f"Race: {len(results)}/{len(articles)} succeeded, "
+            f"{len(hedged)} hedged, returned {len(enriched)}"
+        )
+        
+        return enriched
+    
+    def _apply_content(self, article: Dict, full_content: Dict[str, Any]):
+        """Attach extracted content to an article dict"""
+        # Full text stays in the content store - the article only
+        # carries a handle to it plus a short preview
+        article['full_text'] = full_content['full_text'][:500]  # Preview
+        article['content_handle'] = (
+            ContentStore.handle_for(article['url'])
+            if full_content['full_text'] else None
+        )
+        article['authors'] = full_content['authors']
+        article['publish_date'] = full_content['publish_date']
+        article['top_image'] = full_content['top_image']
+        article['has_full_content'] = bool(full_content['full_text'])
+    
+    def _hedge_delay(self) -> Optional[float]:
+        """p95 of recent download latencies, None until there is enough history"""
+        with self.stats_lock:
+            samples = sorted(self.latencies)
+        if len(samples) < 20:
+            return None
+        return max(0.5, samples[int(len(samples) * 0.95) - 1])
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get agent metrics plus racing/hedging counters"""
+        metrics = super().get_metrics()
+        hedge_after = self._hedge_delay()
+        with self.stats_lock:
+            race_stats = dict(self.race_stats)
+        metrics['racing'] = {
+            **race_stats,
+            'hedge_after': f"{hedge_after:.2f}s" if hedge_after else None,
+        }
+        return metrics
+    
+    def _count(self, counter: str):
+        with self.stats_lock:
+            self.race_stats[counter] += 1
+    
+    def _batch_timeout(self, urls: List[str], timeout: float) -> float:
+        """
+        Time a batch of downloads needs: each domain downloads per_domain
+        at a time and the pool max_workers at a time
+        """
+        domains = Counter(urlparse(url).netloc.lower() for url in urls)
+        rounds = max(
+            [-(-len(urls) // self.max_workers), 1] +
+            [-(-count // self.per_domain) for count in domains.values()]
+        )
+        return timeout * rounds
+    
+    def _submit_polite(
+        self,
+        url: str,
+        timeout: float,
+        on_start: Optional[Callable[[], None]] = None
+    ) -> Future:
+        """
+        Future of an article's content: served from the content store, else
+        queued for its domain and downloaded once a domain slot is free
+        
+        Queued downloads wait outside the executor, so a busy domain never
+        ties up worker threads, and cancelling a queued future drops it.
+        """
+        future: Future = Future()
+        
+        cached = self.content_store.get(url)
+        if cached is not None:
+            future.set_running_or_notify_cancel()
+            future.set_result(cached)
+            return future
+        
+        domain = urlparse(url).netloc.lower()
+        with self.domain_lock:
+            self.domain_queues.setdefault(domain, deque()).append((future, url, timeout, on_start))
+        
+        self._dispatch(domain)
+        return future
+    
+    def _dispatch(self, domain: str):
+        """Start queued downloads of a domain while it has free slots"""
+        while True:
+            with self.domain_lock:
+                queue = self.domain_queues.get(domain)
+                if not queue or self.domain_active.get(domain, 0) >= self.per_domain:
+                    return
+                
+                future, url, timeout, on_start = queue.popleft()
+                if not queue:
+                    del self.domain_queues[domain]
+                if not future.set_running_or_notify_cancel():
+                    continue  # Cancelled while queued
+                
+                self.domain_active[domain] = self.domain_active.get(domain, 0) + 1
+            
+            self.executor.submit(self._run_download, domain, future, url, timeout, on_start)
+    
+    def _run_download(self, domain: str, future: Future, url: str, timeout: float, on_start: Optional[Callable[[], None]]):
+        """Download holding a domain slot, then hand the slot to the next queued URL"""
         try:
-            article = Article(url)
-            article.download()
-            article.parse()
+            if on_start:
+                on_start()
+            start = time.time()
+            content = self._extract_from_url(url, timeout)
+            with self.stats_lock:
+                self.latencies.append(time.time() - start)
+            future.set_result(content)
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self.domain_lock:
+                self.domain_active[domain] -= 1
+                if not self.domain_active[domain]:
+                    del self.domain_active[domain]
+            self._dispatch(domain)
+    
+    def _submit_hedge(self, url: str, timeout: float) -> Optional[Future]:
+        """
+        Start a hedged duplicate download, or None when every hedge permit
+        is taken
+        
+        Hedges skip the domain queue (they must not wait behind the slow
+        download they race) and run on the hedge pool, so they never hold a
+        worker that first attempts need.
+        """
+        if not self.hedge_slots.acquire(blocking=False):
+            return None
+        
+        def run() -> Dict[str, Any]:
+            try:
+                return self._extract_from_url(url, timeout, hedge=True)
+            finally:
+                self.hedge_slots.release()
+        
+        try:
+            return self.hedge_executor.submit(run)
+        except Exception:
+            self.hedge_slots.release()
+            raise
+    
+    def _extract_from_url(self, url: str, timeout: float = None, hedge: bool = False) -> Dict[str, Any]:
+        """Extract content from a single URL and keep it in the content store"""
+        
+        try:
+            content = download_and_parse(url, timeout or self.timeout, hedge=hedge)
+            
+            if content['full_text']:
+                self.content_store.put(url, content)
             
-            return {
-                'full_text': article.text,
-                'authors': article.authors,
-                'publish_date': str(article.publish_date) if article.publish_date else '',
-                'top_image': article.top_image,
-            }
+            return content
             
         except Exception as e:
             self.logger.debug(f"Content extraction failed for {url[:50]}: {e}")
             
-            return {
-                'full_text': '',
-                'authors': [],
-                'publish_date': '',
-                'top_image': ''
-            }
\ No newline at end of file
+            return empty_content()
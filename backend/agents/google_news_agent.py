@@ -3,7 +3,6 @@ Google News Agent
 Specializes in fetching news from Google News RSS WITH image extraction
 """
 
-import feedparser
 import requests
 import time
 from typing import List, Dict, Any, Optional
@@ -13,6 +12,10 @@ import sys
 import threading
 
 from .base_agent import BaseAgent
+from services.feed_tracker import FeedTracker
+from services.feed_parser import fetch_feed
+from services.page_cache import get_page_cache
+from services.article_store import ArticleStore
 
 
 class LoadingSpinner:
@@ -50,10 +53,20 @@ class GoogleNewsAgent(BaseAgent):
     Agent specialized in fetching from Google News WITH IMAGE EXTRACTION
     """
     
-    def __init__(self, show_loading: bool = True):
-        """Initialize Google News Agent"""
+    def __init__(self, show_loading: bool = True, article_store: Optional[ArticleStore] = None):
+        """
+        Initialize Google News Agent
+        
+        Args:
+            show_loading: Whether to show loading indicators
+            article_store: Store that fetched articles are written to
+        """
         super().__init__("GoogleNewsAgent", show_loading)
+        self.store = article_store
         self.base_url = "https://news.google.com/rss/search"
+        
+        # Seen entries per search feed (incremental ingestion)
+        self.tracker = FeedTracker()
     
     def process(self, data: Any, **kwargs) -> List[Dict]:
         """
@@ -126,11 +139,17 @@ class GoogleNewsAgent(BaseAgent):
         
         self.logger.debug(f"Fetching from: {url[:100]}...")
         
-        # Parse RSS feed
-        feed = feedparser.parse(url)
+        # Parse RSS feed (streaming, stops after max_results items)
+        feed = fetch_feed(url, max_results)
         
-        for entry in feed.entries[:max_results]:
+        for entry in feed['entries']:
             try:
+                # Reuse resolved URL and image of entries already ingested
+                cached = self.tracker.lookup(url, entry)
+                if cached is not None:
+                    articles.append(cached)
+                    continue
+                
                 # Clean title
                 raw_title = entry.get('title', '')
                 clean_title = BeautifulSoup(raw_title, 'html.parser').get_text()
@@ -167,6 +186,7 @@ class GoogleNewsAgent(BaseAgent):
                 if extract_images:
                     article['image'] = self._extract_image(actual_url)
                 
+                self.tracker.remember(url, entry, article)
                 articles.append(article)
                 time.sleep(0.3)  # Rate limiting
                 
@@ -174,13 +194,19 @@ class GoogleNewsAgent(BaseAgent):
                 self.logger.warning(f"Failed to parse entry: {e}")
                 continue
         
+        self.tracker.prune()  # Search feeds vary per query, prune all
+        
+        if self.store:
+            self.store.add_articles(articles)
+        
         return articles
     
     def _resolve_url(self, google_url: str) -> str:
         """Resolve Google News redirect URL to actual article URL"""
         try:
-            response = requests.get(google_url, allow_redirects=True, timeout=5)
-            actual_url = response.url
+            # The redirect target is the article page itself - keep its body
+            page = get_page_cache().fetch(google_url, timeout=5)
+            actual_url = page['url']
             
             # If still on Google domain, return original
             if 'news.google.com' not in actual_url:
@@ -201,19 +227,13 @@ class GoogleNewsAgent(BaseAgent):
         3. First large image in article
         """
         try:
-            # Set timeout to avoid hanging
-            response = requests.get(
-                url, 
-                timeout=5,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-            )
+            # Shared page cache - content extraction reuses these bytes
+            page = get_page_cache().fetch(url, timeout=5)
             
-            if response.status_code != 200:
+            if page['status'] != 200:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(page['content'], 'html.parser')
             
             # Method 1: Try Open Graph image (most reliable)
             og_image = soup.find('meta', property='og:image')
@@ -3,15 +3,15 @@ Query Understanding Agent
 Specializes in parsing and understanding user queries
 """
 
-import json
 import re
 from typing import Dict, Any, Optional
 import sys
 import time
 import threading
-import google.generativeai as genai
 
 from .base_agent import BaseAgent
+from services.llm_gateway import get_llm_gateway
+from services.prompts import query_parse_prompt
 
 
 class LoadingSpinner:
@@ -58,9 +58,8 @@ class QueryAgent(BaseAgent):
         """Initialize Query Agent"""
         super().__init__("QueryAgent", show_loading)
         
-        # Configure AI model
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        # Shared LLM gateway (quota, retries, JSON mode)
+        self.llm = get_llm_gateway(api_key)
         
         self.logger.info("AI model configured for query understanding")
     
@@ -158,29 +157,9 @@ class QueryAgent(BaseAgent):
     def _parse_with_ai(self, query: str) -> Dict[str, Any]:
         """Parse query using AI"""
         
-        prompt = f"""
-Analyze this news search query and extract structured information:
-
-Query: "{query}"
-
-Return ONLY a JSON object with these fields:
-{{
-    "keywords": ["list", "of", "keywords"],
-    "location": "country/state/city or null",
-    "category": "technology/sports/politics/business/health/entertainment or general",
-    "timeframe": "latest/today/recent or null",
-    "search_term": "optimized search term for news search",
-    "intent": "what the user wants to find"
-}}
-"""
-        
-        response = self.model.generate_content(prompt)
-        result_text = response.text.strip()
-        
-        # Clean JSON response
-        result_text = re.sub(r'```json\s*|\s*```', '', result_text)
-        
-        parsed_intent = json.loads(result_text)
+        parsed_intent = self.llm.generate_json(query_parse_prompt(query), 'query_parse', expected_output_tokens=150)
+        if not isinstance(parsed_intent, dict):
+            raise ValueError("Query parse response is not a JSON object")
         
         return parsed_intent
     
@@ -3,15 +3,22 @@ Ranking Agent
 Specializes in ranking articles by relevance
 """
 
-import json
-import re
+import math
 import sys
 import time
 import threading
-from typing import List, Dict, Any
-import google.generativeai as genai
+import hashlib
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 from .base_agent import BaseAgent
+from services.bm25 import rank_articles, tokenize
+from services.embeddings import EmbeddingCache, rank_semantic
+from services.llm_gateway import get_llm_gateway
+from services.prompts import ranking_prompt
+from utils.urls import canonicalize_url
+from config import Config
 
 
 class LoadingSpinner:
@@ -46,16 +53,63 @@ class LoadingSpinner:
 
 class RankingAgent(BaseAgent):
     """
-    Agent specialized in ranking articles by relevance using AI
+    Agent specialized in ranking articles by relevance
+    
+    BM25 orders every candidate locally; in hybrid mode the top K are
+    re-ranked by AI. BM25 alone is used in bm25 mode, when the AI call
+    fails or after repeated failures. Semantic mode ranks by hashed
+    embeddings blended with recency and source weights, without AI.
     """
     
     def __init__(self, api_key: str, show_loading: bool = True):
         """Initialize Ranking Agent"""
         super().__init__("RankingAgent", show_loading)
         
-        # Configure AI model
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        # Shared LLM gateway (quota, concurrency, JSON mode)
+        self.llm = get_llm_gateway(api_key)
+        
+        # BM25 scores every candidate; the LLM only re-ranks the top K
+        self.mode = Config.RANKING_MODE
+        self.rerank_top_k = Config.RANKING_RERANK_TOP_K
+        self.llm_timeout = Config.RANKING_LLM_TIMEOUT
+        self.llm_wait = Config.RANKING_LLM_WAIT
+        
+        # Larger LLM candidate sets are ranked as a tournament of groups
+        self.group_size = Config.RANKING_GROUP_SIZE
+        self.max_llm_candidates = Config.RANKING_MAX_LLM_CANDIDATES
+        
+        # Semantic mode: embeddings cached per article across searches
+        self.embeddings = EmbeddingCache()
+        self.recency_weight = Config.RANKING_RECENCY_WEIGHT
+        self.recency_half_life = Config.RANKING_RECENCY_HALF_LIFE_HOURS
+        self.source_weight = 0.15  # Only applied when source weights are given
+        self.source_weights: Dict[str, float] = {}
+        
+        # AI rankings per query, reused while the candidate set is (nearly) the same
+        self.rank_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.rank_cache_ttl = Config.RANKING_CACHE_TTL_SECONDS
+        self.rank_cache_size = 256
+        self.min_reuse_overlap = 0.8
+        
+        # Skip the LLM for a while after repeated failures
+        self.llm_failures = 0
+        self.llm_open_until = 0.0
+        self.max_llm_failures = 3
+        self.llm_cooldown = 60
+        
+        # Guards rank_cache and the failure counters - searches run concurrently
+        self.state_lock = threading.Lock()
+        
+        self.ranking_stats = {
+            'llm_reranks': 0,
+            'bm25_only': 0,
+            'semantic': 0,
+            'llm_fallbacks': 0,
+            'llm_skipped_open': 0,
+            'tournaments': 0,
+            'cache_hits': 0,
+            'cache_partial_hits': 0,
+        }
         
         self.logger.info("AI model configured for ranking")
     
@@ -64,8 +118,11 @@ class RankingAgent(BaseAgent):
         Rank articles by relevance to query
         
         Args:
-            data: Dict with 'articles' (list) and 'query' (str)
-            kwargs: top_n (default 15)
+            data: Dict with 'articles' (list), 'query' (str) and optional
+                'keywords' (list) from the query agent
+            kwargs: top_n (default 15), mode ('hybrid', 'bm25' or
+                'semantic'), rerank_top_k (candidates sent to the LLM in
+                hybrid mode), source_weights (source -> 0..1, semantic mode)
             
         Returns:
             List of ranked articles
@@ -79,7 +136,10 @@ class RankingAgent(BaseAgent):
         
         articles = data.get('articles', [])
         query = data.get('query', '')
+        keywords = data.get('keywords') or []
         top_n = kwargs.get('top_n', 15)
+        mode = kwargs.get('mode', self.mode)
+        rerank_top_k = kwargs.get('rerank_top_k', self.rerank_top_k)
         
         if not articles:
             return []
@@ -88,6 +148,33 @@ class RankingAgent(BaseAgent):
             self.logger.warning("No query provided, returning articles as-is")
             return articles[:top_n]
         
+        if mode == 'semantic':
+            self.ranking_stats['semantic'] += 1
+            return self._number(self._rank_semantic(
+                articles, ' '.join([query, *keywords]), top_n, kwargs.get('source_weights')
+            ))
+        
+        # Lexical first stage over every candidate
+        start = time.time()
+        candidates = rank_articles(articles, ' '.join([query, *keywords]), len(articles))
+        self.logger.debug(f"BM25 scored {len(candidates)} articles in {(time.time() - start) * 1000:.1f}ms")
+        
+        if mode == 'bm25' or rerank_top_k <= 0:
+            self.ranking_stats['bm25_only'] += 1
+            return self._number(candidates[:top_n])
+        
+        query_key = ' '.join(sorted(set(tokenize(' '.join([query, *keywords])))))
+        cached = self._cached_ranking(query_key, candidates, top_n)
+        if cached is not None:
+            return self._number(cached)
+        
+        with self.state_lock:
+            llm_open = time.time() < self.llm_open_until
+        if llm_open:
+            self.ranking_stats['llm_skipped_open'] += 1
+            self.logger.info("LLM ranking disabled after repeated failures, using BM25")
+            return self._number(candidates[:top_n])
+        
         # Show loading
         spinner = None
         if self.show_loading:
@@ -95,7 +182,13 @@ class RankingAgent(BaseAgent):
             spinner.start()
         
         try:
-            ranked = self._rank_with_ai(articles, query, top_n)
+            # Enough candidates for the requested count reach the LLM
+            top_k = min(max(rerank_top_k, top_n), self.max_llm_candidates)
+            ranked = self._rerank_with_ai(candidates, query, top_n, top_k)
+            with self.state_lock:
+                self.llm_failures = 0
+            self.ranking_stats['llm_reranks'] += 1
+            self._cache_ranking(query_key, candidates, ranked, top_n)
             
             if spinner:
                 spinner.stop()
@@ -108,45 +201,247 @@ class RankingAgent(BaseAgent):
             if spinner:
                 spinner.stop()
             
-            self.logger.warning(f"AI ranking failed, using fallback: {e}")
-            return articles[:top_n]
+            with self.state_lock:
+                self.llm_failures += 1
+                if self.llm_failures >= self.max_llm_failures:
+                    self.llm_open_until = time.time() + self.llm_cooldown
+            self.ranking_stats['llm_fallbacks'] += 1
+            
+            self.logger.warning(f"AI ranking failed, using BM25 order: {e}")
+            return self._number(candidates[:top_n])
     
-    def _rank_with_ai(self, articles: List[Dict], query: str, top_n: int) -> List[Dict]:
-        """Rank articles using AI"""
+    @staticmethod
+    def _fingerprint(urls: List[str]) -> str:
+        """Order-independent fingerprint of a candidate set"""
+        return hashlib.sha1('\n'.join(sorted(urls)).encode('utf-8')).hexdigest()
+    
+    def _cache_ranking(self, query_key: str, candidates: List[Dict], ranked: List[Dict], top_n: int):
+        """Remember an AI ranking for a query and candidate set"""
+        urls = [canonicalize_url(c.get('url', '')) for c in candidates]
+        entry = {
+            'fingerprint': self._fingerprint(urls),
+            'urls': set(urls),
+            'order': [canonicalize_url(a.get('url', '')) for a in ranked],
+            'top_n': top_n,
+            'created': time.time(),
+        }
+        with self.state_lock:
+            self.rank_cache[query_key] = entry
+            self.rank_cache.move_to_end(query_key)
+            while len(self.rank_cache) > self.rank_cache_size:
+                self.rank_cache.popitem(last=False)
+    
+    def _cached_ranking(self, query_key: str, candidates: List[Dict], top_n: int) -> Optional[List[Dict]]:
+        """
+        Ranking from the cache, or None
         
-        # Prepare article summaries for AI
-        article_summaries = []
-        for i, art in enumerate(articles[:30], 1):  # Limit to 30 for AI
-            title = art.get('title', '')[:100]
-            desc = art.get('description', '')[:100]
-            article_summaries.append(f"{i}. {title} - {desc}")
+        An identical candidate set reuses the cached order as is. A set
+        overlapping the cached one by min_reuse_overlap (Jaccard) keeps the
+        cached order of the articles still present and inserts new
+        candidates by BM25 score - before the first ranked article that
+        scores lower.
+        """
+        with self.state_lock:
+            entry = self.rank_cache.get(query_key)
+            if entry is None or entry['top_n'] < top_n:
+                return None
+            
+            if time.time() - entry['created'] > self.rank_cache_ttl:
+                del self.rank_cache[query_key]
+                return None
         
-        prompt = f"""
-User query: "{query}"
-
-Rank these articles by relevance (most to least relevant).
-Return ONLY a JSON array of article numbers in order: [5, 2, 8, 1, ...]
-Include the top {top_n} most relevant articles.
-
-Articles:
-{chr(10).join(article_summaries)}
-"""
+        by_url = {}
+        for candidate in candidates:
+            by_url.setdefault(canonicalize_url(candidate.get('url', '')), candidate)
         
-        # Get AI ranking
-        response = self.model.generate_content(prompt)
-        result_text = response.text.strip()
+        urls = set(by_url)
+        exact = self._fingerprint(list(by_url)) == entry['fingerprint']
         
-        # Clean JSON response
-        result_text = re.sub(r'```json\s*|\s*```', '', result_text)
+        if not exact:
+            overlap = len(urls & entry['urls']) / max(1, len(urls | entry['urls']))
+            if overlap < self.min_reuse_overlap:
+                return None
         
-        ranked_indices = json.loads(result_text)
+        ranked = [by_url[url] for url in entry['order'] if url in by_url]
         
-        # Build ranked article list
-        ranked_articles = []
+        if not exact:
+            for candidate in candidates:
+                url = canonicalize_url(candidate.get('url', ''))
+                if url in entry['urls'] or by_url.get(url) is not candidate:
+                    continue
+                position = next(
+                    (i for i, art in enumerate(ranked) if art['bm25_score'] < candidate['bm25_score']),
+                    len(ranked)
+                )
+                ranked.insert(position, candidate)
+        
+        # Articles that dropped out are backfilled in BM25 order
+        if len(ranked) < top_n:
+            included = {id(art) for art in ranked}
+            ranked.extend(c for c in candidates if id(c) not in included)
+        
+        with self.state_lock:
+            # Another search may have evicted or replaced it meanwhile
+            if query_key in self.rank_cache:
+                self.rank_cache.move_to_end(query_key)
+        self.ranking_stats['cache_hits' if exact else 'cache_partial_hits'] += 1
+        self.logger.info(f"Ranking served from cache ({'exact' if exact else 'partial'})")
+        
+        return ranked[:top_n]
+    
+    def _rank_semantic(
+        self,
+        articles: List[Dict],
+        query: str,
+        top_n: int,
+        source_weights: Dict[str, float] = None
+    ) -> List[Dict]:
+        """Rank by embedding similarity blended with recency and source weight"""
+        source_weights = source_weights if source_weights is not None else self.source_weights
+        
+        start = time.time()
+        ranked = rank_semantic(
+            articles, query, top_n, self.embeddings,
+            recency_weight=self.recency_weight,
+            half_life_hours=self.recency_half_life,
+            source_weights=source_weights,
+            source_weight=self.source_weight if source_weights else 0.0,
+        )
+        self.logger.debug(f"Semantic scoring of {len(articles)} articles took {(time.time() - start) * 1000:.1f}ms")
+        
+        return ranked
+    
+    @staticmethod
+    def _number(articles: List[Dict]) -> List[Dict]:
+        """Set relevance_rank in list order"""
+        for rank, article in enumerate(articles, 1):
+            article['relevance_rank'] = rank
+        return articles
+    
+    def _rerank_with_ai(
+        self,
+        candidates: List[Dict],
+        query: str,
+        top_n: int,
+        top_k: int
+    ) -> List[Dict]:
+        """
+        Re-rank the top K BM25 candidates using AI
+        
+        Up to group_size * 1.2 candidates go to one call; larger sets are
+        ranked as a tournament (see _rank_tournament).
+        """
+        head = candidates[:top_k]
+        
+        if len(head) > self.group_size * 1.2:
+            order = self._rank_tournament(head, query, top_n)
+        else:
+            order = self._llm_order(head, query, min(top_n, len(head)))
+        
+        # LLM order first, then the tail in BM25 order
+        ranked_articles = [head[i] for i in order]
+        ranked_articles.extend(candidates[top_k:])
+        
+        return self._number(ranked_articles[:top_n])
+    
+    def _llm_order(self, articles: List[Dict], query: str, want: int) -> List[int]:
+        """
+        Order articles with one AI call
+        
+        Returns:
+            Every index of articles: the AI's ranking first, then the
+            indices it left out in input order
+        """
+        
+        # Get AI ranking (no retries, short quota/slot wait - BM25 order
+        # is the fallback)
+        ranked_indices = self.llm.generate_json(
+            ranking_prompt(query, articles, want),
+            'ranking',
+            items=len(articles),
+            expected_output_tokens=4 * want,
+            timeout=self.llm_timeout,
+            retries=0,
+            wait_timeout=self.llm_wait
+        )
+        if not isinstance(ranked_indices, list):
+            raise ValueError("Ranking response is not a JSON array")
+        
+        order = []
         for idx in ranked_indices:
-            if 1 <= idx <= len(articles):
-                article = articles[idx - 1].copy()
-                article['relevance_rank'] = len(ranked_articles) + 1
-                ranked_articles.append(article)
+            if isinstance(idx, int) and 1 <= idx <= len(articles) and idx - 1 not in order:
+                order.append(idx - 1)
         
-        return ranked_articles[:top_n]
\ No newline at end of file
+        order.extend(i for i in range(len(articles)) if i not in order)
+        return order
+    
+    def _rank_tournament(self, articles: List[Dict], query: str, top_n: int) -> List[int]:
+        """
+        Rank a large candidate set in parallel groups, then re-rank the winners
+        
+        Candidates are dealt round-robin into groups of about group_size so
+        every group gets a share of the strong BM25 candidates. Groups are
+        ranked in parallel; the top of each group meets in a final call.
+        The rest follow by their rank within their group, interleaved in
+        the order of their group's best finisher.
+        
+        Returns:
+            Every index of articles in ranked order
+        """
+        num_groups = math.ceil(len(articles) / self.group_size)
+        groups = [list(range(g, len(articles), num_groups)) for g in range(num_groups)]
+        winners_per_group = max(1, self.group_size // num_groups)
+        
+        def rank_group(members: List[int]) -> List[int]:
+            order = self._llm_order([articles[i] for i in members], query, len(members))
+            return [members[i] for i in order]
+        
+        ranked_groups = []
+        failures = 0
+        with ThreadPoolExecutor(max_workers=num_groups) as executor:
+            futures = [executor.submit(rank_group, members) for members in groups]
+            for members, future in zip(groups, futures):
+                try:
+                    ranked_groups.append(future.result())
+                except Exception as e:
+                    self.logger.debug(f"Group ranking failed, keeping BM25 order: {e}")
+                    ranked_groups.append(members)
+                    failures += 1
+        
+        if failures == num_groups:
+            raise RuntimeError("All tournament groups failed")
+        
+        # Final: the group winners against each other
+        winners = [i for group in ranked_groups for i in group[:winners_per_group]]
+        try:
+            final = self._llm_order([articles[i] for i in winners], query, min(top_n, len(winners)))
+            winners = [winners[i] for i in final]
+        except Exception as e:
+            self.logger.debug(f"Final ranking failed, ordering winners by group rank: {e}")
+            winners.sort(key=lambda i: next(g.index(i) for g in ranked_groups if i in g))
+        
+        # Remaining places: group ranks interleaved, strongest group first
+        group_order = sorted(
+            range(num_groups),
+            key=lambda g: winners.index(ranked_groups[g][0])
+        )
+        rest = []
+        for position in range(winners_per_group, max(len(g) for g in ranked_groups)):
+            for g in group_order:
+                if position < len(ranked_groups[g]):
+                    rest.append(ranked_groups[g][position])
+        
+        self.ranking_stats['tournaments'] += 1
+        return winners + rest
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get agent metrics including how rankings were produced"""
+        metrics = super().get_metrics()
+        metrics['ranking'] = {
+            'mode': self.mode,
+            'rerank_top_k': self.rerank_top_k,
+            'llm_circuit_open': time.time() < self.llm_open_until,
+            **self.ranking_stats,
+            'embeddings': self.embeddings.get_stats(),
+        }
+        return metrics
@@ -3,8 +3,6 @@ RSS Feed Agent
 Specializes in fetching news from various RSS feeds WITH image extraction
 """
 
-import feedparser
-import requests
 import time
 import sys
 import threading
@@ -12,6 +10,12 @@ from typing import List, Dict, Any, Optional
 from bs4 import BeautifulSoup
 
 from .base_agent import BaseAgent
+from services.feed_tracker import FeedTracker
+from services.feed_scheduler import FeedScheduler, entry_timestamp
+from services.feed_parser import fetch_feed
+from services.page_cache import get_page_cache
+from services.article_store import ArticleStore
+from config import Config
 
 
 class LoadingSpinner:
@@ -49,9 +53,21 @@ class RSSFeedAgent(BaseAgent):
     Agent specialized in fetching from RSS feeds WITH IMAGE EXTRACTION
     """
     
-    def __init__(self, show_loading: bool = True):
-        """Initialize RSS Feed Agent"""
+    def __init__(self, show_loading: bool = True, article_store: Optional[ArticleStore] = None):
+        """
+        Initialize RSS Feed Agent
+        
+        Args:
+            show_loading: Whether to show loading indicators
+            article_store: Store that ingested articles are written to and
+                keyword searches are served from
+        """
         super().__init__("RSSFeedAgent", show_loading)
+        self.store = article_store
+        
+        # Background polling thread (see start_background_polling)
+        self._poll_thread = None
+        self._stop_polling = threading.Event()
         
         # RSS Feed sources
         self.rss_sources = {
@@ -75,6 +91,16 @@ class RSSFeedAgent(BaseAgent):
             'politics': ['bbc_world', 'al_jazeera'],
             'general': ['bbc_world', 'al_jazeera', 'reuters_world'],
         }
+        
+        # Seen entries per feed (incremental ingestion)
+        self.tracker = FeedTracker()
+        
+        # Adaptive polling schedule + last parsed result per feed
+        self.scheduler = FeedScheduler(
+            min_interval=Config.FEED_MIN_POLL_SECONDS,
+            max_interval=Config.FEED_MAX_POLL_SECONDS
+        )
+        self.feed_snapshots: Dict[str, Dict[str, Any]] = {}
     
     def process(self, data: Any, **kwargs) -> List[Dict]:
         """
@@ -82,7 +108,8 @@ class RSSFeedAgent(BaseAgent):
         
         Args:
             data: Dict with 'category' and 'keywords'
-            kwargs: max_results_per_feed (default 8), extract_images (default True)
+            kwargs: max_results_per_feed (default 8), max_results (default 24,
+                keyword search), extract_images (default True)
             
         Returns:
             List of article dicts with images
@@ -95,7 +122,9 @@ class RSSFeedAgent(BaseAgent):
             raise ValueError("Data must be a dict with 'category'")
         
         category = data.get('category', 'general')
+        keywords = data.get('keywords') or []
         max_per_feed = kwargs.get('max_results_per_feed', 8)
+        max_results = kwargs.get('max_results', 24)
         extract_images = kwargs.get('extract_images', True)
         
         # Show loading
@@ -105,7 +134,7 @@ class RSSFeedAgent(BaseAgent):
             spinner.start()
         
         try:
-            articles = self._fetch_from_feeds(category, max_per_feed, extract_images)
+            articles = self._search(category, keywords, max_per_feed, max_results, extract_images)
             
             if spinner:
                 spinner.stop()
@@ -119,6 +148,82 @@ class RSSFeedAgent(BaseAgent):
                 spinner.stop()
             raise e
     
+    def _search(
+        self,
+        category: str,
+        keywords: List[str],
+        max_per_feed: int,
+        max_results: int,
+        extract_images: bool = True
+    ) -> List[Dict]:
+        """Keyword search over the article store, category feeds as fallback"""
+        
+        use_store = self.store is not None and bool(keywords)
+        feed_articles = None
+        
+        # With background polling the store is already fresh - no feed I/O here
+        if not (use_store and self._poll_thread):
+            feed_articles = self._fetch_from_feeds(category, max_per_feed, extract_images)
+        
+        if use_store:
+            articles = self.store.search(
+                keywords,
+                max_results=max_results,
+                max_age_hours=Config.ARTICLE_MAX_AGE_HOURS
+            )
+            if articles:
+                self.logger.debug(f"Store matched {len(articles)} articles for {keywords}")
+                return articles
+        
+        if feed_articles is None:
+            feed_articles = self._fetch_from_feeds(category, max_per_feed, extract_images)
+        
+        return feed_articles
+    
+    def start_background_polling(self):
+        """Keep all feeds fresh in a background thread, following the schedule"""
+        if self._poll_thread:
+            return
+        
+        self._stop_polling.clear()
+        self._poll_thread = threading.Thread(
+            target=self._poll_loop,
+            name="RSSFeedPoller",
+            daemon=True
+        )
+        self._poll_thread.start()
+        self.logger.info("Background feed polling started")
+    
+    def stop_background_polling(self):
+        """Stop the background polling thread"""
+        if not self._poll_thread:
+            return
+        
+        self._stop_polling.set()
+        self._poll_thread.join(timeout=10)
+        self._poll_thread = None
+        self.logger.info("Background feed polling stopped")
+    
+    def _poll_loop(self):
+        """Background loop: poll due feeds, sleep until the next one is due"""
+        while not self._stop_polling.is_set():
+            try:
+                self.poll_due_feeds()
+                if self.store:
+                    self.store.prune()
+            except Exception as e:
+                self.logger.warning(f"Background polling error: {e}")
+            
+            wait = self.scheduler.seconds_until_due(list(self.rss_sources.keys()))
+            self._stop_polling.wait(max(1.0, wait))
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get agent metrics plus ingestion and polling state"""
+        metrics = super().get_metrics()
+        metrics['ingestion'] = self.tracker.get_stats()
+        metrics['feed_schedule'] = self.scheduler.get_stats()
+        return metrics
+    
     def _fetch_from_feeds(
         self, 
         category: str, 
@@ -145,6 +250,12 @@ class RSSFeedAgent(BaseAgent):
             if feed_name not in self.rss_sources:
                 continue
             
+            # Serve the last snapshot until the feed is due again
+            snapshot = self.feed_snapshots.get(feed_name)
+            if snapshot and not self.scheduler.is_due(feed_name):
+                articles.extend(dict(a) for a in snapshot['articles'][:max_per_feed])
+                continue
+            
             try:
                 feed_articles = self._parse_feed(feed_name, max_per_feed, extract_images)
                 articles.extend(feed_articles)
@@ -153,10 +264,31 @@ class RSSFeedAgent(BaseAgent):
                 
             except Exception as e:
                 self.logger.warning(f"Failed to fetch from {feed_name}: {e}")
+                self.scheduler.record_error(feed_name, str(e))
+                if snapshot:
+                    articles.extend(dict(a) for a in snapshot['articles'][:max_per_feed])
                 continue
         
         return articles
     
+    def poll_due_feeds(self, max_per_feed: int = 8, extract_images: bool = True) -> int:
+        """
+        Poll every feed whose schedule is due (for background refresh)
+        
+        Returns:
+            Number of feeds polled
+        """
+        due = self.scheduler.due_feeds(list(self.rss_sources.keys()))
+        
+        for feed_name in due:
+            try:
+                self._parse_feed(feed_name, max_per_feed, extract_images)
+            except Exception as e:
+                self.logger.warning(f"Failed to poll {feed_name}: {e}")
+                self.scheduler.record_error(feed_name, str(e))
+        
+        return len(due)
+    
     def _parse_feed(
         self, 
         feed_name: str, 
@@ -166,15 +298,32 @@ class RSSFeedAgent(BaseAgent):
         """Parse a single RSS feed"""
         
         feed_url = self.rss_sources[feed_name]
+        snapshot = self.feed_snapshots.get(feed_name)
         
         self.logger.debug(f"Parsing feed: {feed_name}")
         
-        feed = feedparser.parse(feed_url)
+        # Streaming parse + conditional GET (304 when nothing changed)
+        feed = fetch_feed(
+            feed_url,
+            max_results,
+            etag=snapshot.get('etag') if snapshot else None,
+            modified=snapshot.get('modified') if snapshot else None
+        )
+        
+        if feed['status'] == 304 and snapshot:
+            self.scheduler.record_not_modified(feed_name)
+            return [dict(a) for a in snapshot['articles'][:max_results]]
         
         articles = []
         
-        for entry in feed.entries[:max_results]:
+        for entry in feed['entries']:
             try:
+                # Reuse the record of entries already ingested unchanged
+                cached = self.tracker.lookup(feed_name, entry)
+                if cached is not None:
+                    articles.append(cached)
+                    continue
+                
                 article = {
                     'title': entry.get('title', ''),
                     'description': entry.get('summary', entry.get('description', '')),
@@ -187,30 +336,46 @@ class RSSFeedAgent(BaseAgent):
                 }
                 
                 # Some RSS feeds include media content (enclosures)
-                if hasattr(entry, 'media_content') and entry.media_content:
+                if entry.get('media_content'):
                     # Get first media item
-                    media = entry.media_content[0]
+                    media = entry['media_content'][0]
                     if 'url' in media:
                         article['image'] = media['url']
                         self.logger.debug(f"✅ RSS media image: {media['url'][:60]}...")
                 
                 # Try media_thumbnail if no media_content
-                if not article['image'] and hasattr(entry, 'media_thumbnail'):
-                    if entry.media_thumbnail and len(entry.media_thumbnail) > 0:
-                        article['image'] = entry.media_thumbnail[0].get('url')
+                if not article['image'] and entry.get('media_thumbnail'):
+                    article['image'] = entry['media_thumbnail'][0].get('url')
+                    if article['image']:
                         self.logger.debug(f"✅ RSS thumbnail: {article['image'][:60]}...")
                 
                 # Extract from article page if still no image and enabled
                 if not article['image'] and extract_images and article['url']:
                     article['image'] = self._extract_image(article['url'])
                 
+                self.tracker.remember(feed_name, entry, article)
                 articles.append(article)
                 
             except Exception as e:
                 self.logger.warning(f"Failed to parse entry in {feed_name}: {e}")
                 continue
         
-        return articles
+        self.tracker.prune(feed_name)
+        
+        if self.store:
+            self.store.add_articles(articles)
+        
+        self.scheduler.record_success(
+            feed_name,
+            [entry_timestamp(entry) for entry in feed['entries']]
+        )
+        self.feed_snapshots[feed_name] = {
+            'articles': articles,
+            'etag': feed['etag'],
+            'modified': feed['modified'],
+        }
+        
+        return [dict(a) for a in articles]
     
     def _extract_image(self, url: str) -> Optional[str]:
         """
@@ -218,18 +383,13 @@ class RSSFeedAgent(BaseAgent):
         Tries Open Graph and Twitter Card meta tags
         """
         try:
-            response = requests.get(
-                url, 
-                timeout=5,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-            )
+            # Shared page cache - content extraction reuses these bytes
+            page = get_page_cache().fetch(url, timeout=5)
             
-            if response.status_code != 200:
+            if page['status'] != 200:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(page['content'], 'html.parser')
             
             # Try Open Graph image
             og_image = soup.find('meta', property='og:image')
@@ -6,10 +6,18 @@ Specializes in generating AI-powered summaries
 import time
 import sys
 import threading
-from typing import List, Dict, Any
-import google.generativeai as genai
+from typing import List, Dict, Any, Iterator, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
 
 from base_agent import BaseAgent
+from services.content_store import get_content_store
+from services.llm_gateway import get_llm_gateway
+from services.dedup import StoryDeduplicator
+from services.prompts import summary_prompt, digest_prompt, SUMMARY_PROMPT_VERSION, DIGEST_PROMPT_VERSION
+from services.summary_batcher import SummaryBatcher
+from services.summary_cache import SummaryCache, summary_key
+from services.textrank import extractive_summary
+from config import Config
 
 
 class LoadingSpinner:
@@ -47,13 +55,59 @@ class SummaryAgent(BaseAgent):
     Agent specialized in generating intelligent summaries using AI
     """
     
-    def __init__(self, api_key: str, show_loading: bool = True):
-        """Initialize Summary Agent"""
+    def __init__(self, api_key: str, show_loading: bool = True, batching: bool = None):
+        """
+        Initialize Summary Agent
+        
+        Args:
+            api_key: Google AI Studio API key
+            show_loading: Show loading animations
+            batching: Batch summary calls across requests (default from config)
+        """
         super().__init__("SummaryAgent", show_loading)
         
-        # Configure AI model
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        # Shared LLM gateway (quota, concurrency, retries)
+        self.llm = get_llm_gateway(api_key)
+        
+        # Summaries already generated for the same text, prompt and model
+        self.summary_cache = SummaryCache(
+            Config.SUMMARY_CACHE_PATH,
+            max_entries=Config.SUMMARY_CACHE_MAX_ENTRIES
+        )
+        
+        # Full article text is read from here by content handle
+        self.content_store = get_content_store()
+        
+        # Summaries run concurrently within the gateway's quota and slots
+        self.executor = ThreadPoolExecutor(
+            max_workers=Config.SUMMARY_CONCURRENCY,
+            thread_name_prefix="summary"
+        )
+        self.expected_output_tokens = 250
+        
+        # Summary jobs from concurrent requests share multi-article prompts
+        self.batching = Config.SUMMARY_BATCHING if batching is None else batching
+        self.batcher = SummaryBatcher(
+            self._call_model,
+            window=Config.SUMMARY_BATCH_WINDOW_MS / 1000,
+            max_batch=Config.SUMMARY_BATCH_SIZE,
+            max_inflight=Config.SUMMARY_CONCURRENCY,
+        )
+        
+        # Digest mode groups articles about the same event, looser than dedup
+        # (different headlines, similar lead paragraphs)
+        self.story_clusterer = StoryDeduplicator(
+            num_perm=128,
+            bands=64,
+            threshold=Config.SUMMARY_DIGEST_THRESHOLD,
+            description_tokens=40
+        )
+        self.digest_stats = {
+            'stories': 0,
+            'articles': 0,
+            'llm_calls': 0,
+            'cache_hits': 0,
+        }
         
         self.logger.info("AI model configured for summarization")
     
@@ -63,7 +117,9 @@ class SummaryAgent(BaseAgent):
         
         Args:
             data: List of article dicts
-            kwargs: max_to_summarize (default 10)
+            kwargs: max_to_summarize (default 10), summary_mode ('ai',
+                'fast' - extractive only, no LLM call, or 'digest' - one
+                shared summary per story covered by several articles)
             
         Returns:
             List of articles with summaries
@@ -76,6 +132,7 @@ class SummaryAgent(BaseAgent):
             raise ValueError("Data must be a list of article dicts")
         
         max_to_summarize = kwargs.get('max_to_summarize', 10)
+        summary_mode = kwargs.get('summary_mode', 'ai')
         
         # Show loading
         spinner = None
@@ -84,7 +141,7 @@ class SummaryAgent(BaseAgent):
             spinner.start()
         
         try:
-            summarized = self._generate_summaries(data[:max_to_summarize])
+            summarized = self._generate_summaries(data[:max_to_summarize], summary_mode)
             
             if spinner:
                 spinner.stop()
@@ -98,41 +155,195 @@ class SummaryAgent(BaseAgent):
                 spinner.stop()
             raise e
     
-    def _generate_summaries(self, articles: List[Dict]) -> List[Dict]:
-        """Generate summaries for articles"""
+    def _generate_summaries(self, articles: List[Dict], summary_mode: str = 'ai') -> List[Dict]:
+        """
+        Generate summaries for articles
         
-        summarized = []
+        Articles without enough full text use their description right away;
+        the rest are summarized concurrently (through the batcher when
+        batching is on), each call waiting only for quota and a slot from
+        the shared LLM gateway. In fast mode full texts get an extractive summary instead;
+        in digest mode articles about the same story share one summary.
+        """
+        
+        futures = {}
+        digests, digested = [], set()
+        if summary_mode == 'digest':
+            digests, digested = self._submit_digests(articles)
         
         for i, article in enumerate(articles, 1):
-            try:
-                # Check if article has full text content
-                full_text = article.get('full_text', '')
-                title = article.get('title', '')
-                description = article.get('description', '')
-                
-                # Generate summary
-                if full_text and len(full_text) > 100:
-                    summary = self._generate_ai_summary(full_text, title)
-                elif description:
-                    summary = description
-                else:
-                    summary = "Summary not available."
-                
-                article['full_summary'] = summary
-                article['has_ai_summary'] = bool(full_text and len(full_text) > 100)
+            if i - 1 in digested:
+                continue
+            
+            # Check if article has full text content
+            full_text = self._full_text(article)
+            title = article.get('title', '')
+            description = article.get('description', '')
+            
+            if full_text and len(full_text) > 100 and summary_mode == 'fast':
+                article['full_summary'] = extractive_summary(full_text)
+                article['has_ai_summary'] = False
+                continue
+            
+            if full_text and len(full_text) > 100:
+                key = summary_key(title, full_text, SUMMARY_PROMPT_VERSION, self.llm.model)
+                cached = self.summary_cache.get(key)
                 
-                summarized.append(article)
+                if cached is not None:
+                    article['full_summary'] = cached
+                    article['has_ai_summary'] = True
+                    continue
                 
-                # Delay between AI calls
-                time.sleep(1)
+                # Prompts fit the text to the summary token budget
+                if self.batching:
+                    futures[i] = (self.batcher.submit(title, full_text), full_text, key)
+                else:
+                    futures[i] = (self.executor.submit(self._summarize, full_text, title), full_text, key)
+                continue
+            
+            if len(description) > 600:
+                description = extractive_summary(description)  # Long feed descriptions
+            article['full_summary'] = description or "Summary not available."
+            article['has_ai_summary'] = False
+        
+        for i, (future, full_text, key) in futures.items():
+            article = articles[i - 1]
+            try:
+                article['full_summary'] = future.result()
+                article['has_ai_summary'] = True
+                self.summary_cache.put(key, article['full_summary'])
                 
             except Exception as e:
-                self.logger.warning(f"Failed to summarize article {i}: {e}")
-                article['full_summary'] = article.get('description', 'Summary not available.')
+                self.logger.warning(f"AI summary generation failed for article {i}: {e}")
+                article['full_summary'] = self._fallback_summary(full_text)
                 article['has_ai_summary'] = False
-                summarized.append(article)
         
-        return summarized
+        for future, members, sources, key in digests:
+            try:
+                digest = future.result().strip()
+                has_ai_summary = True
+                self.summary_cache.put(key, digest)
+                
+            except Exception as e:
+                self.logger.warning(f"Story digest failed for {len(members)} articles: {e}")
+                digest = self._fallback_summary(max((text for _, _, text in sources), key=len))
+                has_ai_summary = False
+            
+            self._attach_digest(articles, members, sources, digest, has_ai_summary)
+        
+        return articles
+    
+    def _submit_digests(self, articles: List[Dict]) -> Tuple[list, Set[int]]:
+        """
+        Start one digest per story covered by several articles
+        
+        Cached digests are attached right away.
+        
+        Returns:
+            Pending digests as (future, member indices, sources, cache key),
+            and the indices of every article covered by a digest
+        """
+        texts = [self._full_text(article) for article in articles]
+        
+        # Cluster on title plus the lead of the best text available
+        views = [
+            {
+                'title': article.get('title', ''),
+                'description': text if len(text) > 100 else article.get('description', ''),
+                'url': article.get('url', ''),
+            }
+            for article, text in zip(articles, texts)
+        ]
+        
+        pending, digested = [], set()
+        
+        for members in self.story_clusterer.clusters(views):
+            if len(members) < 2:
+                continue
+            
+            sources = self._digest_sources(articles, views, members)
+            if sum(len(text) for _, _, text in sources) <= 100:
+                continue
+            
+            digested.update(members)
+            self.digest_stats['stories'] += 1
+            self.digest_stats['articles'] += len(members)
+            
+            key = summary_key(
+                '\n'.join(title for _, title, _ in sources),
+                '\x00'.join(f"{source}\x00{text}" for source, _, text in sources),
+                DIGEST_PROMPT_VERSION,
+                self.llm.model
+            )
+            cached = self.summary_cache.get(key)
+            
+            if cached is not None:
+                self.digest_stats['cache_hits'] += 1
+                self._attach_digest(articles, members, sources, cached)
+                continue
+            
+            self.digest_stats['llm_calls'] += 1
+            # items = articles the digest stands for, so tokens per article
+            # reflect the saving over summarizing each one
+            future = self.executor.submit(self._call_model, digest_prompt(sources), len(members), 'digest')
+            pending.append((future, members, sources, key))
+        
+        return pending, digested
+    
+    def _digest_sources(self, articles: List[Dict], views: List[Dict], members: List[int]) -> List[Tuple[str, str, str]]:
+        """
+        Longest text per outlet in a story, as (source, title, text)
+        
+        Outlets are sorted by name so the same story gives the same prompt
+        (and cache key) whatever order ranking put it in; digest_prompt
+        splits the digest token budget between them.
+        """
+        best: Dict[str, Tuple[str, str, str]] = {}
+        for i in members:
+            source = articles[i].get('source', '')
+            text = views[i]['description']
+            if source not in best or len(text) > len(best[source][2]):
+                best[source] = (source, views[i]['title'], text)
+        
+        return [best[name] for name in sorted(best)]
+    
+    @staticmethod
+    def _attach_digest(
+        articles: List[Dict],
+        members: List[int],
+        sources: List[Tuple[str, str, str]],
+        digest: str,
+        has_ai_summary: bool = True
+    ):
+        """Give every article of a story the shared digest"""
+        for i in members:
+            articles[i]['full_summary'] = digest
+            articles[i]['has_ai_summary'] = has_ai_summary
+            articles[i]['digest_sources'] = [source for source, _, _ in sources]
+    
+    def _full_text(self, article: Dict) -> str:
+        """Whole article text by content handle, else the text the article carries"""
+        handle = article.get('content_handle')
+        
+        if handle:
+            text = self.content_store.get_text(handle)
+            if text:
+                return text
+        
+        return article.get('full_text', '')
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get agent metrics including the shared LLM gateway"""
+        metrics = super().get_metrics()
+        metrics['llm'] = self.llm.get_stats()
+        metrics['summary_cache'] = self.summary_cache.get_stats()
+        if self.batching:
+            metrics['batching'] = self.batcher.get_stats()
+        metrics['digest'] = {
+            'llm_calls_saved': self.digest_stats['articles'] - self.digest_stats['llm_calls'],
+            **self.digest_stats,
+        }
+        return metrics
     
     def _generate_ai_summary(self, article_text: str, title: str) -> str:
         """Generate AI summary for article"""
@@ -140,27 +351,87 @@ class SummaryAgent(BaseAgent):
         if not article_text or len(article_text) < 100:
             return "Summary not available - insufficient content."
         
-        prompt = f"""
-Generate a comprehensive 4-5 sentence summary of this news article:
-
-Title: {title}
-
-Article: {article_text[:3000]}
-
-Summary should:
-- Cover all key points
-- Be clear and informative
-- Include important details, names, and numbers
-- Be written in a professional news style
-"""
-        
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self._summarize(article_text, title)
             
         except Exception as e:
             self.logger.warning(f"AI summary generation failed: {e}")
+            return self._fallback_summary(article_text)
+    
+    def stream_summary(self, article: Dict) -> Iterator[Dict[str, Any]]:
+        """
+        Summarize one article, yielding text as the model generates it
+        
+        Yields:
+            {'type': 'token', 'text': ...} for each generated chunk, then
+            {'type': 'done', 'summary': ..., 'has_ai_summary': ..., 'cached': ...,
+            'complete': ...} - complete is False (with an 'error') when the
+            stream broke off after some text was sent
+        """
+        full_text = self._full_text(article)
+        title = article.get('title', '')
+        
+        if not full_text or len(full_text) <= 100:
+            summary = article.get('description') or "Summary not available."
+            yield {'type': 'token', 'text': summary}
+            yield {'type': 'done', 'summary': summary, 'has_ai_summary': False, 'cached': False, 'complete': True}
+            return
+        
+        key = summary_key(title, full_text, SUMMARY_PROMPT_VERSION, self.llm.model)
+        cached = self.summary_cache.get(key)
+        if cached is not None:
+            yield {'type': 'token', 'text': cached}
+            yield {'type': 'done', 'summary': cached, 'has_ai_summary': True, 'cached': True, 'complete': True}
+            return
+        
+        prompt = summary_prompt(title, full_text)
+        parts = []
+        error = None
+        
+        try:
+            for text in self.llm.stream(prompt, 'summary_stream', expected_output_tokens=self.expected_output_tokens):
+                parts.append(text)
+                yield {'type': 'token', 'text': text}
             
-            # Fallback: first 3 sentences
-            sentences = article_text.split('. ')[:3]
-            return '. '.join(sentences) + '.'
\ No newline at end of file
+        except Exception as e:
+            self.logger.warning(f"Streamed summary failed: {e}")
+            if not parts:
+                # Extractive fallback, as in fast mode
+                summary = self._fallback_summary(full_text)
+                yield {'type': 'token', 'text': summary}
+                yield {'type': 'done', 'summary': summary, 'has_ai_summary': False, 'cached': False, 'complete': True}
+                return
+            error = str(e) or type(e).__name__
+        
+        summary = ''.join(parts).strip()
+        if error:
+            # Cut off mid-summary - not cached, and flagged for the client
+            yield {'type': 'done', 'summary': summary, 'has_ai_summary': True, 'cached': False,
+                   'complete': False, 'error': error}
+            return
+        
+        self.summary_cache.put(key, summary)
+        yield {'type': 'done', 'summary': summary, 'has_ai_summary': True, 'cached': False, 'complete': True}
+    
+    def _summarize(self, article_text: str, title: str) -> str:
+        """AI summary of one article (raises on failure)"""
+        return self._call_model(summary_prompt(title, article_text)).strip()
+    
+    def _call_model(self, prompt: str, articles: int = 1, prompt_type: str = None) -> str:
+        """Send a prompt covering some articles to the model, within quota"""
+        if prompt_type is None:
+            prompt_type = 'summary' if articles == 1 else 'summary_batch'
+        
+        # A digest is one summary however many reports it combines
+        outputs = 1 if prompt_type == 'digest' else articles
+        return self.llm.generate(
+            prompt,
+            prompt_type,
+            items=articles,
+            expected_output_tokens=self.expected_output_tokens * outputs
+        )
+    
+    @staticmethod
+    def _fallback_summary(article_text: str) -> str:
+        """Extractive (TextRank) summary when the LLM is unavailable"""
+        return extractive_summary(article_text)
@@ -0,0 +1,114 @@
+"""
+Content Extraction Benchmark
+Sequential vs concurrent ContentAgent extraction against a local slow origin
+
+Usage (from backend/):
+    python -m benchmarks.bench_content_extraction [--articles 10] [--delay 1.0]
+
+The stand-in origin answers every request after --delay seconds with a small
+article page. Two hostnames (127.0.0.1 and localhost) act as two domains so
+the per-domain cap is exercised. Every variant starts cold: its own
+in-memory content store and a fresh page cache, so no variant reads pages
+an earlier one fetched, and nothing is written to data/.
+"""
+
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+import services.domain_health as domain_health
+import services.page_cache as page_cache
+from agents.content_agent import ContentAgent
+from services.content_store import ContentStore
+
+
+PAGE = """<html><head><title>Story {n}</title>
+<meta property="og:image" content="http://127.0.0.1/img/{n}.jpg"></head>
+<body><article><h1>Story {n}</h1>
+{paragraphs}
+</article></body></html>"""
+
+
+def make_handler(delay: float):
+    class SlowOrigin(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            n = self.path.rsplit('-', 1)[-1]
+            paragraphs = "\n".join(
+                f"<p>Paragraph {i} of story {n}. The council announced new measures "
+                f"on Tuesday after weeks of debate over the budget.</p>"
+                for i in range(12)
+            )
+            body = PAGE.format(n=n, paragraphs=paragraphs).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return SlowOrigin
+
+
+def articles_for(port: int, count: int):
+    hosts = ['127.0.0.1', 'localhost']
+    return [
+        {'title': f'Story {i}', 'url': f'http://{hosts[i % 2]}:{port}/story-{i}'}
+        for i in range(count)
+    ]
+
+
+def cold_agent(max_workers: int, per_domain: int) -> ContentAgent:
+    """ContentAgent with empty, private content store and page cache"""
+    page_cache._cache = page_cache.PageCache()
+    return ContentAgent(
+        show_loading=False,
+        max_workers=max_workers,
+        per_domain=per_domain,
+        content_store=ContentStore(":memory:")
+    )
+
+
+def run(label: str, agent: ContentAgent, port: int, count: int):
+    articles = articles_for(port, count)
+    start = time.perf_counter()
+    result = agent.execute(articles, max_to_extract=count)
+    elapsed = time.perf_counter() - start
+
+    data = result['data'] or []
+    ok = sum(1 for a in data if a.get('has_full_content'))
+    in_order = [a['title'] for a in data] == [a['title'] for a in articles]
+    print(f"{label:<28} {elapsed:>8.2f}s   extracted {ok}/{count}   order kept: {in_order}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--articles', type=int, default=10, help="Articles to extract (default 10)")
+    parser.add_argument('--delay', type=float, default=1.0, help="Origin response delay in seconds (default 1.0)")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(args.delay))
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    print(f"\nSlow origin on port {port}, {args.delay:.1f}s per response\n")
+
+    # Fetch outcomes stay in memory, not in data/domain_health.json
+    domain_health._scoreboard = domain_health.DomainScoreboard(path=None)
+
+    run("sequential (1 worker)", cold_agent(max_workers=1, per_domain=1), port, args.articles)
+    run("concurrent (8 workers, 2/dom)", cold_agent(max_workers=8, per_domain=2), port, args.articles)
+    run("concurrent (8 workers, 4/dom)", cold_agent(max_workers=8, per_domain=4), port, args.articles)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
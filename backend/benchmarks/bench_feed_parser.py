@@ -0,0 +1,155 @@
+"""
+Feed Parser Benchmark
+Compares feedparser with the streaming parser on saved feed files
+
+Usage (from backend/):
+    python -m benchmarks.bench_feed_parser [feed.xml ...] [--items 8] [--runs 20]
+
+Without feed files a synthetic 2000-item RSS feed is used.
+
+"Py heap" is the tracemalloc peak, which only sees Python allocations
+(libxml2 allocates natively). "Peak RSS" is the growth of the process's
+maximum resident set while parsing once, measured in a fresh subprocess
+per parser (on Linux the peak is reset after imports), so native memory
+is included.
+"""
+
+import argparse
+import json
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from services.feed_parser import parse_feed_stream, parse_feed_fallback
+
+
+PARSERS = {
+    'feedparser': parse_feed_fallback,
+    'streaming': parse_feed_stream,
+}
+
+
+def synthetic_feed(num_items: int = 2000) -> bytes:
+    """Build an RSS feed shaped like the BBC/Al Jazeera feeds"""
+    items = []
+    for i in range(num_items):
+        items.append(f"""
+    <item>
+      <title><![CDATA[Headline number {i} about world events]]></title>
+      <description><![CDATA[<p>Summary paragraph {i} with <b>markup</b> and some more words to parse.</p>]]></description>
+      <link>https://example.com/news/article-{i}</link>
+      <guid isPermaLink="false">article-{i}</guid>
+      <pubDate>Mon, 06 Oct 2025 {i % 24:02d}:{i % 60:02d}:00 GMT</pubDate>
+      <media:thumbnail width="240" height="135" url="https://example.com/img/{i}.jpg"/>
+    </item>""")
+
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">
+  <channel>
+    <title>Synthetic feed</title>
+    <link>https://example.com</link>
+    {''.join(items)}
+  </channel>
+</rss>""".encode('utf-8')
+
+
+def measure(func: Callable[[], list], runs: int) -> Tuple[float, float, int]:
+    """Return (avg ms, peak KiB, items) for a parse function"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        items = func()
+    avg_ms = (time.perf_counter() - start) / runs * 1000
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return avg_ms, peak / 1024, len(items)
+
+
+def _max_rss_kib() -> float:
+    """Peak resident set of this process (KiB)"""
+    status = Path('/proc/self/status')
+    if status.exists():
+        return float(re.search(r'VmHWM:\s+(\d+)', status.read_text()).group(1))
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 if sys.platform == 'darwin' else rss  # Bytes on macOS, KiB on Linux
+
+
+def _reset_peak_rss():
+    """Lower the peak to the current RSS (Linux), so import-time peaks do not hide the parse"""
+    try:
+        Path('/proc/self/clear_refs').write_text('5')
+    except OSError:
+        pass
+
+
+def peak_rss_child(label: str, path: str, max_items: int):
+    """Subprocess entry: peak RSS growth of parsing a feed file once"""
+    content = Path(path).read_bytes()
+    _reset_peak_rss()
+    baseline = _max_rss_kib()
+    PARSERS[label](content, max_items)
+    print(json.dumps({'rss_kib': _max_rss_kib() - baseline}))
+
+
+def peak_rss(label: str, path: str, max_items: int) -> float:
+    """Peak RSS growth (KiB) of one parse, in a fresh interpreter"""
+    output = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.bench_feed_parser',
+         '--rss-child', label, path, '--items', str(max_items)],
+        cwd=str(Path(__file__).parent.parent),
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])['rss_kib']
+
+
+def run(feeds: List[Tuple[str, bytes]], max_items: int, runs: int):
+    print(f"\n{'Feed':<32} {'Parser':<12} {'Items':>6} {'Avg ms':>10} {'Py heap KiB':>12} {'Peak RSS KiB':>13}")
+    print("-" * 90)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n, (name, content) in enumerate(feeds):
+            path = str(Path(tmp) / f"feed{n}.xml")
+            Path(path).write_bytes(content)
+
+            for label, parse in PARSERS.items():
+                avg_ms, peak_kib, count = measure(lambda: parse(content, max_items), runs)
+                rss_kib = peak_rss(label, path, max_items)
+                print(
+                    f"{name[:32]:<32} {label:<12} {count:>6} {avg_ms:>10.2f} "
+                    f"{peak_kib:>12.0f} {rss_kib:>13.0f}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('files', nargs='*', help="Saved RSS/Atom feed files")
+    parser.add_argument('--items', type=int, default=8, help="Items to read per feed (default 8)")
+    parser.add_argument('--runs', type=int, default=20, help="Timed runs per parser (default 20)")
+    parser.add_argument('--rss-child', choices=list(PARSERS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.rss_child:
+        peak_rss_child(args.rss_child, args.files[0], args.items)
+        return
+
+    if args.files:
+        feeds = [(Path(f).name, Path(f).read_bytes()) for f in args.files]
+    else:
+        feeds = [('synthetic (2000 items)', synthetic_feed())]
+
+    run(feeds, args.items, args.runs)
+
+
+if __name__ == "__main__":
+    main()
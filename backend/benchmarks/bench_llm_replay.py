@@ -0,0 +1,138 @@
+"""
+LLM Replay Benchmark
+Replays recorded LLM calls through the gateway with their recorded timing,
+to measure quota, concurrency and retry behaviour without the live model
+
+Usage (from backend/):
+    LLM_REPLAY_MODE=record python server.py      # or main.py; collect calls
+    python -m benchmarks.bench_llm_replay [--path data/llm_recordings.jsonl]
+        [--concurrency 8] [--latency-scale 1.0] [--rpm 60] [--synthetic N]
+
+Every recorded call is sent once, in recording order, from --concurrency
+threads. --latency-scale 0 replays instantly (pure gateway overhead).
+
+Without a recording at --path (or with --synthetic N) the benchmark first
+records N simulated searches against the FakeBackend into a temporary file
+(query parse, ranking, summaries and one streamed summary each), so it
+runs in CI without the live model.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from services.llm_gateway import FakeBackend, LLMGateway
+from services.llm_replay import RecordReplayBackend
+from services.prompts import query_parse_prompt, ranking_prompt, summary_prompt
+from services.rate_limiter import TokenBucketLimiter
+
+
+def record_synthetic(path: Path, searches: int):
+    """Record the LLM calls of simulated searches made against the FakeBackend"""
+    backend = RecordReplayBackend(
+        FakeBackend(base_latency=0.2, seconds_per_1k_tokens=0.1),
+        path=str(path),
+        mode='record',
+    )
+    gateway = LLMGateway(
+        backend,
+        limiter=TokenBucketLimiter(requests_per_minute=1_000_000, tokens_per_minute=1_000_000_000),
+        max_concurrency=16,
+    )
+
+    body = "The council approved the new transit budget after a long debate. " * 40
+
+    def search(n: int):
+        query = f"transit budget news {n}"
+        articles = [
+            {'title': f"Council story {n}-{i}", 'description': f"<p>Budget vote {i} in city {n}.</p>"}
+            for i in range(20)
+        ]
+        gateway.generate_json(query_parse_prompt(query), 'query_parse', expected_output_tokens=150)
+        gateway.generate_json(ranking_prompt(query, articles, 5), 'ranking', items=len(articles))
+        for i in range(4):
+            gateway.generate(summary_prompt(articles[i]['title'], body[:400 + 300 * i]), 'summary')
+        ''.join(gateway.stream(summary_prompt(articles[4]['title'], body), 'summary_stream'))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(search, range(searches)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', default="data/llm_recordings.jsonl", help="Recording file")
+    parser.add_argument('--concurrency', type=int, default=8, help="Concurrent callers and gateway slots (default 8)")
+    parser.add_argument('--latency-scale', type=float, default=1.0, help="Multiplier of recorded latency (default 1.0)")
+    parser.add_argument('--rpm', type=float, default=60, help="LLM requests per minute quota (default 60)")
+    parser.add_argument('--synthetic', type=int, default=None, metavar='N',
+                        help="Record N simulated searches with the FakeBackend and replay those "
+                             "(default 10 when --path does not exist)")
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    if args.synthetic is not None or not path.exists():
+        searches = args.synthetic or 10
+        path = Path(tempfile.mkdtemp(prefix="llm_replay_")) / "synthetic.jsonl"
+        print(f"Recording {searches} simulated searches with the FakeBackend to {path}")
+        record_synthetic(path, searches)
+
+    with open(path, encoding='utf-8') as f:
+        entries = [json.loads(line) for line in f if line.strip()]
+    entries = list({entry['key']: entry for entry in entries}.values())
+    if not entries:
+        print(f"{path} has no recordings")
+        return
+
+    # The app talks to one model; replay that model's calls
+    model = entries[-1]['model']
+    entries = [entry for entry in entries if entry['model'] == model]
+
+    # A miss is a bug in the recording, so replay never falls back
+    backend = RecordReplayBackend(FakeBackend(), path=str(path), mode='replay', latency_scale=args.latency_scale)
+    gateway = LLMGateway(
+        backend,
+        model=model,
+        limiter=TokenBucketLimiter(requests_per_minute=args.rpm, tokens_per_minute=10_000_000),
+        max_concurrency=args.concurrency,
+        max_retries=0,
+    )
+
+    latencies = []
+
+    def replay(entry):
+        start = time.perf_counter()
+        if entry['params'].get('stream'):
+            ''.join(gateway.stream(entry['prompt']))
+        else:
+            gateway.generate(entry['prompt'], json_mode=entry['params'].get('json_mode', False))
+        latencies.append((time.perf_counter() - start, entry['latency']))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(replay, entries))
+    total = time.perf_counter() - start
+
+    observed = sorted(latency for latency, _ in latencies)
+    p95 = observed[min(len(observed) - 1, int(len(observed) * 0.95))]
+    recorded = sum(latency for _, latency in latencies)
+
+    print(f"\n{len(entries)} recorded {model} calls, concurrency {args.concurrency}, "
+          f"quota {args.rpm:.0f} RPM, latency x{args.latency_scale}")
+    print(f"\n{'Total s':>8} {'p50 s':>8} {'p95 s':>8} {'Max s':>8} {'Recorded s':>11} {'Calls/s':>8}")
+    print("-" * 56)
+    print(
+        f"{total:>8.2f} {statistics.median(observed):>8.3f} {p95:>8.3f} {observed[-1]:>8.3f} "
+        f"{recorded:>11.2f} {len(entries) / total:>8.2f}"
+    )
+    print(f"\nReplay: {backend.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Prompt Budget Benchmark
+Tokens per prompt type before and after the prompt-building layer (markup
+stripping, boilerplate and repeat removal, per-type token budgets)
+
+Usage (from backend/):
+    python -m benchmarks.bench_prompt_budget [--articles 30] [--summary-budget 600]
+
+The corpus is synthetic but shaped like real input: RSS descriptions with
+HTML and feed footers, Google News descriptions that repeat the title, and
+extracted article texts with page furniture and repeated paragraphs.
+"before" rebuilds the previous prompts (raw fields cut at 100 or 3000
+characters, long texts condensed to 3000 characters).
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from services.prompts import ranking_prompt, summary_prompt, digest_prompt
+from services.rate_limiter import estimate_tokens
+from services.textrank import condense
+
+
+WORDS = (
+    "government council budget minister election market shares investors court ruling "
+    "storm flooding officials police hospital study researchers company launch quarter "
+    "profit players match season climate summit talks agreement inflation rates bank"
+).split()
+
+BOILERPLATE = [
+    "Advertisement",
+    "Sign up for our daily newsletter to get the latest updates in your inbox.",
+    "Read more: Our full coverage of the story.",
+    "Follow us on Twitter and Facebook.",
+    "Photo: Getty Images",
+    "© 2025 Example Media. All rights reserved.",
+]
+
+
+def sentence(rng: random.Random, words: int = 18) -> str:
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def make_article(rng: random.Random, i: int) -> Dict:
+    title = f"{sentence(rng, 9)[:-1]} {i}"
+    paragraphs = [' '.join(sentence(rng) for _ in range(3)) for _ in range(rng.randint(4, 16))]
+
+    # Page furniture between paragraphs and a repeated pull quote
+    body = []
+    for n, paragraph in enumerate(paragraphs):
+        body.append(paragraph)
+        if n % 3 == 1:
+            body.append(rng.choice(BOILERPLATE))
+    body.insert(len(body) // 2, paragraphs[0])
+    body.extend(BOILERPLATE[:3])
+
+    if i % 2:
+        # RSS feed: HTML description with a feed footer
+        description = (
+            f'<p><img src="https://example.com/{i}.jpg" alt="" /></p><p>{sentence(rng, 30)} '
+            f'{sentence(rng, 20)}</p><p>The post {title} appeared first on Example News.</p>'
+        )
+    else:
+        # Google News: the title again, linked, plus the outlet
+        description = f'<a href="https://news.google.com/articles/{i}">{title}</a>&nbsp;&nbsp;<font color="#6f6f6f">Example News</font>'
+
+    return {
+        'title': title,
+        'description': description,
+        'source': f"Outlet {i % 5}",
+        'full_text': '\n\n'.join(body),
+    }
+
+
+def legacy_ranking_prompt(query: str, articles: List[Dict], want: int) -> str:
+    lines = [
+        f"{i}. {art.get('title', '')[:100]} - {art.get('description', '')[:100]}"
+        for i, art in enumerate(articles, 1)
+    ]
+    return f"""
+User query: "{query}"
+
+Rank these articles by relevance (most to least relevant).
+Return ONLY a JSON array of article numbers in order: [5, 2, 8, 1, ...]
+Include the top {want} most relevant articles.
+
+Articles:
+{chr(10).join(lines)}
+"""
+
+
+def legacy_summary_prompt(title: str, article_text: str) -> str:
+    article_text = condense(article_text, 3000)
+    return f"""
+Generate a comprehensive 4-5 sentence summary of this news article:
+
+Title: {title}
+
+Article: {article_text[:3000]}
+
+Summary should:
+- Cover all key points
+- Be clear and informative
+- Include important details, names, and numbers
+- Be written in a professional news style
+"""
+
+
+def legacy_digest_prompt(sources) -> str:
+    budget = 6000 // len(sources)
+    reports = "\n\n".join(
+        f"[Report {i} - {source}]\nTitle: {title}\nArticle: {condense(text, budget)}"
+        for i, (source, title, text) in enumerate(sources, 1)
+    )
+    return f"""
+The reports below are different outlets' coverage of the same news story.
+Generate one comprehensive 4-5 sentence summary of the story.
+
+Summary should:
+- Combine the key points from all reports
+- Note where the reports disagree on facts or numbers
+- Include important details, names, and numbers
+- Be written in a professional news style
+
+{reports}
+"""
+
+
+def measure(build, cases) -> Dict:
+    tokens, seconds = [], []
+    for case in cases:
+        start = time.perf_counter()
+        prompt = build(*case)
+        seconds.append(time.perf_counter() - start)
+        tokens.append(estimate_tokens(prompt))
+    return {'tokens': statistics.mean(tokens), 'ms': statistics.mean(seconds) * 1000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--articles', type=int, default=30, help="Ranking candidates per prompt (default 30)")
+    parser.add_argument('--summary-budget', type=int, default=600, help="Summary article token budget (default 600)")
+    parser.add_argument('--digest-budget', type=int, default=1500, help="Digest token budget (default 1500)")
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    articles = [make_article(rng, i) for i in range(max(args.articles, 40))]
+    query = "latest government budget and election news"
+
+    ranking_cases = [(query, articles[offset:offset + args.articles], 10) for offset in range(0, 10)]
+    summary_cases = [(art['title'], art['full_text']) for art in articles]
+    digest_cases = [
+        [(art['source'], art['title'], art['full_text']) for art in articles[start:start + 4]]
+        for start in range(0, 36, 4)
+    ]
+
+    rows = [
+        ('ranking', measure(legacy_ranking_prompt, ranking_cases),
+         measure(ranking_prompt, ranking_cases)),
+        ('summary', measure(legacy_summary_prompt, summary_cases),
+         measure(lambda title, text: summary_prompt(title, text, args.summary_budget), summary_cases)),
+        ('digest', measure(lambda *sources: legacy_digest_prompt(sources), digest_cases),
+         measure(lambda *sources: digest_prompt(list(sources), args.digest_budget), digest_cases)),
+    ]
+
+    print(f"\nAverage estimated tokens per prompt ({args.articles} ranking candidates, "
+          f"summary budget {args.summary_budget}, digest budget {args.digest_budget})")
+    print(f"\n{'Prompt':<10} {'Before':>8} {'After':>8} {'Saved':>8} {'Build ms before':>16} {'after':>8}")
+    print("-" * 64)
+    for name, before, after in rows:
+        saved = 1 - after['tokens'] / before['tokens']
+        print(
+            f"{name:<10} {before['tokens']:>8.0f} {after['tokens']:>8.0f} {saved:>7.1%} "
+            f"{before['ms']:>16.2f} {after['ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
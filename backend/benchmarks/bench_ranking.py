@@ -0,0 +1,94 @@
+"""
+Ranking Benchmark
+Times the local rankers (BM25, semantic) on synthetic candidate pools
+
+Usage (from backend/):
+    python -m benchmarks.bench_ranking [--sizes 100 1000 5000] [--runs 20]
+
+Semantic timings are split into the first call (embeds every article) and
+warm calls (embeddings cached, one matrix-vector product).
+"""
+
+import argparse
+import random
+import sys
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from services.bm25 import rank_articles
+from services.embeddings import EmbeddingCache, rank_semantic, semantic_scores
+
+
+TOPICS = [
+    "election results parliament vote coalition government minister",
+    "stock markets shares investors inflation interest rates bank",
+    "football league match goal striker transfer coach",
+    "climate change emissions heatwave floods renewable energy",
+    "artificial intelligence chips startup technology regulation",
+    "earthquake rescue aid casualties relief disaster",
+]
+
+
+def synthetic_articles(count: int, seed: int = 7) -> List[Dict]:
+    """Headlines drawn from a few topics, spread over the last three days"""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    articles = []
+
+    for i in range(count):
+        words = rng.choice(TOPICS).split()
+        published = now - timedelta(minutes=rng.randint(0, 72 * 60))
+        articles.append({
+            'title': ' '.join(rng.sample(words, 4)).capitalize() + f" report {i}",
+            'description': ' '.join(rng.choices(words, k=15)),
+            'url': f"https://example.com/news/{i}",
+            'source': rng.choice(['BBC News', 'Reuters', 'Al Jazeera']),
+            'published': format_datetime(published),
+        })
+
+    return articles
+
+
+def timed(func: Callable[[], object], runs: int) -> float:
+    """Average milliseconds per call"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def run(sizes: List[int], runs: int):
+    query = "interest rates and inflation hit stock markets"
+
+    print(f"\n{'Candidates':>10} {'BM25 ms':>10} {'Sem. cold ms':>13} {'Sem. warm ms':>13} {'Matvec ms':>10}")
+    print("-" * 62)
+
+    for size in sizes:
+        articles = synthetic_articles(size)
+
+        bm25_ms = timed(lambda: rank_articles(articles, query, 20), runs)
+
+        cache = EmbeddingCache(capacity=max(size, 1024))
+        cold_ms = timed(lambda: rank_semantic(articles, query, 20, cache, recency_weight=0.2), 1)
+        warm_ms = timed(lambda: rank_semantic(articles, query, 20, cache, recency_weight=0.2), runs)
+        matvec_ms = timed(lambda: semantic_scores(articles, query, cache), runs)
+
+        print(f"{size:>10} {bm25_ms:>10.2f} {cold_ms:>13.2f} {warm_ms:>13.2f} {matvec_ms:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000], help="Candidate pool sizes")
+    parser.add_argument('--runs', type=int, default=20, help="Timed runs per ranker (default 20)")
+    args = parser.parse_args()
+
+    run(args.sizes, args.runs)
+
+
+if __name__ == "__main__":
+    main()
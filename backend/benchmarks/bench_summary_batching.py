@@ -0,0 +1,166 @@
+"""
+Summary Batching Benchmark
+A/B of SummaryAgent with and without cross-request micro-batching, against
+a fake LLM under a requests-per-minute quota
+
+Usage (from backend/):
+    python -m benchmarks.bench_summary_batching [--requests 8] [--articles 5] [--rpm 60]
+
+The gateway's FakeBackend answers after a fixed latency plus a per-token
+cost and understands both the single-article and the batch prompt.
+
+The second table sends the requests as real HTTP calls to the API's
+/api/news/search endpoint (in-process, over ASGI) whose orchestrator only
+summarizes: one at a time, as the endpoint handled them while it blocked
+the event loop, and concurrently. Batches larger than --articles can only
+come from several requests.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / 'agents'))
+
+import httpx
+
+import server
+from agents.summary_agent import SummaryAgent
+from services.llm_gateway import FakeBackend, LLMGateway
+from services.rate_limiter import TokenBucketLimiter
+from services.summary_cache import SummaryCache
+
+
+def articles_for(request: int, count: int) -> List[Dict]:
+    body = "The council approved the new transit budget after a long debate. " * 30
+    return [
+        {'title': f"Request {request} story {i}", 'description': '', 'full_text': body}
+        for i in range(count)
+    ]
+
+
+def make_agent(batching: bool, requests: int, rpm: float, llm: FakeBackend) -> SummaryAgent:
+    agent = SummaryAgent("benchmark", show_loading=False, batching=batching)
+    agent.summary_cache = SummaryCache(":memory:")
+    agent.llm = LLMGateway(
+        llm,
+        limiter=TokenBucketLimiter(requests_per_minute=rpm, tokens_per_minute=10_000_000),
+        max_concurrency=requests,
+    )
+    return agent
+
+
+def run_variant(batching: bool, requests: int, articles: int, rpm: float, llm: FakeBackend) -> Dict:
+    agent = make_agent(batching, requests, rpm, llm)
+    latencies = []
+
+    def one_request(request: int):
+        start = time.perf_counter()
+        agent.process(articles_for(request, articles), max_to_summarize=articles)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=requests) as executor:
+        list(executor.map(one_request, range(requests)))
+    total = time.perf_counter() - start
+
+    return {
+        'total': total,
+        'p50': statistics.median(latencies),
+        'max': max(latencies),
+        'calls': llm.calls,
+        'throughput': requests * articles / total,
+    }
+
+
+class SummaryOnlyOrchestrator:
+    """Stands in for the orchestrator behind the API: summarizes a fixed article set per query"""
+
+    def __init__(self, agent: SummaryAgent, articles: int):
+        self.agent = agent
+        self.articles = articles
+
+    def fetch_news(self, query: str, max_results: int = 5, **kwargs) -> Dict:
+        request = int(query.rsplit(' ', 1)[-1])
+        data = self.agent.process(articles_for(request, self.articles), max_to_summarize=self.articles)
+        return {'success': True, 'message': 'ok', 'data': data, 'metrics': {}}
+
+
+def run_api_variant(concurrent: bool, requests: int, articles: int, rpm: float, llm: FakeBackend) -> Dict:
+    agent = make_agent(True, requests, rpm, llm)
+    server.orchestrator = SummaryOnlyOrchestrator(agent, articles)
+    latencies = []
+
+    async def one_request(client: httpx.AsyncClient, request: int):
+        start = time.perf_counter()
+        response = await client.post(
+            "/api/news/search",
+            json={'query': f"benchmark request {request}", 'max_results': articles}
+        )
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+
+    async def run_all():
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            if concurrent:
+                await asyncio.gather(*(one_request(client, request) for request in range(requests)))
+            else:
+                for request in range(requests):
+                    await one_request(client, request)
+
+    start = time.perf_counter()
+    asyncio.run(run_all())
+    total = time.perf_counter() - start
+
+    return {
+        'total': total,
+        'p50': statistics.median(latencies),
+        'max': max(latencies),
+        'calls': llm.calls,
+        'avg_batch': agent.batcher.get_stats()['avg_batch_size'],
+        'throughput': requests * articles / total,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=8, help="Concurrent requests (default 8)")
+    parser.add_argument('--articles', type=int, default=5, help="Articles summarized per request (default 5)")
+    parser.add_argument('--rpm', type=float, default=60, help="LLM requests per minute quota (default 60)")
+    parser.add_argument('--latency', type=float, default=0.5, help="Fake LLM base latency in seconds (default 0.5)")
+    args = parser.parse_args()
+
+    print(f"\n{args.requests} concurrent requests x {args.articles} articles, quota {args.rpm:.0f} RPM")
+    print(f"\n{'Variant':<12} {'Total s':>8} {'p50 s':>8} {'Max s':>8} {'LLM calls':>10} {'Articles/s':>11}")
+    print("-" * 62)
+
+    for label, batching in [('unbatched', False), ('batched', True)]:
+        llm = FakeBackend(args.latency, seconds_per_1k_tokens=0.05)
+        result = run_variant(batching, args.requests, args.articles, args.rpm, llm)
+        print(
+            f"{label:<12} {result['total']:>8.2f} {result['p50']:>8.2f} {result['max']:>8.2f} "
+            f"{result['calls']:>10} {result['throughput']:>11.2f}"
+        )
+
+    print(f"\nPOST /api/news/search (batching on)")
+    print(f"\n{'Requests':<12} {'Total s':>8} {'p50 s':>8} {'Max s':>8} {'LLM calls':>10} {'Avg batch':>10} {'Articles/s':>11}")
+    print("-" * 73)
+
+    for label, concurrent in [('one by one', False), ('concurrent', True)]:
+        llm = FakeBackend(args.latency, seconds_per_1k_tokens=0.05)
+        result = run_api_variant(concurrent, args.requests, args.articles, args.rpm, llm)
+        print(
+            f"{label:<12} {result['total']:>8.2f} {result['p50']:>8.2f} {result['max']:>8.2f} "
+            f"{result['calls']:>10} {result['avg_batch']:>10} {result['throughput']:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,85 @@ class Config:
     GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
     GOOGLE_AI_STUDIO_KEY = GOOGLE_API_KEY  # alias for compatibility
 
+    # Feed polling bounds (seconds)
+    FEED_MIN_POLL_SECONDS = float(os.getenv("FEED_MIN_POLL_SECONDS", 120))
+    FEED_MAX_POLL_SECONDS = float(os.getenv("FEED_MAX_POLL_SECONDS", 3600))
+
+    # Local article store (keyword search over ingested feeds)
+    ARTICLE_DB_PATH = os.getenv("ARTICLE_DB_PATH", "data/articles.db")
+    ARTICLE_MAX_AGE_HOURS = float(os.getenv("ARTICLE_MAX_AGE_HOURS", 48))
+
+    # Extracted article content store
+    CONTENT_DB_PATH = os.getenv("CONTENT_DB_PATH", "data/content.db")
+    CONTENT_STORE_MAX_MB = float(os.getenv("CONTENT_STORE_MAX_MB", 256))
+    CONTENT_TTL_HOURS = float(os.getenv("CONTENT_TTL_HOURS", 24))
+
+    # Downloaded page bodies shared across fetch stages
+    PAGE_CACHE_TTL_SECONDS = float(os.getenv("PAGE_CACHE_TTL_SECONDS", 300))
+    PAGE_CACHE_MAX_MB = float(os.getenv("PAGE_CACHE_MAX_MB", 64))
+    PAGE_CACHE_ERROR_TTL_SECONDS = float(os.getenv("PAGE_CACHE_ERROR_TTL_SECONDS", 10))
+
+    # Per-domain fetch health (negative cache), persisted across restarts
+    DOMAIN_HEALTH_PATH = os.getenv("DOMAIN_HEALTH_PATH", "data/domain_health.json")
+
+    # Ranking: "hybrid" (BM25 + LLM re-rank of the top K), "bm25" or
+    # "semantic" (local embeddings blended with recency)
+    RANKING_MODE = os.getenv("RANKING_MODE", "hybrid")
+    RANKING_RERANK_TOP_K = int(os.getenv("RANKING_RERANK_TOP_K", 20))
+    RANKING_LLM_TIMEOUT = float(os.getenv("RANKING_LLM_TIMEOUT", 15))
+    RANKING_LLM_WAIT = float(os.getenv("RANKING_LLM_WAIT", 2))  # Quota/slot wait before BM25 order
+    RANKING_GROUP_SIZE = int(os.getenv("RANKING_GROUP_SIZE", 25))
+    RANKING_MAX_LLM_CANDIDATES = int(os.getenv("RANKING_MAX_LLM_CANDIDATES", 100))
+    RANKING_CACHE_TTL_SECONDS = float(os.getenv("RANKING_CACHE_TTL_SECONDS", 900))
+    RANKING_RECENCY_WEIGHT = float(os.getenv("RANKING_RECENCY_WEIGHT", 0.2))
+    RANKING_RECENCY_HALF_LIFE_HOURS = float(os.getenv("RANKING_RECENCY_HALF_LIFE_HOURS", 24))
+
+    # LLM gateway shared by every agent ("fake" = deterministic local backend)
+    LLM_BACKEND = os.getenv("LLM_BACKEND", "gemini")
+    LLM_MODEL = os.getenv("LLM_MODEL", "gemini-2.5-flash")
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", 8))
+    LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", 30))
+    LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", 2))
+    LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", 0.5))
+    LLM_BACKOFF_MAX = float(os.getenv("LLM_BACKOFF_MAX", 8))
+    LLM_QUOTA_TIMEOUT = float(os.getenv("LLM_QUOTA_TIMEOUT", 30))  # Wait for quota + a slot
+    LLM_FAKE_LATENCY_MS = float(os.getenv("LLM_FAKE_LATENCY_MS", 0))
+
+    # Prompt token budgets per prompt type (estimated at ~4 characters per token)
+    PROMPT_BUDGET_QUERY = int(os.getenv("PROMPT_BUDGET_QUERY", 64))
+    PROMPT_BUDGET_RANKING_TITLE = int(os.getenv("PROMPT_BUDGET_RANKING_TITLE", 25))
+    PROMPT_BUDGET_RANKING_DESCRIPTION = int(os.getenv("PROMPT_BUDGET_RANKING_DESCRIPTION", 25))
+    PROMPT_BUDGET_SUMMARY = int(os.getenv("PROMPT_BUDGET_SUMMARY", 600))  # Article text, per article
+    PROMPT_BUDGET_DIGEST = int(os.getenv("PROMPT_BUDGET_DIGEST", 1500))  # All reports of a story
+
+    # LLM prices for cost telemetry (USD per million tokens)
+    LLM_INPUT_PRICE_PER_1M = float(os.getenv("LLM_INPUT_PRICE_PER_1M", 0.30))
+    LLM_OUTPUT_PRICE_PER_1M = float(os.getenv("LLM_OUTPUT_PRICE_PER_1M", 2.50))
+
+    # LLM record/replay: "record", "replay" or "passthrough" (no recording)
+    LLM_REPLAY_MODE = os.getenv("LLM_REPLAY_MODE", "passthrough")
+    LLM_REPLAY_PATH = os.getenv("LLM_REPLAY_PATH", "data/llm_recordings.jsonl")
+    LLM_REPLAY_ON_MISS = os.getenv("LLM_REPLAY_ON_MISS", "fail")  # or "fallback" to the live backend
+    LLM_REPLAY_LATENCY_SCALE = float(os.getenv("LLM_REPLAY_LATENCY_SCALE", 1.0))
+    LLM_REPLAY_LATENCY_MS = float(os.getenv("LLM_REPLAY_LATENCY_MS", 0))
+
+    # Gemini quota shared by every LLM call, and summary concurrency
+    GEMINI_REQUESTS_PER_MINUTE = float(os.getenv("GEMINI_REQUESTS_PER_MINUTE", 60))
+    GEMINI_TOKENS_PER_MINUTE = float(os.getenv("GEMINI_TOKENS_PER_MINUTE", 250000))
+    SUMMARY_CONCURRENCY = int(os.getenv("SUMMARY_CONCURRENCY", 4))
+
+    # Micro-batching of summary calls across requests
+    SUMMARY_BATCHING = os.getenv("SUMMARY_BATCHING", "true").lower() == "true"
+    SUMMARY_BATCH_WINDOW_MS = float(os.getenv("SUMMARY_BATCH_WINDOW_MS", 50))
+    SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", 8))
+
+    # Persistent cache of AI summaries
+    SUMMARY_CACHE_PATH = os.getenv("SUMMARY_CACHE_PATH", "data/summaries.db")
+    SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", 20000))
+
+    # Digest mode: one summary per story shared by every outlet covering it
+    SUMMARY_DIGEST_THRESHOLD = float(os.getenv("SUMMARY_DIGEST_THRESHOLD", 0.25))
+
     @staticmethod
     def validate():
         if not Config.GOOGLE_API_KEY:
@@ -123,6 +123,11 @@ What would you like to know about?
                 output += f"\n💡 {summary}\n"
             
             output += f"🔗 {article['url']}\n"
+
+            if article.get('also_covered_by'):
+                sources = ', '.join(alt['source'] for alt in article['also_covered_by'])
+                output += f"📰 Also covered by: {sources}\n"
+
             output += "─" * 70 + "\n"
         
         # Show metrics
@@ -5,8 +5,10 @@ Place this file at: api/server.py
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, PlainTextResponse
 from pydantic import BaseModel
 from typing import List, Dict, Optional
+import json
 import sys
 from pathlib import Path
 
@@ -48,6 +50,7 @@ class NewsQueryRequest(BaseModel):
     max_results: Optional[int] = 5
     enrich: Optional[bool] = True
     parallel: Optional[bool] = True
+    summary_mode: Optional[str] = "ai"  # "fast": extractive, no LLM; "digest": one summary per story
 
 
 # ============================================
@@ -62,9 +65,16 @@ async def startup():
         api_key=Config.GOOGLE_AI_STUDIO_KEY,
         show_loading=False  # No terminal animations for API
     )
+    orchestrator.start_background_ingestion()
     print("✅ API Server Ready!\n")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    if orchestrator:
+        orchestrator.stop_background_ingestion()
+
+
 # ============================================
 # ENDPOINTS
 # ============================================
@@ -93,10 +103,14 @@ async def health():
 
 
 @app.post("/api/news/search")
-async def search_news(request: NewsQueryRequest):
+def search_news(request: NewsQueryRequest):
     """
     Main search endpoint
     
+    A plain def: FastAPI runs it in its threadpool, so concurrent searches
+    overlap (and their summary calls can share batches) instead of
+    blocking the event loop one at a time.
+    
     Frontend sends:
     {
         "query": "AI news in India",
@@ -120,7 +134,8 @@ async def search_news(request: NewsQueryRequest):
             query=request.query,
             max_results=request.max_results,
             enrich=request.enrich,
-            parallel=request.parallel
+            parallel=request.parallel,
+            summary_mode=request.summary_mode
         )
         
         if not response['success']:
@@ -138,7 +153,7 @@ async def search_news(request: NewsQueryRequest):
 
 
 @app.get("/api/news/preview")
-async def get_preview(url: str):
+def get_preview(url: str):
     """
     Get article preview with image + text
     
@@ -158,23 +173,25 @@ async def get_preview(url: str):
         raise HTTPException(400, "URL required")
     
     try:
-        from newspaper import Article
         from urllib.parse import urlparse
+        from services.article_extractor import extract_article
         
-        article = Article(url)
-        article.download()
-        article.parse()
+        article = extract_article(url)
+        
+        if not article['full_text'] and not article['title']:
+            raise ValueError("Could not extract article")
         
         # First 500 chars as preview
-        preview = article.text[:500] + "..." if len(article.text) > 500 else article.text
+        text = article['full_text']
+        preview = text[:500] + "..." if len(text) > 500 else text
         
         return {
             "url": url,
-            "title": article.title,
-            "image": article.top_image,
+            "title": article['title'],
+            "image": article['top_image'],
             "preview_text": preview,
-            "author": ", ".join(article.authors) if article.authors else None,
-            "published": str(article.publish_date) if article.publish_date else None,
+            "author": ", ".join(article['authors']) if article['authors'] else None,
+            "published": article['publish_date'] or None,
             "source_domain": urlparse(url).netloc
         }
     
@@ -188,6 +205,40 @@ async def get_preview(url: str):
         }
 
 
+@app.get("/api/news/summary/stream")
+def stream_summary(url: str, title: Optional[str] = None):
+    """
+    Stream an article's AI summary as Server-Sent Events
+    
+    Frontend: new EventSource('/api/news/summary/stream?url=https://...')
+    
+    Events:
+        token: {"type": "token", "text": "partial text"}
+        done:  {"type": "done", "summary": "...", "has_ai_summary": true, "cached": false, "complete": true}
+               (complete is false, with an "error", when the model stream broke
+               off - summary then holds only the text received)
+        error: {"error": "..."}
+    """
+    if not orchestrator:
+        raise HTTPException(503, "Service not initialized")
+    
+    if not url:
+        raise HTTPException(400, "URL required")
+    
+    def events():
+        try:
+            for event in orchestrator.stream_summary(url, title or ''):
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/api/stats")
 async def get_stats():
     """System statistics"""
@@ -200,6 +251,18 @@ async def get_stats():
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus scrape endpoint (request counters, LLM tokens, cost and latency)"""
+    if not orchestrator:
+        raise HTTPException(503, "Service not initialized")
+    
+    return PlainTextResponse(
+        orchestrator.get_prometheus_metrics(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 # ============================================
 # RUN SERVER
 # ============================================
@@ -0,0 +1,109 @@
+"""
+Article Extractor
+Full-text extraction shared by ContentAgent, EnhancedNewsFetcher and the
+preview endpoint, backed by the content store
+"""
+
+import logging
+import time
+from typing import Dict, Any, Optional
+
+from newspaper import Article, Config as NewspaperConfig
+
+from services.content_store import ContentStore, get_content_store
+from services.domain_health import DomainBlockedError, get_domain_scoreboard
+from services.page_cache import get_page_cache, page_text
+
+
+logger = logging.getLogger("MultiAgent.ArticleExtractor")
+
+
+def empty_content() -> Dict[str, Any]:
+    """Result used when extraction fails"""
+    return {
+        'full_text': '',
+        'authors': [],
+        'publish_date': '',
+        'top_image': '',
+        'title': '',
+    }
+
+
+def download_and_parse(url: str, timeout: float = 10, hedge: bool = False) -> Dict[str, Any]:
+    """
+    Parse an article with newspaper (no content store)
+
+    The page comes from the shared page cache, so a page already downloaded
+    for URL resolution or image extraction is not fetched again. Hedged
+    calls start their own download instead of waiting on one in progress.
+    Domains whose pages keep yielding no text (paywalls, script-rendered
+    sites) are skipped for a while.
+
+    Raises:
+        Exception: When download or parsing fails
+    """
+    scoreboard = get_domain_scoreboard()
+    if scoreboard.should_skip(url, kind='extract'):
+        raise DomainBlockedError(f"Skipping domain without extractable text: {url[:60]}")
+
+    start = time.time()
+
+    page = get_page_cache().fetch(url, timeout=timeout, share_inflight=not hedge)
+    if page['status'] != 200:
+        raise ValueError(f"HTTP {page['status']}")
+
+    config = NewspaperConfig()
+    config.request_timeout = timeout
+    config.fetch_images = False  # Top image from meta tags, no image probing
+
+    article = Article(url, config=config)
+    article.download(input_html=page_text(page))
+    article.parse()
+
+    scoreboard.record(
+        page['url'], bool(article.text), time.time() - start,
+        None if article.text else 'no extractable text', kind='extract'
+    )
+
+    return {
+        'full_text': article.text,
+        'authors': article.authors,
+        'publish_date': str(article.publish_date) if article.publish_date else '',
+        'top_image': article.top_image,
+        'title': article.title,
+    }
+
+
+def extract_article(
+    url: str,
+    timeout: float = 10,
+    store: Optional[ContentStore] = None
+) -> Dict[str, Any]:
+    """
+    Get article content from the content store, extracting it on a miss
+
+    Args:
+        url: Article URL
+        timeout: Download timeout in seconds
+        store: Content store (defaults to the process-wide store)
+
+    Returns:
+        Dict with full_text, authors, publish_date, top_image, title
+        (empty values if extraction failed)
+    """
+    store = store or get_content_store()
+
+    cached = store.get(url)
+    if cached is not None:
+        return cached
+
+    try:
+        content = download_and_parse(url, timeout)
+    except Exception as e:
+        logger.debug(f"Content extraction failed for {url[:50]}: {e}")
+        return empty_content()
+
+    if content['full_text']:
+        store.put(url, content)
+
+    return content
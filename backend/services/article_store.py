@@ -0,0 +1,257 @@
+"""
+Article Store
+Local SQLite store of every ingested article with a full-text index
+(FTS5) for keyword + recency search
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from services.feed_scheduler import entry_timestamp
+
+
+TAG_RE = re.compile(r'<[^>]+>')
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+STORED_FIELDS = (
+    'url', 'title', 'description', 'source', 'published',
+    'image', 'fetch_method', 'agent',
+)
+
+
+class ArticleStore:
+    """
+    Article store shared by all source agents
+
+    Articles are upserted by URL. Title and description are indexed with
+    FTS5 (falls back to LIKE matching if the SQLite build lacks FTS5).
+    """
+
+    def __init__(self, db_path: str = "data/articles.db", retention_hours: float = 72):
+        """
+        Initialize store
+
+        Args:
+            db_path: SQLite file (":memory:" for a throwaway store)
+            retention_hours: Articles no feed has listed for this long are pruned
+        """
+        self.db_path = db_path
+        self.retention = retention_hours * 3600
+        self.logger = logging.getLogger("MultiAgent.ArticleStore")
+        self.lock = threading.Lock()
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        self.has_fts = self._create_schema()
+
+        self.stats = {
+            'articles_written': 0,
+            'searches': 0,
+        }
+
+        self.logger.info(f"Article store ready ({db_path}, fts5={self.has_fts})")
+
+    def _create_schema(self) -> bool:
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    id INTEGER PRIMARY KEY,
+                    url TEXT UNIQUE NOT NULL,
+                    title TEXT,
+                    description TEXT,
+                    source TEXT,
+                    published TEXT,
+                    published_ts REAL,
+                    image TEXT,
+                    fetch_method TEXT,
+                    agent TEXT,
+                    ingested_at REAL NOT NULL,
+                    last_seen REAL
+                )
+            """)
+
+            # Stores created before last_seen existed
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(articles)")}
+            if 'last_seen' not in columns:
+                self.conn.execute("ALTER TABLE articles ADD COLUMN last_seen REAL")
+                self.conn.execute("UPDATE articles SET last_seen = ingested_at")
+
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_articles_recency "
+                "ON articles (COALESCE(published_ts, ingested_at))"
+            )
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_articles_last_seen ON articles (last_seen)"
+            )
+
+        try:
+            with self.conn:
+                self.conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts "
+                    "USING fts5(title, description, tokenize='unicode61')"
+                )
+            return True
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"FTS5 unavailable, using LIKE search: {e}")
+            return False
+
+    @staticmethod
+    def _plain(text: str) -> str:
+        return TAG_RE.sub(' ', text or '')
+
+    @staticmethod
+    def _tokens(keywords: List[str]) -> List[str]:
+        tokens = []
+        for keyword in keywords or []:
+            for token in TOKEN_RE.findall(str(keyword).lower()):
+                if len(token) > 1 and token not in tokens:
+                    tokens.append(token)
+        return tokens
+
+    def add_articles(self, articles: List[Dict]) -> int:
+        """
+        Upsert articles into the store
+
+        Returns:
+            Number of articles written
+        """
+        now = time.time()
+        written = 0
+
+        with self.lock, self.conn:
+            for article in articles:
+                url = article.get('url')
+                if not url:
+                    continue
+
+                row = {field: article.get(field) or '' for field in STORED_FIELDS}
+                row['published_ts'] = entry_timestamp({'published': row['published']})
+                row['ingested_at'] = now
+                row['last_seen'] = now
+
+                self.conn.execute("""
+                    INSERT INTO articles
+                        (url, title, description, source, published, published_ts,
+                         image, fetch_method, agent, ingested_at, last_seen)
+                    VALUES
+                        (:url, :title, :description, :source, :published, :published_ts,
+                         :image, :fetch_method, :agent, :ingested_at, :last_seen)
+                    ON CONFLICT(url) DO UPDATE SET
+                        title = excluded.title,
+                        description = excluded.description,
+                        published = excluded.published,
+                        published_ts = excluded.published_ts,
+                        image = COALESCE(NULLIF(excluded.image, ''), articles.image),
+                        last_seen = excluded.last_seen
+                """, row)
+
+                if self.has_fts:
+                    rowid = self.conn.execute(
+                        "SELECT id FROM articles WHERE url = ?", (url,)
+                    ).fetchone()[0]
+                    self.conn.execute("DELETE FROM articles_fts WHERE rowid = ?", (rowid,))
+                    self.conn.execute(
+                        "INSERT INTO articles_fts (rowid, title, description) VALUES (?, ?, ?)",
+                        (rowid, row['title'], self._plain(row['description']))
+                    )
+
+                written += 1
+
+            self.stats['articles_written'] += written
+
+        return written
+
+    def search(
+        self,
+        keywords: List[str],
+        max_results: int = 20,
+        max_age_hours: Optional[float] = 48,
+    ) -> List[Dict]:
+        """
+        Keyword search over ingested articles
+
+        Args:
+            keywords: Query keywords (any match, best matches first)
+            max_results: Maximum articles to return
+            max_age_hours: Only articles published/ingested within this window
+
+        Returns:
+            List of article dicts, best match first
+        """
+        tokens = self._tokens(keywords)
+        if not tokens:
+            return []
+
+        cutoff = time.time() - max_age_hours * 3600 if max_age_hours else 0
+        columns = ', '.join(f"a.{field}" for field in STORED_FIELDS)
+
+        with self.lock:
+            self.stats['searches'] += 1
+
+            if self.has_fts:
+                match = ' OR '.join(f'"{token}"' for token in tokens)
+                rows = self.conn.execute(f"""
+                    SELECT {columns}
+                    FROM articles_fts f JOIN articles a ON a.id = f.rowid
+                    WHERE articles_fts MATCH ?
+                      AND COALESCE(a.published_ts, a.ingested_at) >= ?
+                    ORDER BY bm25(articles_fts, 2.0, 1.0),
+                             COALESCE(a.published_ts, a.ingested_at) DESC
+                    LIMIT ?
+                """, (match, cutoff, max_results)).fetchall()
+            else:
+                clauses = ' OR '.join(
+                    "(LOWER(a.title) LIKE ? OR LOWER(a.description) LIKE ?)" for _ in tokens
+                )
+                params: List[Any] = []
+                for token in tokens:
+                    params.extend([f"%{token}%", f"%{token}%"])
+                rows = self.conn.execute(f"""
+                    SELECT {columns}
+                    FROM articles a
+                    WHERE ({clauses})
+                      AND COALESCE(a.published_ts, a.ingested_at) >= ?
+                    ORDER BY COALESCE(a.published_ts, a.ingested_at) DESC
+                    LIMIT ?
+                """, (*params, cutoff, max_results)).fetchall()
+
+        return [dict(zip(STORED_FIELDS, row)) for row in rows]
+
+    def prune(self) -> int:
+        """Delete articles no feed has listed within the retention window"""
+        cutoff = time.time() - self.retention
+
+        with self.lock, self.conn:
+            if self.has_fts:
+                self.conn.execute(
+                    "DELETE FROM articles_fts WHERE rowid IN "
+                    "(SELECT id FROM articles WHERE last_seen < ?)", (cutoff,)
+                )
+            removed = self.conn.execute(
+                "DELETE FROM articles WHERE last_seen < ?", (cutoff,)
+            ).rowcount
+
+        if removed:
+            self.logger.info(f"Pruned {removed} old articles")
+
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        with self.lock:
+            count = self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            return {
+                'articles': count,
+                'fts5': self.has_fts,
+                **self.stats,
+            }
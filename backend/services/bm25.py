@@ -0,0 +1,110 @@
+"""
+BM25
+Local lexical ranker over article titles and descriptions
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has',
+    'have', 'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'to',
+    'was', 'were', 'will', 'with', 'about', 'after', 'over', 'new', 'news',
+    'latest', 'top', 'today', 'show', 'me', 'get', 'find', 'what', 'whats',
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens without stopwords, plurals folded to singular"""
+    tokens = []
+    for token in TOKEN_PATTERN.findall((text or '').lower()):
+        if token in STOPWORDS or len(token) < 2:
+            continue
+        if len(token) > 4 and token.endswith('ies'):
+            token = token[:-3] + 'y'
+        elif len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+def article_tokens(article: Dict, title_weight: int = 2) -> List[str]:
+    """Tokens of an article, title counted title_weight times"""
+    title = tokenize(article.get('title', ''))
+    return title * title_weight + tokenize(article.get('description', ''))
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a fixed set of documents
+
+    Postings, document lengths and IDF are computed once when the index is
+    built; scoring a query touches only the postings of its terms.
+    """
+
+    def __init__(self, documents: List[List[str]], k1: float = 1.5, b: float = 0.75):
+        """
+        Build index
+
+        Args:
+            documents: Token lists (see tokenize/article_tokens)
+            k1: Term frequency saturation
+            b: Length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.size = len(documents)
+        self.doc_lengths = [len(doc) for doc in documents]
+        self.avg_length = (sum(self.doc_lengths) / self.size) if self.size else 0.0
+
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        for index, doc in enumerate(documents):
+            for term, freq in Counter(doc).items():
+                self.postings.setdefault(term, []).append((index, freq))
+
+        self.idf = {
+            term: math.log(1 + (self.size - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+
+    def score(self, query_tokens: List[str]) -> List[float]:
+        """BM25 score of every document for a query"""
+        scores = [0.0] * self.size
+        if not self.size or not self.avg_length:
+            return scores
+
+        for term in set(query_tokens):
+            idf = self.idf.get(term)
+            if idf is None:
+                continue
+            for index, freq in self.postings[term]:
+                norm = 1 - self.b + self.b * self.doc_lengths[index] / self.avg_length
+                scores[index] += idf * freq * (self.k1 + 1) / (freq + self.k1 * norm)
+
+        return scores
+
+
+def rank_articles(articles: List[Dict], query: str, top_n: int) -> List[Dict]:
+    """
+    Rank articles by BM25 relevance to a query
+
+    Ties (including articles matching no query term) keep their input
+    order. Returned articles are copies with bm25_score set.
+    """
+    index = BM25Index([article_tokens(article) for article in articles])
+    scores = index.score(tokenize(query))
+
+    order = sorted(range(len(articles)), key=lambda i: (-scores[i], i))
+
+    ranked = []
+    for i in order[:top_n]:
+        article = articles[i].copy()
+        article['bm25_score'] = round(scores[i], 4)
+        ranked.append(article)
+
+    return ranked
@@ -0,0 +1,232 @@
+"""
+Content Store
+Disk-backed, compressed store of extracted article content keyed by
+canonical URL, with TTL and size-bounded LRU eviction
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from utils.urls import canonicalize_url
+from config import Config
+
+
+class ContentStore:
+    """
+    Extracted article content (text, authors, publish date, top image)
+
+    Text is zlib-compressed. Entries older than the TTL are treated as
+    missing; when the compressed size passes max_bytes the least recently
+    read entries are evicted.
+    """
+
+    def __init__(
+        self,
+        db_path: str = "data/content.db",
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_hours: float = 24,
+    ):
+        """
+        Initialize store
+
+        Args:
+            db_path: SQLite file (":memory:" for a throwaway store)
+            max_bytes: Upper bound of stored compressed content
+            ttl_hours: How long an extraction stays valid
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.ttl = ttl_hours * 3600
+        self.logger = logging.getLogger("MultiAgent.ContentStore")
+        self.lock = threading.Lock()
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS content (
+                    url_key TEXT PRIMARY KEY,
+                    url TEXT,
+                    title TEXT,
+                    text BLOB,
+                    authors TEXT,
+                    publish_date TEXT,
+                    top_image TEXT,
+                    extracted_at REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_content_access ON content (last_access)"
+            )
+
+        self.total_bytes = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM content"
+        ).fetchone()[0]
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'evictions': 0,
+        }
+
+    @staticmethod
+    def handle_for(url: str) -> str:
+        """Lightweight handle under which a URL's content is stored"""
+        return canonicalize_url(url)
+
+    def get_text(self, handle: str) -> str:
+        """Full text for a content handle ('' if missing/expired)"""
+        content = self.get(handle)
+        return content['full_text'] if content else ''
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get stored content for a URL
+
+        Returns:
+            Dict with full_text, authors, publish_date, top_image, title,
+            extracted_at - or None if missing/expired
+        """
+        key = canonicalize_url(url)
+        if not key:
+            return None
+
+        now = time.time()
+
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT title, text, authors, publish_date, top_image, extracted_at "
+                "FROM content WHERE url_key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[5] > self.ttl:
+                self.stats['misses'] += 1
+                return None
+
+            self.conn.execute(
+                "UPDATE content SET last_access = ? WHERE url_key = ?", (now, key)
+            )
+            self.conn.commit()
+            self.stats['hits'] += 1
+
+        title, text, authors, publish_date, top_image, extracted_at = row
+
+        return {
+            'full_text': zlib.decompress(text).decode('utf-8') if text else '',
+            'authors': json.loads(authors or '[]'),
+            'publish_date': publish_date or '',
+            'top_image': top_image or '',
+            'title': title or '',
+            'extracted_at': extracted_at,
+        }
+
+    def put(self, url: str, content: Dict[str, Any]):
+        """Store extracted content for a URL"""
+        key = canonicalize_url(url)
+        if not key:
+            return
+
+        text = zlib.compress((content.get('full_text') or '').encode('utf-8'), 6)
+        authors = json.dumps(list(content.get('authors') or []))
+        size = len(text) + len(authors) + len(key)
+        now = time.time()
+
+        with self.lock:
+            old = self.conn.execute(
+                "SELECT size FROM content WHERE url_key = ?", (key,)
+            ).fetchone()
+
+            with self.conn:
+                self.conn.execute("""
+                    INSERT OR REPLACE INTO content
+                        (url_key, url, title, text, authors, publish_date, top_image,
+                         extracted_at, last_access, size)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    key, url, content.get('title') or '', text, authors,
+                    content.get('publish_date') or '', content.get('top_image') or '',
+                    now, now, size,
+                ))
+
+            self.total_bytes += size - (old[0] if old else 0)
+            self.stats['writes'] += 1
+
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop expired entries, then least recently read ones down to 90% of the cap"""
+        target = int(self.max_bytes * 0.9)
+        cutoff = time.time() - self.ttl
+
+        with self.conn:
+            removed = self.conn.execute(
+                "DELETE FROM content WHERE extracted_at < ?", (cutoff,)
+            ).rowcount
+            self.total_bytes = self.conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM content"
+            ).fetchone()[0]
+
+            if self.total_bytes > target:
+                rows = self.conn.execute(
+                    "SELECT url_key, size FROM content ORDER BY last_access"
+                )
+                victims = []
+                excess = self.total_bytes - target
+                for url_key, size in rows:
+                    if excess <= 0:
+                        break
+                    victims.append((url_key,))
+                    excess -= size
+
+                self.conn.executemany("DELETE FROM content WHERE url_key = ?", victims)
+                removed += len(victims)
+                self.total_bytes = self.conn.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM content"
+                ).fetchone()[0]
+
+        self.stats['evictions'] += removed
+        self.logger.debug(f"Evicted {removed} content entries")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics"""
+        with self.lock:
+            count = self.conn.execute("SELECT COUNT(*) FROM content").fetchone()[0]
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                'entries': count,
+                'size': f"{self.total_bytes / 1024 / 1024:.2f}MB",
+                'hit_rate': f"{(self.stats['hits'] / lookups * 100) if lookups else 0:.2f}%",
+                **self.stats,
+            }
+
+
+_store: Optional[ContentStore] = None
+_store_lock = threading.Lock()
+
+
+def get_content_store() -> ContentStore:
+    """Process-wide content store shared by every extraction path"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ContentStore(
+                Config.CONTENT_DB_PATH,
+                max_bytes=int(Config.CONTENT_STORE_MAX_MB * 1024 * 1024),
+                ttl_hours=Config.CONTENT_TTL_HOURS,
+            )
+        return _store
@@ -0,0 +1,224 @@
+"""
+Story Deduplication
+Collapses the same story fetched twice or from several outlets (canonical
+URLs + MinHash LSH over title word pairs) into one representative article
+"""
+
+import hashlib
+import logging
+from typing import Dict, List, Any, Tuple
+
+import numpy as np
+
+from services.bm25 import tokenize
+from utils.urls import canonicalize_url
+
+
+class StoryDeduplicator:
+    """
+    Groups near-duplicate articles and keeps one per group
+
+    Articles with the same canonical URL are the same article. Otherwise
+    titles (plus the start of the description) are compared by MinHash over
+    word n-grams, so word order counts ("India beats Australia" is not
+    "Australia beats India"): signatures are split into bands, articles
+    sharing a band are candidate pairs, and pairs whose estimated Jaccard
+    similarity reaches the threshold are merged. Articles with too few
+    tokens to tell stories apart are only merged by URL.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 32,
+        threshold: float = 0.6,
+        description_tokens: int = 12,
+        shingle: int = 2,
+        min_tokens: int = 4,
+        seed: int = 1,
+    ):
+        """
+        Initialize deduplicator
+
+        Args:
+            num_perm: MinHash signature length
+            bands: LSH bands (num_perm must be divisible by bands)
+            threshold: Estimated Jaccard similarity that merges two articles
+            description_tokens: Leading description tokens added to the title
+            shingle: Words per shingle (n-grams don't cross title/description)
+            min_tokens: Tokens an article needs to be compared by MinHash
+            seed: Seed of the hash permutations (results are deterministic)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.description_tokens = description_tokens
+        self.shingle = shingle
+        self.min_tokens = min_tokens
+
+        rng = np.random.default_rng(seed)
+        self.xors = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+        self.mults = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+
+        self.logger = logging.getLogger("MultiAgent.Dedup")
+        self.stats = {
+            'articles_in': 0,
+            'articles_out': 0,
+            'same_url': 0,
+            'near_duplicates': 0,
+        }
+
+    def _shingles(self, article: Dict) -> List[str]:
+        title = tokenize(article.get('title', ''))
+        description = tokenize(article.get('description', ''))[:self.description_tokens]
+        if len(title) + len(description) < self.min_tokens:
+            return []
+
+        shingles = set()
+        for tokens in (title, description):
+            size = min(self.shingle, len(tokens))
+            shingles.update(' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1))
+        return sorted(shingles)
+
+    def _signature(self, shingles: List[str]) -> np.ndarray:
+        hashes = np.array([
+            int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+            for shingle in shingles
+        ], dtype=np.uint64)
+
+        # (shingles, num_perm) permuted hashes; uint64 products wrap around
+        permuted = (hashes[:, None] ^ self.xors[None, :]) * self.mults[None, :]
+        return permuted.min(axis=0)
+
+    @staticmethod
+    def _preference(article: Dict) -> tuple:
+        """Representative order: resolved URL, image, longer description"""
+        return (
+            'news.google.com' not in (article.get('url') or ''),
+            bool(article.get('image')),
+            len(article.get('description') or ''),
+        )
+
+    def clusters(self, articles: List[Dict]) -> List[List[int]]:
+        """
+        Group articles by story without collapsing them
+
+        Returns:
+            Article indices per story, in order of each story's first
+            appearance
+        """
+        groups, _, _, _ = self._group(articles)
+        return groups
+
+    def _group(self, articles: List[Dict]) -> Tuple[List[List[int]], List[str], int, int]:
+        """Story groups, canonical URLs and the same-URL / near-duplicate merge counts"""
+        count = len(articles)
+        parent = list(range(count))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i: int, j: int) -> bool:
+            root_i, root_j = find(i), find(j)
+            if root_i == root_j:
+                return False
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+            return True
+
+        # Same article under different URLs (tracking params, www, http)
+        keys = [canonicalize_url(article.get('url', '')) for article in articles]
+        first_by_url: Dict[str, int] = {}
+        same_url = 0
+        for i, key in enumerate(keys):
+            if not key:
+                continue
+            if key in first_by_url:
+                same_url += union(first_by_url[key], i)
+            else:
+                first_by_url[key] = i
+
+        # Near-duplicate titles via MinHash LSH
+        signatures = {}
+        for i, article in enumerate(articles):
+            shingles = self._shingles(article)
+            if shingles:
+                signatures[i] = self._signature(shingles)
+
+        near = 0
+        for band in range(self.bands):
+            buckets: Dict[bytes, List[int]] = {}
+            for i, signature in signatures.items():
+                chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+                buckets.setdefault(chunk, []).append(i)
+
+            for members in buckets.values():
+                for j in members[1:]:
+                    i = members[0]
+                    if find(i) == find(j):
+                        continue
+                    similarity = float(np.mean(signatures[i] == signatures[j]))
+                    if similarity >= self.threshold:
+                        near += union(i, j)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(count):
+            groups.setdefault(find(i), []).append(i)
+
+        return [groups[root] for root in sorted(groups)], keys, same_url, near
+
+    def collapse(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Keep one article per story
+
+        Returns:
+            Representatives (copies) in order of each story's first
+            appearance; other outlets are listed under also_covered_by
+        """
+        count = len(articles)
+        groups, keys, same_url, near = self._group(articles)
+
+        collapsed = []
+        for members in groups:
+            best = max(members, key=lambda i: (self._preference(articles[i]), -i))
+
+            representative = articles[best].copy()
+            seen_urls = {keys[best]}
+            alternatives = []
+            for i in members:
+                if keys[i] in seen_urls:
+                    continue
+                seen_urls.add(keys[i])
+                alternatives.append({
+                    'title': articles[i].get('title', ''),
+                    'source': articles[i].get('source', ''),
+                    'url': articles[i].get('url', ''),
+                })
+
+            if alternatives:
+                representative['also_covered_by'] = alternatives
+            collapsed.append(representative)
+
+        self.stats['articles_in'] += count
+        self.stats['articles_out'] += len(collapsed)
+        self.stats['same_url'] += same_url
+        self.stats['near_duplicates'] += near
+
+        if len(collapsed) < count:
+            self.logger.info(f"Collapsed {count} articles into {len(collapsed)} stories")
+
+        return collapsed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get deduplication statistics"""
+        removed = self.stats['articles_in'] - self.stats['articles_out']
+        return {
+            'removed_rate': f"{(removed / self.stats['articles_in'] * 100) if self.stats['articles_in'] else 0:.2f}%",
+            **self.stats,
+        }
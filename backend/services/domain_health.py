@@ -0,0 +1,285 @@
+"""
+Domain Health
+Per-domain scoreboard of fetch outcomes (success rate, latency percentiles,
+last error) with a negative cache for domains that keep failing
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from config import Config
+
+
+class DomainBlockedError(requests.RequestException):
+    """Raised instead of fetching from a domain in the negative cache"""
+
+
+def domain_of(url: str) -> str:
+    """Host of a URL without "www." """
+    host = (urlparse(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class DomainScoreboard:
+    """
+    Outcome history per (domain, kind) - kind is 'fetch' (HTTP download)
+    or 'extract' (text extraction from a downloaded page)
+
+    A domain whose recent failure rate passes the threshold is blocked for a
+    cooldown. After the cooldown one probe is let through with a short
+    timeout; the cooldown doubles each time that probe fails, and a probe
+    that succeeds lifts the block. Failures of requests already in flight
+    when the block started don't extend it. Degraded domains get shorter
+    timeouts derived from their p95 latency.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = "data/domain_health.json",
+        window: int = 30,
+        min_samples: int = 4,
+        failure_threshold: float = 0.75,
+        cooldown_seconds: float = 600,
+        max_cooldown_seconds: float = 6 * 3600,
+        fast_timeout: float = 2.0,
+    ):
+        """
+        Initialize scoreboard
+
+        Args:
+            path: JSON file the scoreboard is persisted to (None = memory only)
+            window: Outcomes kept per domain and kind
+            min_samples: Outcomes needed before a domain can be blocked
+            failure_threshold: Failure rate that blocks a domain
+            cooldown_seconds: First block duration
+            max_cooldown_seconds: Upper bound of the block duration
+            fast_timeout: Timeout for probes and degraded domains (seconds)
+        """
+        self.path = Path(path) if path else None
+        self.window = window
+        self.min_samples = min_samples
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown_seconds
+        self.max_cooldown = max_cooldown_seconds
+        self.fast_timeout = fast_timeout
+
+        self.domains: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()  # One writer of the .tmp file at a time
+        self.dirty = 0
+        self.logger = logging.getLogger("MultiAgent.DomainHealth")
+
+        self.stats = {
+            'skipped_fetches': 0,
+            'shortened_timeouts': 0,
+        }
+
+        self.load()
+
+    def _entry(self, domain: str, kind: str) -> Dict[str, Any]:
+        key = f"{kind}:{domain}"
+        if key not in self.domains:
+            self.domains[key] = {
+                'outcomes': deque(maxlen=self.window),  # (ok, latency)
+                'successes': 0,
+                'failures': 0,
+                'last_error': None,
+                'last_error_at': None,
+                'blocked_until': 0.0,
+                'block_count': 0,
+                'probing': False,  # A probe was let through after the cooldown
+            }
+        return self.domains[key]
+
+    @staticmethod
+    def _failure_rate(entry: Dict[str, Any]) -> float:
+        outcomes = entry['outcomes']
+        if not outcomes:
+            return 0.0
+        return sum(1 for ok, _ in outcomes if not ok) / len(outcomes)
+
+    @staticmethod
+    def _percentile(entry: Dict[str, Any], pct: float) -> Optional[float]:
+        latencies = sorted(latency for ok, latency in entry['outcomes'] if ok)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(len(latencies) * pct))]
+
+    def record(self, url: str, success: bool, latency: float = 0.0,
+               error: Optional[str] = None, kind: str = 'fetch'):
+        """Record the outcome of a fetch/extraction"""
+        domain = domain_of(url)
+        if not domain:
+            return
+
+        now = time.time()
+
+        with self.lock:
+            entry = self._entry(domain, kind)
+            entry['outcomes'].append((success, round(latency, 3)))
+
+            if success:
+                entry['successes'] += 1
+                if entry['block_count']:
+                    # Probe succeeded - forget the failures that caused the block
+                    entry['block_count'] = 0
+                    entry['blocked_until'] = 0.0
+                    entry['probing'] = False
+                    entry['outcomes'].clear()
+                    entry['outcomes'].append((success, round(latency, 3)))
+            else:
+                entry['failures'] += 1
+                entry['last_error'] = (error or 'failed')[:200]
+                entry['last_error_at'] = now
+
+                if entry['block_count']:
+                    # Blocked already - only a failed probe extends the block,
+                    # not the stragglers that were in flight when it started
+                    block = entry['probing'] or now >= entry['blocked_until']
+                else:
+                    block = len(entry['outcomes']) >= self.min_samples and \
+                        self._failure_rate(entry) >= self.failure_threshold
+
+                if block:
+                    cooldown = min(self.max_cooldown, self.cooldown * (2 ** entry['block_count']))
+                    entry['blocked_until'] = now + cooldown
+                    entry['block_count'] += 1
+                    entry['probing'] = False
+                    self.logger.info(f"{kind} {domain} failing, skipped for {cooldown:.0f}s")
+
+            self.dirty += 1
+            save = self.dirty >= 20
+
+        if save:
+            self.save()
+
+    def should_skip(self, url: str, kind: str = 'fetch') -> bool:
+        """True while the URL's domain is in the negative cache"""
+        domain = domain_of(url)
+        with self.lock:
+            entry = self.domains.get(f"{kind}:{domain}")
+            if not entry:
+                return False
+
+            now = time.time()
+            if now < entry['blocked_until']:
+                self.stats['skipped_fetches'] += 1
+                return True
+
+            if entry['block_count'] > 0 and entry['blocked_until']:
+                # Cooldown over - let this request probe, hold the rest back
+                # until it has had time to finish
+                entry['blocked_until'] = now + self.fast_timeout * 2
+                entry['probing'] = True
+            return False
+
+    def timeout_for(self, url: str, default: float, kind: str = 'fetch') -> float:
+        """Timeout to use for a URL - shortened for probing/degraded domains"""
+        domain = domain_of(url)
+        with self.lock:
+            entry = self.domains.get(f"{kind}:{domain}")
+            if not entry or len(entry['outcomes']) < self.min_samples:
+                return default
+
+            timeout = default
+            if entry['block_count'] > 0:
+                timeout = self.fast_timeout  # Probe after a block
+            elif self._failure_rate(entry) >= 0.3:
+                p95 = self._percentile(entry, 0.95)
+                timeout = max(self.fast_timeout, p95 * 1.5) if p95 else self.fast_timeout
+
+            if timeout < default:
+                self.stats['shortened_timeouts'] += 1
+                return timeout
+            return default
+
+    def get_stats(self, limit: int = 50) -> Dict[str, Any]:
+        """Scoreboard of the least healthy domains"""
+        now = time.time()
+        with self.lock:
+            rows = []
+            for key, entry in self.domains.items():
+                total = entry['successes'] + entry['failures']
+                p50 = self._percentile(entry, 0.5)
+                p95 = self._percentile(entry, 0.95)
+                rows.append((self._failure_rate(entry), key, {
+                    'success_rate': f"{(entry['successes'] / total * 100) if total else 0:.2f}%",
+                    'recent_failure_rate': f"{self._failure_rate(entry) * 100:.2f}%",
+                    'requests': total,
+                    'p50': f"{p50:.2f}s" if p50 is not None else None,
+                    'p95': f"{p95:.2f}s" if p95 is not None else None,
+                    'last_error': entry['last_error'],
+                    'blocked_for': f"{max(0.0, entry['blocked_until'] - now):.0f}s",
+                }))
+
+            rows.sort(key=lambda row: (-row[0], row[1]))
+            return {
+                'domains_tracked': len(self.domains),
+                **self.stats,
+                'domains': {key: info for _, key, info in rows[:limit]},
+            }
+
+    def save(self):
+        """Persist the scoreboard to disk"""
+        if not self.path:
+            return
+
+        with self.save_lock:
+            with self.lock:
+                data = {
+                    key: {**entry, 'outcomes': list(entry['outcomes'])}
+                    for key, entry in self.domains.items()
+                }
+                self.dirty = 0
+
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix('.tmp')
+                tmp.write_text(json.dumps(data))
+                tmp.replace(self.path)
+            except OSError as e:
+                self.logger.warning(f"Could not save domain health: {e}")
+
+    def load(self):
+        """Load a persisted scoreboard"""
+        if not self.path or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not load domain health: {e}")
+            return
+
+        with self.lock:
+            for key, saved in data.items():
+                kind, _, domain = key.partition(':')
+                entry = self._entry(domain, kind)
+                entry['outcomes'].extend(tuple(o) for o in saved.get('outcomes', []))
+                for field in ('successes', 'failures', 'last_error', 'last_error_at',
+                              'blocked_until', 'block_count'):
+                    if field in saved:
+                        entry[field] = saved[field]
+
+        self.logger.info(f"Loaded health of {len(data)} domains")
+
+
+_scoreboard: Optional[DomainScoreboard] = None
+_scoreboard_lock = threading.Lock()
+
+
+def get_domain_scoreboard() -> DomainScoreboard:
+    """Process-wide scoreboard shared by every fetch path"""
+    global _scoreboard
+    with _scoreboard_lock:
+        if _scoreboard is None:
+            _scoreboard = DomainScoreboard(Config.DOMAIN_HEALTH_PATH)
+        return _scoreboard
@@ -0,0 +1,248 @@
+"""
+Embeddings
+CPU-only hashed text embeddings, a per-article embedding cache backed by one
+float32 matrix, and vectorized semantic scoring
+"""
+
+import hashlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from services.bm25 import tokenize
+from services.feed_scheduler import entry_timestamp
+from utils.urls import canonicalize_url
+
+
+class HashingEmbedder:
+    """
+    Deterministic text embeddings via signed feature hashing
+
+    Features are word unigrams, word bigrams and character trigrams of each
+    word (so "tech" and "technology" overlap). Each feature is hashed to a
+    column and a sign - a sparse random projection - and the result is
+    L2-normalized, so a dot product is the cosine similarity.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+
+    def _features(self, text: str) -> Dict[str, float]:
+        tokens = tokenize(text)
+        counts: Dict[str, float] = {}
+
+        def add(feature: str, weight: float):
+            counts[feature] = counts.get(feature, 0.0) + weight
+
+        for token in tokens:
+            add(f"w:{token}", 1.0)
+            padded = f"<{token}>"
+            for i in range(len(padded) - 2):
+                add(f"c:{padded[i:i + 3]}", 0.25)
+        for first, second in zip(tokens, tokens[1:]):
+            add(f"b:{first}_{second}", 0.5)
+
+        return counts
+
+    def _bucket(self, feature: str):
+        digest = hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest()
+        value = int.from_bytes(digest, 'little')
+        return value % self.dim, (1.0 if value >> 63 else -1.0)
+
+    def embed(self, text: str) -> np.ndarray:
+        """Unit-length float32 vector for a text (zeros for empty text)"""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, count in self._features(text).items():
+            column, sign = self._bucket(feature)
+            vector[column] += sign * math.log1p(count)  # Sublinear term frequency
+
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+
+# Memoized so warm scoring does not re-parse URLs and dates of known articles
+_canonical_url = lru_cache(maxsize=65536)(canonicalize_url)
+
+
+@lru_cache(maxsize=65536)
+def _published_timestamp(published: str) -> Optional[float]:
+    return entry_timestamp({'published': published})
+
+
+def article_text(article: Dict) -> str:
+    """Text an article is embedded from (title counted twice)"""
+    title = article.get('title', '')
+    return f"{title} {title} {article.get('description', '')}"
+
+
+class EmbeddingCache:
+    """
+    Article embeddings stored as rows of one contiguous float32 matrix
+
+    Articles are keyed by canonical URL (title if there is none), so each
+    is embedded once; least recently used rows are reused when full.
+    """
+
+    def __init__(self, embedder: Optional[HashingEmbedder] = None, capacity: int = 10000):
+        self.embedder = embedder or HashingEmbedder()
+        self.capacity = capacity
+        self.matrix = np.zeros((min(1024, capacity), self.embedder.dim), dtype=np.float32)
+        self.rows: "OrderedDict[str, int]" = OrderedDict()
+        self.free = list(range(len(self.matrix) - 1, -1, -1))
+        self.lock = threading.Lock()
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+        }
+
+    @staticmethod
+    def key_for(article: Dict) -> str:
+        url = _canonical_url(article.get('url', ''))
+        return url or f"title:{article.get('title', '')}"
+
+    def matrix_for(self, articles: List[Dict]) -> np.ndarray:
+        """Contiguous (len(articles), dim) matrix of article embeddings"""
+        keys = [self.key_for(article) for article in articles]
+        missing = {}
+
+        with self.lock:
+            for key, article in zip(keys, articles):
+                if key in self.rows:
+                    self.rows.move_to_end(key)
+                    self.stats['hits'] += 1
+                elif key not in missing:
+                    missing[key] = article
+
+        # Embed outside the lock
+        vectors = {key: self.embedder.embed(article_text(article)) for key, article in missing.items()}
+
+        out = np.empty((len(keys), self.embedder.dim), dtype=np.float32)
+        lost = []
+
+        with self.lock:
+            # Gather cached rows before storing new ones - storing may evict
+            # rows this call still needs (more articles than capacity)
+            cached = []
+            for i, key in enumerate(keys):
+                if key in vectors:
+                    continue
+                row = self.rows.get(key)
+                if row is None:
+                    lost.append(i)  # Evicted by another call meanwhile
+                else:
+                    cached.append((i, row))
+            if cached:
+                positions, rows = zip(*cached)
+                out[list(positions)] = self.matrix[list(rows)]
+
+            # Keep at most capacity of the new vectors
+            for key in list(vectors)[-self.capacity:]:
+                if key in self.rows:
+                    continue
+                if not self.free:
+                    self._grow_or_evict()
+                row = self.free.pop()
+                self.matrix[row] = vectors[key]
+                self.rows[key] = row
+            self.stats['misses'] += len(vectors)
+
+        for i, key in enumerate(keys):
+            if key in vectors:
+                out[i] = vectors[key]
+        for i in lost:
+            out[i] = self.embedder.embed(article_text(articles[i]))
+
+        return out
+
+    def _grow_or_evict(self):
+        used = len(self.matrix)
+        if used < self.capacity:
+            grown = np.zeros((min(used * 2, self.capacity), self.embedder.dim), dtype=np.float32)
+            grown[:used] = self.matrix
+            self.matrix = grown
+            self.free.extend(range(len(grown) - 1, used - 1, -1))
+        else:
+            _, row = self.rows.popitem(last=False)
+            self.free.append(row)
+
+    def get_stats(self) -> Dict:
+        with self.lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                'cached_embeddings': len(self.rows),
+                'dim': self.embedder.dim,
+                'hit_rate': f"{(self.stats['hits'] / lookups * 100) if lookups else 0:.2f}%",
+                **self.stats,
+            }
+
+
+def semantic_scores(
+    articles: List[Dict],
+    query: str,
+    cache: EmbeddingCache,
+    recency_weight: float = 0.0,
+    half_life_hours: float = 24,
+    source_weights: Optional[Dict[str, float]] = None,
+    source_weight: float = 0.0,
+) -> np.ndarray:
+    """
+    Score articles against a query with one matrix-vector product
+
+    The cosine similarity is blended with a recency score
+    (0.5 ** (age / half_life), 0 for undated articles) and a per-source
+    weight (source name -> 0..1, unknown sources 0.5).
+
+    Returns:
+        float32 array of scores in article order
+    """
+    if not articles:
+        return np.zeros(0, dtype=np.float32)
+
+    matrix = cache.matrix_for(articles)
+    query_vector = cache.embedder.embed(query)
+
+    scores = matrix @ query_vector
+    scores *= 1.0 - recency_weight - source_weight
+
+    if recency_weight:
+        now = time.time()
+        ages = np.array([
+            (now - ts) / 3600 if (ts := _published_timestamp(article.get('published', ''))) else np.inf
+            for article in articles
+        ], dtype=np.float32)
+        scores += recency_weight * np.exp2(-np.maximum(ages, 0) / half_life_hours)
+
+    if source_weight:
+        weights = source_weights or {}
+        scores += source_weight * np.array(
+            [weights.get(article.get('source', ''), 0.5) for article in articles],
+            dtype=np.float32
+        )
+
+    return scores
+
+
+def rank_semantic(articles: List[Dict], query: str, top_n: int, cache: EmbeddingCache, **blend) -> List[Dict]:
+    """
+    Rank articles by semantic_scores (ties keep input order)
+
+    Returned articles are copies with semantic_score set.
+    """
+    scores = semantic_scores(articles, query, cache, **blend)
+    order = np.argsort(-scores, kind='stable')[:top_n]
+
+    ranked = []
+    for i in order:
+        article = articles[i].copy()
+        article['semantic_score'] = round(float(scores[i]), 4)
+        ranked.append(article)
+
+    return ranked
@@ -1,13 +1,12 @@
 import feedparser
-import requests
 from datetime import datetime
 import time
 from typing import List, Dict, Optional
-import google.generativeai as genai
 from urllib.parse import quote_plus
-import re
-from newspaper import Article
-import json
+from services.article_extractor import extract_article
+from services.llm_gateway import get_llm_gateway
+from services.page_cache import get_page_cache
+from services.prompts import summary_prompt, query_parse_prompt, ranking_prompt
 from bs4 import BeautifulSoup
 import sys
 import threading
@@ -60,8 +59,7 @@ class EnhancedNewsFetcher:
         if self.show_loading:
             print("🔧 Initializing AI model...")
         
-        genai.configure(api_key=google_ai_studio_key)
-        self.model = genai.GenerativeModel("gemini-2.5-flash")
+        self.llm = get_llm_gateway(google_ai_studio_key)
         
         self.rss_sources = {
             'google_news': 'https://news.google.com/rss',
@@ -87,8 +85,8 @@ class EnhancedNewsFetcher:
     def resolve_google_news_url(self, google_url: str) -> str:
         """Resolve Google News redirect URL"""
         try:
-            response = requests.get(google_url, allow_redirects=True, timeout=5)
-            actual_url = response.url
+            page = get_page_cache().fetch(google_url, timeout=5)
+            actual_url = page['url']
             if 'news.google.com' not in actual_url:
                 return actual_url
             return google_url
@@ -96,46 +94,17 @@ class EnhancedNewsFetcher:
             return google_url
     
     def extract_full_article(self, url: str) -> Dict[str, any]:
-        """Extract full article content"""
-        try:
-            article = Article(url)
-            article.download()
-            article.parse()
-            return {
-                'full_text': article.text,
-                'authors': article.authors,
-                'publish_date': str(article.publish_date) if article.publish_date else '',
-                'top_image': article.top_image,
-            }
-        except:
-            return {
-                'full_text': '',
-                'authors': [],
-                'publish_date': '',
-                'top_image': ''
-            }
+        """Extract full article content (served from the content store when possible)"""
+        return extract_article(url)
     
     def generate_comprehensive_summary(self, article_text: str, title: str) -> str:
         """Generate AI summary"""
         if not article_text or len(article_text) < 100:
             return "Summary not available - could not extract article content."
         
-        prompt = f"""
-Generate a comprehensive 4-5 sentence summary of this news article:
-
-Title: {title}
-
-Article: {article_text[:3000]}
-
-Summary should:
-- Cover all key points
-- Be clear and informative
-- Include important details, names, and numbers
-- Be written in a professional news style
-"""
+        prompt = summary_prompt(title, article_text)
         try:
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return self.llm.generate(prompt, 'summary').strip()
         except:
             sentences = article_text.split('. ')[:3]
             return '. '.join(sentences) + '.'
@@ -146,25 +115,9 @@ Summary should:
             spinner = LoadingSpinner("🧠 Understanding your query")
             spinner.start()
         
-        prompt = f"""
-Analyze this news search query and extract structured information:
-
-Query: "{user_query}"
-
-Return ONLY a JSON object with these fields:
-{{
-    "keywords": ["list", "of", "keywords"],
-    "location": "country/state/city or null",
-    "category": "technology/sports/politics/business/health/entertainment or general",
-    "timeframe": "latest/today/recent or null",
-    "search_term": "optimized search term for news search"
-}}
-"""
+        prompt = query_parse_prompt(user_query)
         try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text.strip()
-            result_text = re.sub(r'```json\s*|\s*```', '', result_text)
-            parsed_intent = json.loads(result_text)
+            parsed_intent = self.llm.generate_json(prompt, 'query_parse', expected_output_tokens=150)
             
             if self.show_loading:
                 spinner.stop()
@@ -331,27 +284,9 @@ Return ONLY a JSON object with these fields:
             spinner = LoadingSpinner("⚖️ Ranking articles by relevance")
             spinner.start()
         
-        article_summaries = []
-        for i, art in enumerate(articles[:30]):
-            article_summaries.append(
-                f"{i+1}. {art['title']} - {art['description'][:100]}"
-            )
-        
-        prompt = f"""
-User query: "{user_query}"
-
-Rank these articles by relevance (most to least relevant).
-Return ONLY a JSON array of article numbers: [5, 2, 8, 1, ...]
-Include top 15 most relevant articles.
-
-Articles:
-{chr(10).join(article_summaries)}
-"""
+        prompt = ranking_prompt(user_query, articles[:30], 15)
         try:
-            response = self.model.generate_content(prompt)
-            result_text = response.text.strip()
-            result_text = re.sub(r'```json\s*|\s*```', '', result_text)
-            ranked_indices = json.loads(result_text)
+            ranked_indices = self.llm.generate_json(prompt, 'ranking', items=min(len(articles), 30), expected_output_tokens=60)
             
             ranked_articles = []
             for idx in ranked_indices:
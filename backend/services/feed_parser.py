@@ -0,0 +1,258 @@
+"""
+Feed Parser
+Streaming RSS/Atom parser that pulls only the fields the agents use and stops
+after N items. Falls back to feedparser for feeds it cannot read.
+"""
+
+import io
+import logging
+import time
+from typing import Dict, Any, List, Optional, Union, BinaryIO
+
+import feedparser
+import requests
+from lxml import etree
+
+from services.domain_health import get_domain_scoreboard
+
+
+logger = logging.getLogger("MultiAgent.FeedParser")
+
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+MEDIA_NS = 'http://search.yahoo.com/mrss/'
+
+ITEM_TAGS = {'item', 'entry'}
+
+# Local tag name -> entry field (first match wins)
+TEXT_FIELDS = {
+    'title': 'title',
+    'description': 'summary',
+    'summary': 'summary',
+    'guid': 'id',
+    'id': 'id',
+    'pubDate': 'published',
+    'published': 'published',
+    'date': 'published',  # dc:date
+    'updated': 'updated',
+}
+
+
+class _RecordingReader(io.RawIOBase):
+    """File-like wrapper that keeps a copy of everything read through it"""
+
+    def __init__(self, raw: BinaryIO):
+        self.raw = raw
+        self.buffer = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        chunk = self.raw.read(len(b))
+        if not chunk:
+            return 0
+        n = len(chunk)
+        b[:n] = chunk
+        self.buffer.extend(chunk)
+        return n
+
+    def read_all(self) -> bytes:
+        """Everything read so far plus the unread remainder"""
+        rest = self.raw.read()
+        if rest:
+            self.buffer.extend(rest)
+        return bytes(self.buffer)
+
+
+def _local(tag: Any) -> str:
+    if not isinstance(tag, str):
+        return ''
+    return tag.rsplit('}', 1)[-1]
+
+
+def _ns(tag: str) -> str:
+    return tag[1:].split('}', 1)[0] if tag.startswith('{') else ''
+
+
+def _text(elem) -> str:
+    return (elem.text or '').strip()
+
+
+def _entry_from_element(item) -> Dict[str, Any]:
+    """Pull the fields used by the agents out of an <item>/<entry> element"""
+    entry: Dict[str, Any] = {}
+    media_content: List[Dict[str, str]] = []
+    media_thumbnail: List[Dict[str, str]] = []
+
+    for child in item.iter():
+        if child is item:
+            continue
+        tag = child.tag
+        name = _local(tag)
+        ns = _ns(tag) if isinstance(tag, str) else ''
+
+        if ns == MEDIA_NS:
+            url = child.get('url')
+            if url and name == 'content':
+                media_content.append({'url': url, 'medium': child.get('medium', '')})
+            elif url and name == 'thumbnail':
+                media_thumbnail.append({'url': url})
+            continue
+
+        if name == 'link':
+            href = child.get('href')
+            if href is not None:
+                # Atom: prefer rel="alternate"
+                if child.get('rel', 'alternate') == 'alternate' and 'link' not in entry:
+                    entry['link'] = href
+            elif 'link' not in entry:
+                entry['link'] = _text(child)
+        elif name == 'content' and ns == ATOM_NS:
+            entry.setdefault('summary', _text(child))
+        elif name == 'source':
+            entry.setdefault('source', {'title': _text(child), 'href': child.get('url', '')})
+        elif name == 'enclosure':
+            url = child.get('url')
+            if url and (child.get('type') or '').startswith('image/'):
+                media_content.append({'url': url, 'medium': 'image'})
+        elif name in TEXT_FIELDS:
+            entry.setdefault(TEXT_FIELDS[name], _text(child))
+
+    if 'published' not in entry and 'updated' in entry:
+        entry['published'] = entry['updated']
+    if media_content:
+        entry['media_content'] = media_content
+    if media_thumbnail:
+        entry['media_thumbnail'] = media_thumbnail
+
+    return entry
+
+
+def parse_feed_stream(source: Union[bytes, BinaryIO], max_items: int) -> List[Dict[str, Any]]:
+    """
+    Stream-parse an RSS/Atom document and stop after max_items entries
+
+    Args:
+        source: Feed bytes or a binary file-like object
+        max_items: Number of entries to return
+
+    Returns:
+        List of entry dicts (title, summary, link, published, media_*)
+
+    Raises:
+        etree.XMLSyntaxError: For malformed feeds
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    entries: List[Dict[str, Any]] = []
+    if max_items <= 0:
+        return entries
+
+    context = etree.iterparse(
+        source,
+        events=('end',),
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=False,
+    )
+
+    for _, elem in context:
+        if _local(elem.tag) not in ITEM_TAGS:
+            continue
+
+        entries.append(_entry_from_element(elem))
+
+        # Free the parsed item and everything before it
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+        if len(entries) >= max_items:
+            break
+
+    del context
+    return entries
+
+
+def parse_feed_fallback(content: bytes, max_items: int) -> List[Dict[str, Any]]:
+    """Parse a feed with feedparser (tolerates malformed XML)"""
+    feed = feedparser.parse(content)
+    return list(feed.entries[:max_items])
+
+
+def fetch_feed(
+    url: str,
+    max_items: int,
+    etag: Optional[str] = None,
+    modified: Optional[str] = None,
+    timeout: float = 10,
+) -> Dict[str, Any]:
+    """
+    Download and parse a feed, streaming where possible
+
+    The body is parsed while it downloads; the download stops once
+    max_items entries were read. Malformed feeds are re-parsed with
+    feedparser from the bytes read so far plus the rest of the body.
+
+    Args:
+        url: Feed URL
+        max_items: Number of entries wanted
+        etag: ETag from the previous poll (conditional GET)
+        modified: Last-Modified from the previous poll (conditional GET)
+        timeout: Request timeout in seconds
+
+    Returns:
+        Dict with entries, status, etag, modified, parser
+    """
+    headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    if etag:
+        headers['If-None-Match'] = etag
+    if modified:
+        headers['If-Modified-Since'] = modified
+
+    # Polling backoff is the scheduler's job; outcomes are only reported
+    scoreboard = get_domain_scoreboard()
+    start = time.time()
+
+    try:
+        response = requests.get(url, headers=headers, timeout=timeout, stream=True)
+    except requests.RequestException as e:
+        scoreboard.record(url, False, time.time() - start, type(e).__name__, kind='feed')
+        raise
+
+    scoreboard.record(
+        url, response.status_code < 400, time.time() - start,
+        f"HTTP {response.status_code}" if response.status_code >= 400 else None,
+        kind='feed'
+    )
+
+    result = {
+        'entries': [],
+        'status': response.status_code,
+        'etag': response.headers.get('ETag'),
+        'modified': response.headers.get('Last-Modified'),
+        'parser': 'streaming',
+    }
+
+    try:
+        if response.status_code == 304:
+            return result
+
+        response.raise_for_status()
+        response.raw.decode_content = True
+        reader = _RecordingReader(response.raw)
+
+        try:
+            result['entries'] = parse_feed_stream(reader, max_items)
+        except etree.XMLSyntaxError as e:
+            logger.debug(f"Streaming parse failed for {url[:60]}, using feedparser: {e}")
+            result['entries'] = parse_feed_fallback(reader.read_all(), max_items)
+            result['parser'] = 'feedparser'
+
+        return result
+
+    finally:
+        response.close()
@@ -0,0 +1,187 @@
+"""
+Feed Scheduler
+Learns how often each feed publishes and decides when it is worth polling again
+"""
+
+import calendar
+import logging
+import random
+import statistics
+import threading
+import time
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Optional
+
+
+def entry_timestamp(entry: Dict) -> Optional[float]:
+    """Get the publish/update time of a feed entry as a UNIX timestamp"""
+    for field in ('published_parsed', 'updated_parsed'):
+        parsed = entry.get(field)
+        if parsed:
+            return float(calendar.timegm(parsed))
+
+    for field in ('published', 'updated'):
+        value = entry.get(field)
+        if not value:
+            continue
+        try:
+            return parsedate_to_datetime(value).timestamp()  # RSS (RFC 822)
+        except (TypeError, ValueError):
+            pass
+        try:
+            return datetime.fromisoformat(value).timestamp()  # Atom (ISO 8601)
+        except (TypeError, ValueError):
+            continue
+
+    return None
+
+
+class FeedScheduler:
+    """
+    Adaptive per-feed polling schedule
+
+    The poll interval of a feed follows the median gap between its entry
+    timestamps, clamped to [min_interval, max_interval]. Polls that bring
+    nothing new stretch the interval, errors back off exponentially.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 120,
+        max_interval: float = 3600,
+        default_interval: float = 600,
+        backoff_factor: float = 2.0,
+        max_backoff: float = 6 * 3600,
+    ):
+        """
+        Initialize scheduler
+
+        Args:
+            min_interval: Never poll a feed more often than this (seconds)
+            max_interval: Always poll a healthy feed at least this often (seconds)
+            default_interval: Interval for feeds with no history yet (seconds)
+            backoff_factor: Multiplier applied per consecutive error
+            max_backoff: Upper bound of the error backoff delay (seconds)
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = self._clamp(default_interval)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+        self.feeds: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger("MultiAgent.FeedScheduler")
+
+    def _clamp(self, interval: float) -> float:
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def _state(self, feed_name: str) -> Dict[str, Any]:
+        if feed_name not in self.feeds:
+            self.feeds[feed_name] = {
+                'interval': self.default_interval,
+                'next_due': 0.0,
+                'last_polled': None,
+                'latest_entry': None,
+                'errors': 0,
+                'last_error': None,
+                'polls': 0,
+            }
+        return self.feeds[feed_name]
+
+    def is_due(self, feed_name: str, now: Optional[float] = None) -> bool:
+        """Check whether a feed should be polled now"""
+        now = now if now is not None else time.time()
+        with self.lock:
+            return now >= self._state(feed_name)['next_due']
+
+    def due_feeds(self, feed_names: List[str], now: Optional[float] = None) -> List[str]:
+        """Filter feed names down to the ones due for polling"""
+        return [name for name in feed_names if self.is_due(name, now)]
+
+    def seconds_until_due(self, feed_names: List[str]) -> float:
+        """Seconds until the next of the given feeds becomes due"""
+        now = time.time()
+        with self.lock:
+            due = [self._state(name)['next_due'] for name in feed_names]
+        return max(0.0, min(due) - now) if due else self.default_interval
+
+    def record_success(self, feed_name: str, entry_timestamps: List[float]):
+        """
+        Update a feed's schedule after a successful poll
+
+        Args:
+            feed_name: Feed identifier
+            entry_timestamps: Publish timestamps of the entries in the feed
+        """
+        now = time.time()
+        stamps = sorted((ts for ts in entry_timestamps if ts), reverse=True)
+
+        with self.lock:
+            state = self._state(feed_name)
+            interval = state['interval']
+
+            if len(stamps) >= 2:
+                gaps = [a - b for a, b in zip(stamps, stamps[1:]) if a > b]
+                if gaps:
+                    observed = statistics.median(gaps)
+                    # Smooth to avoid jumping around on one bursty poll
+                    interval = 0.5 * interval + 0.5 * observed
+
+            newest = stamps[0] if stamps else None
+            if newest is not None and state['latest_entry'] is not None \
+                    and newest <= state['latest_entry']:
+                # Nothing new since the last poll
+                interval *= 1.25
+
+            state['interval'] = self._clamp(interval)
+            state['latest_entry'] = max(newest or 0, state['latest_entry'] or 0) or None
+            state['last_polled'] = now
+            state['errors'] = 0
+            state['last_error'] = None
+            state['polls'] += 1
+            state['next_due'] = now + state['interval']
+
+        self.logger.debug(f"{feed_name}: next poll in {state['interval']:.0f}s")
+
+    def record_not_modified(self, feed_name: str):
+        """Update a feed's schedule after a poll that returned 304 Not Modified"""
+        self.record_success(feed_name, [])
+        with self.lock:
+            state = self._state(feed_name)
+            state['interval'] = self._clamp(state['interval'] * 1.25)
+            state['next_due'] = state['last_polled'] + state['interval']
+
+    def record_error(self, feed_name: str, error: str = ''):
+        """Back off a feed after a failed poll"""
+        now = time.time()
+
+        with self.lock:
+            state = self._state(feed_name)
+            state['errors'] += 1
+            state['last_error'] = error[:200] if error else None
+            state['last_polled'] = now
+            state['polls'] += 1
+
+            delay = state['interval'] * (self.backoff_factor ** state['errors'])
+            delay = min(self.max_backoff, delay)
+            delay *= random.uniform(0.9, 1.1)  # Jitter so feeds don't sync up
+            state['next_due'] = now + delay
+
+        self.logger.debug(f"{feed_name}: error #{state['errors']}, retry in {delay:.0f}s")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-feed schedule"""
+        now = time.time()
+        with self.lock:
+            return {
+                name: {
+                    'interval': f"{state['interval']:.0f}s",
+                    'due_in': f"{max(0.0, state['next_due'] - now):.0f}s",
+                    'errors': state['errors'],
+                    'last_error': state['last_error'],
+                    'polls': state['polls'],
+                }
+                for name, state in self.feeds.items()
+            }
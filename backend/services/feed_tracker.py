@@ -0,0 +1,127 @@
+"""
+Feed Tracker
+Remembers which feed entries were already ingested so only new or updated
+entries get processed (URL resolution, image extraction, etc.)
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+class FeedTracker:
+    """
+    Per-feed record of seen entry GUIDs/links with timestamps
+
+    Each seen entry keeps the article record that was built for it, so
+    unchanged entries can be served from memory on the next poll.
+    """
+
+    def __init__(self, retention_hours: float = 48):
+        """
+        Initialize tracker
+
+        Args:
+            retention_hours: Forget entries not seen in a feed for this long
+        """
+        self.retention = retention_hours * 3600
+        self.feeds: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger("MultiAgent.FeedTracker")
+
+        self.stats = {
+            'new_entries': 0,
+            'updated_entries': 0,
+            'reused_entries': 0,
+        }
+
+    @staticmethod
+    def entry_key(entry: Dict) -> str:
+        """Stable identity of a feed entry (GUID, then link, then title)"""
+        return (
+            entry.get('id')
+            or entry.get('guid')
+            or entry.get('link')
+            or entry.get('title', '')
+        )
+
+    @staticmethod
+    def entry_version(entry: Dict) -> str:
+        """Version marker of a feed entry, changes when the entry is updated"""
+        return entry.get('updated') or entry.get('published') or ''
+
+    def lookup(self, feed_name: str, entry: Dict) -> Optional[Dict]:
+        """
+        Get the cached article for an entry if it was seen before unchanged
+
+        Returns:
+            Copy of the cached article dict, or None if new/updated
+        """
+        key = self.entry_key(entry)
+        if not key:
+            return None
+
+        with self.lock:
+            seen = self.feeds.get(feed_name, {}).get(key)
+
+            if seen is None:
+                self.stats['new_entries'] += 1
+                return None
+
+            seen['last_seen'] = time.time()
+
+            if seen['version'] != self.entry_version(entry):
+                self.stats['updated_entries'] += 1
+                return None
+
+            self.stats['reused_entries'] += 1
+            return dict(seen['article'])
+
+    def remember(self, feed_name: str, entry: Dict, article: Dict):
+        """Store the article built for an entry"""
+        key = self.entry_key(entry)
+        if not key:
+            return
+
+        now = time.time()
+
+        with self.lock:
+            seen = self.feeds.setdefault(feed_name, {})
+            first_seen = seen.get(key, {}).get('first_seen', now)
+            seen[key] = {
+                'version': self.entry_version(entry),
+                'first_seen': first_seen,
+                'last_seen': now,
+                'article': dict(article),
+            }
+
+    def prune(self, feed_name: Optional[str] = None):
+        """Forget entries that dropped out of their feed long ago"""
+        cutoff = time.time() - self.retention
+        removed = 0
+
+        with self.lock:
+            names = [feed_name] if feed_name else list(self.feeds.keys())
+            for name in names:
+                seen = self.feeds.get(name, {})
+                stale = [k for k, v in seen.items() if v['last_seen'] < cutoff]
+                for key in stale:
+                    del seen[key]
+                removed += len(stale)
+
+                if not seen:
+                    self.feeds.pop(name, None)
+
+        if removed:
+            self.logger.debug(f"Pruned {removed} stale feed entries")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tracker statistics"""
+        with self.lock:
+            tracked = sum(len(seen) for seen in self.feeds.values())
+            return {
+                'feeds': len(self.feeds),
+                'tracked_entries': tracked,
+                **self.stats,
+            }
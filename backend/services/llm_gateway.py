@@ -0,0 +1,470 @@
+"""
+LLM Gateway
+One entry point for every LLM call: shared concurrency limit and quota,
+retries with backoff and jitter, JSON mode, timeouts and pluggable backends
+"""
+
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from typing import Dict, Any, Iterator, NamedTuple, Optional
+
+from config import Config
+from services.llm_telemetry import LLMTelemetry
+from services.rate_limiter import TokenBucketLimiter, get_llm_limiter, estimate_tokens
+
+
+class QuotaExhaustedError(RuntimeError):
+    """No LLM quota or concurrency slot became available within the wait limit"""
+
+
+class LLMResponse(NamedTuple):
+    """Backend response; token counts are None when the backend has no usage data"""
+    text: str
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+
+
+# Errors worth another attempt (google.api_core names, plus plain network errors)
+RETRYABLE_ERRORS = {
+    'ResourceExhausted', 'TooManyRequests', 'ServiceUnavailable',
+    'DeadlineExceeded', 'InternalServerError', 'GatewayTimeout',
+}
+
+
+def parse_json_text(text: str) -> Any:
+    """JSON from a model response, tolerating ``` fences around it"""
+    return json.loads(re.sub(r'```json\s*|\s*```', '', text.strip()))
+
+
+class GeminiBackend:
+    """Google Gemini through google.generativeai (one client per process)"""
+
+    def __init__(self, api_key: str):
+        import google.generativeai as genai
+
+        self.genai = genai
+        self.genai.configure(api_key=api_key)
+        self.models: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+
+    def _model(self, name: str):
+        with self.lock:
+            if name not in self.models:
+                self.models[name] = self.genai.GenerativeModel(name)
+            return self.models[name]
+
+    @staticmethod
+    def _options(timeout: float, json_mode: bool) -> Dict[str, Any]:
+        # Retries are the gateway's job, not the client library's
+        options = {'request_options': {'timeout': timeout, 'retry': None}}
+        if json_mode:
+            options['generation_config'] = {'response_mime_type': 'application/json'}
+        return options
+
+    def generate(self, model: str, prompt: str, timeout: float, json_mode: bool = False) -> LLMResponse:
+        response = self._model(model).generate_content(prompt, **self._options(timeout, json_mode))
+        usage = getattr(response, 'usage_metadata', None)
+        return LLMResponse(
+            response.text,
+            getattr(usage, 'prompt_token_count', None) or None,
+            getattr(usage, 'candidates_token_count', None) or None,
+        )
+
+    def stream(self, model: str, prompt: str, timeout: float) -> Iterator[str]:
+        for chunk in self._model(model).generate_content(prompt, stream=True, **self._options(timeout, False)):
+            if chunk.text:
+                yield chunk.text
+
+
+class FakeBackend:
+    """
+    Deterministic local stand-in for the LLM, for tests and benchmarks
+
+    Answers the query-parse, ranking, batch-summary and summary prompts in
+    their expected formats, derived only from the prompt text (without
+    usage data, like a backend that reports none). Latency is
+    base_latency plus a per-token cost; calls longer than their timeout
+    raise TimeoutError after the timeout.
+    """
+
+    def __init__(self, base_latency: float = 0.0, seconds_per_1k_tokens: float = 0.0):
+        self.base_latency = base_latency
+        self.per_token = seconds_per_1k_tokens / 1000
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def _wait(self, prompt: str, timeout: float):
+        with self.lock:
+            self.calls += 1
+
+        latency = self.base_latency + estimate_tokens(prompt) * self.per_token
+        if latency > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f"Fake LLM call took longer than {timeout}s")
+        time.sleep(latency)
+
+    def generate(self, model: str, prompt: str, timeout: float, json_mode: bool = False) -> LLMResponse:
+        self._wait(prompt, timeout)
+        return LLMResponse(self.respond(prompt))
+
+    def stream(self, model: str, prompt: str, timeout: float) -> Iterator[str]:
+        self._wait(prompt, timeout)
+        for word in re.findall(r'\S+\s*', self.respond(prompt)):
+            yield word
+
+    @staticmethod
+    def respond(prompt: str) -> str:
+        """The fake's answer to a prompt"""
+        query = re.search(r'^Query: "(.*)"$', prompt, re.MULTILINE)
+        if query and 'JSON object' in prompt:
+            words = re.findall(r'\w+', query.group(1).lower())
+            return json.dumps({
+                'keywords': words,
+                'location': None,
+                'category': 'general',
+                'timeframe': 'recent',
+                'search_term': query.group(1),
+                'intent': f"Find news about {query.group(1)}",
+            })
+
+        if 'JSON array of article numbers' in prompt:
+            numbers = [int(n) for n in re.findall(r'^(\d+)\. ', prompt, re.MULTILINE)]
+            # Stable but not simply the input order
+            numbers.sort(key=lambda n: hashlib.md5(f"{prompt[:200]}{n}".encode('utf-8')).hexdigest())
+            return json.dumps(numbers)
+
+        batch = re.findall(r'^\[Article (\d+)\]\nTitle: (.*)$', prompt, re.MULTILINE)
+        if batch:
+            return json.dumps([
+                {'id': int(n), 'summary': f"Summary of {title.strip()}."} for n, title in batch
+            ])
+
+        title = re.search(r'^Title: (.*)$', prompt, re.MULTILINE)
+        if title:
+            return f"Summary of {title.group(1).strip()}."
+
+        return "OK"
+
+
+class LLMGateway:
+    """
+    Shared front door for LLM calls
+
+    Each call first takes quota from the token-bucket limiter, then one of
+    max_concurrency slots, then calls the backend with a timeout. Rate
+    limit, server and network errors are retried with exponential backoff
+    and full jitter; other errors (and quota timeouts) are raised at once.
+    """
+
+    def __init__(
+        self,
+        backend,
+        model: str = "gemini-2.5-flash",
+        limiter: Optional[TokenBucketLimiter] = None,
+        max_concurrency: int = 8,
+        timeout: float = 30,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8,
+        quota_timeout: float = 30,
+        telemetry: Optional[LLMTelemetry] = None,
+    ):
+        """
+        Initialize gateway
+
+        Args:
+            backend: GeminiBackend, FakeBackend or anything with the same
+                generate/stream methods
+            model: Model name passed to the backend
+            limiter: Quota limiter (default: the process-wide Gemini limiter)
+            max_concurrency: LLM calls in flight at once
+            timeout: Default per-call timeout in seconds
+            max_retries: Default retries after the first attempt
+            backoff_base: First backoff ceiling in seconds (doubles per retry)
+            backoff_max: Largest backoff ceiling in seconds
+            quota_timeout: Default seconds a call waits for quota plus a
+                concurrency slot before giving up
+            telemetry: Per prompt type token/latency counters (default: new)
+        """
+        self.backend = backend
+        self.model = model
+        self.limiter = limiter or get_llm_limiter()
+        self.slots = threading.BoundedSemaphore(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.quota_timeout = quota_timeout
+        self.telemetry = telemetry or LLMTelemetry()
+
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger("MultiAgent.LLMGateway")
+
+        self.inflight = 0
+        self.stats = {
+            'calls': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'attempts': 0,
+            'retries': 0,
+            'timeouts': 0,
+            'quota_timeouts': 0,
+            'slot_timeouts': 0,
+            'json_errors': 0,
+            'peak_inflight': 0,
+        }
+
+    def generate(
+        self,
+        prompt: str,
+        prompt_type: str = 'other',
+        items: int = 1,
+        expected_output_tokens: int = 250,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        json_mode: bool = False,
+        wait_timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Text response to a prompt (raises once retries are used up)
+
+        Args:
+            prompt: Prompt text
+            prompt_type: Telemetry label (query_parse, ranking, summary, ...)
+            items: Articles the prompt covers, for tokens-per-item telemetry
+            expected_output_tokens: Output tokens reserved from the quota
+            timeout: Per-attempt timeout (default: gateway timeout)
+            retries: Retries after the first attempt (default: max_retries)
+            json_mode: Ask the backend for a JSON response
+            wait_timeout: Per-attempt limit on waiting for quota plus a
+                concurrency slot (default: quota_timeout); the call's
+                worst case is about wait_timeout + timeout per attempt
+        """
+        timeout = self.timeout if timeout is None else timeout
+        retries = self.max_retries if retries is None else retries
+        tokens = estimate_tokens(prompt) + expected_output_tokens
+
+        with self.lock:
+            self.stats['calls'] += 1
+        start = time.perf_counter()
+
+        attempt = 0
+        while True:
+            try:
+                with _Slot(self, tokens, wait_timeout):
+                    response = self.backend.generate(self.model, prompt, timeout, json_mode)
+                self._record_success(prompt_type, items, start, prompt, response)
+                return response.text
+            except QuotaExhaustedError:
+                self.telemetry.record(prompt_type, 'quota', time.perf_counter() - start)
+                raise
+            except Exception as e:
+                self._record_failure(e)
+                if attempt >= retries or not self._retryable(e):
+                    self.telemetry.record(prompt_type, self._outcome(e), time.perf_counter() - start)
+                    raise
+                self._backoff(attempt, e)
+                attempt += 1
+
+    def generate_json(self, prompt: str, prompt_type: str = 'other', **kwargs) -> Any:
+        """
+        Parsed JSON response to a prompt
+
+        Takes the same keyword arguments as generate. Unparseable
+        responses raise ValueError (they are not retried).
+        """
+        text = self.generate(prompt, prompt_type, json_mode=True, **kwargs)
+        try:
+            return parse_json_text(text)
+        except ValueError:
+            with self.lock:
+                self.stats['json_errors'] += 1
+            self.telemetry.record_json_error(prompt_type)
+            raise
+
+    def stream(
+        self,
+        prompt: str,
+        prompt_type: str = 'other',
+        expected_output_tokens: int = 250,
+        timeout: Optional[float] = None,
+        wait_timeout: Optional[float] = None,
+    ) -> Iterator[str]:
+        """
+        Response text chunks as the model generates them
+
+        Not retried: a failure mid-stream would repeat text the caller has
+        already passed on. Tokens are always estimated.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with self.lock:
+            self.stats['calls'] += 1
+        start = time.perf_counter()
+
+        chunks = []
+        try:
+            with _Slot(self, estimate_tokens(prompt) + expected_output_tokens, wait_timeout):
+                for chunk in self.backend.stream(self.model, prompt, timeout):
+                    chunks.append(chunk)
+                    yield chunk
+        except QuotaExhaustedError:
+            self.telemetry.record(prompt_type, 'quota', time.perf_counter() - start)
+            raise
+        except Exception as e:
+            self._record_failure(e)
+            self.telemetry.record(prompt_type, self._outcome(e), time.perf_counter() - start)
+            raise
+        self._record_success(prompt_type, 1, start, prompt, LLMResponse(''.join(chunks)))
+
+    def _record_success(self, prompt_type: str, items: int, start: float, prompt: str, response: LLMResponse):
+        """Telemetry of a successful call, estimating tokens the backend did not report"""
+        input_tokens, output_tokens = response.input_tokens, response.output_tokens
+        self.telemetry.record(
+            prompt_type,
+            'ok',
+            time.perf_counter() - start,
+            input_tokens=estimate_tokens(prompt) if input_tokens is None else input_tokens,
+            output_tokens=estimate_tokens(response.text) if output_tokens is None else output_tokens,
+            estimated=input_tokens is None or output_tokens is None,
+            items=items,
+        )
+
+    @staticmethod
+    def _outcome(error: Exception) -> str:
+        if isinstance(error, TimeoutError) or type(error).__name__ == 'DeadlineExceeded':
+            return 'timeout'
+        return 'error'
+
+    @staticmethod
+    def _retryable(error: Exception) -> bool:
+        return (
+            isinstance(error, (TimeoutError, ConnectionError))
+            or type(error).__name__ in RETRYABLE_ERRORS
+            or getattr(error, 'code', None) in (429, 500, 502, 503, 504)
+        )
+
+    def _record_failure(self, error: Exception):
+        with self.lock:
+            self.stats['failed'] += 1
+            if self._outcome(error) == 'timeout':
+                self.stats['timeouts'] += 1
+
+    def _backoff(self, attempt: int, error: Exception):
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        with self.lock:
+            self.stats['retries'] += 1
+        self.logger.debug(f"LLM call failed ({error}), retrying in {delay:.2f}s")
+        time.sleep(delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get gateway statistics, including the quota limiter"""
+        with self.lock:
+            stats = {
+                'backend': type(self.backend).__name__,
+                'model': self.model,
+                'max_concurrency': self.max_concurrency,
+                'inflight': self.inflight,
+                **self.stats,
+                'rate_limiter': self.limiter.get_stats(),
+            }
+
+        if hasattr(self.backend, 'get_stats'):
+            stats['replay'] = self.backend.get_stats()
+        stats['prompts'] = self.telemetry.get_stats()
+        return stats
+
+
+class _Slot:
+    """Quota plus a concurrency slot for one attempt, both within one wait limit"""
+
+    def __init__(self, gateway: LLMGateway, tokens: int, wait_timeout: Optional[float] = None):
+        self.gateway = gateway
+        self.tokens = tokens
+        self.wait_timeout = gateway.quota_timeout if wait_timeout is None else wait_timeout
+        self.held = False
+
+    def __enter__(self):
+        gateway = self.gateway
+        deadline = time.monotonic() + self.wait_timeout
+
+        if not gateway.limiter.acquire(self.tokens, timeout=self.wait_timeout):
+            with gateway.lock:
+                gateway.stats['quota_timeouts'] += 1
+            raise QuotaExhaustedError("Gemini quota exhausted")
+
+        if not gateway.slots.acquire(timeout=max(0.0, deadline - time.monotonic())):
+            with gateway.lock:
+                gateway.stats['slot_timeouts'] += 1
+            raise QuotaExhaustedError(f"No free LLM slot within {self.wait_timeout:.1f}s")
+        self.held = True
+        with gateway.lock:
+            gateway.stats['attempts'] += 1
+            gateway.inflight += 1
+            gateway.stats['peak_inflight'] = max(gateway.stats['peak_inflight'], gateway.inflight)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        gateway = self.gateway
+        if self.held:
+            with gateway.lock:
+                gateway.inflight -= 1
+                if exc_type is None:
+                    gateway.stats['succeeded'] += 1
+            gateway.slots.release()
+        return False
+
+
+def create_backend(name: str, api_key: Optional[str] = None):
+    """Backend by name ('gemini' or 'fake'), behind record/replay unless in passthrough mode"""
+    if name == 'fake':
+        backend = FakeBackend(base_latency=Config.LLM_FAKE_LATENCY_MS / 1000)
+    elif name == 'gemini':
+        backend = GeminiBackend(api_key or Config.GOOGLE_API_KEY)
+    else:
+        raise ValueError(f"Unknown LLM backend: {name}")
+
+    if Config.LLM_REPLAY_MODE == 'passthrough':
+        return backend
+
+    from services.llm_replay import RecordReplayBackend
+
+    return RecordReplayBackend(
+        backend,
+        path=Config.LLM_REPLAY_PATH,
+        mode=Config.LLM_REPLAY_MODE,
+        on_miss=Config.LLM_REPLAY_ON_MISS,
+        latency_scale=Config.LLM_REPLAY_LATENCY_SCALE,
+        latency_ms=Config.LLM_REPLAY_LATENCY_MS,
+    )
+
+
+_gateway: Optional[LLMGateway] = None
+_gateway_lock = threading.Lock()
+
+
+def get_llm_gateway(api_key: Optional[str] = None) -> LLMGateway:
+    """Process-wide LLM gateway (configured on first use)"""
+    global _gateway
+    with _gateway_lock:
+        if _gateway is None:
+            _gateway = LLMGateway(
+                create_backend(Config.LLM_BACKEND, api_key),
+                model=Config.LLM_MODEL,
+                max_concurrency=Config.LLM_MAX_CONCURRENCY,
+                timeout=Config.LLM_TIMEOUT,
+                max_retries=Config.LLM_MAX_RETRIES,
+                backoff_base=Config.LLM_BACKOFF_BASE,
+                backoff_max=Config.LLM_BACKOFF_MAX,
+                quota_timeout=Config.LLM_QUOTA_TIMEOUT,
+                telemetry=LLMTelemetry(
+                    input_price_per_1m=Config.LLM_INPUT_PRICE_PER_1M,
+                    output_price_per_1m=Config.LLM_OUTPUT_PRICE_PER_1M,
+                ),
+            )
+        return _gateway
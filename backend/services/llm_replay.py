@@ -0,0 +1,214 @@
+"""
+LLM Record / Replay
+Backend wrapper that records LLM responses to a JSONL file and replays them
+with realistic timing, so benchmarks and CI run without the live model
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional
+
+from services.llm_gateway import LLMResponse
+
+
+MODES = ('record', 'replay', 'passthrough')
+
+
+class ReplayMissError(LookupError):
+    """Replay mode found no recording for a call"""
+
+
+def recording_key(model: str, prompt: str, params: Dict[str, Any]) -> str:
+    """Key of a call: model, prompt hash and call parameters"""
+    prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    return hashlib.sha256(
+        f"{model}\x00{prompt_hash}\x00{json.dumps(params, sort_keys=True)}".encode('utf-8')
+    ).hexdigest()
+
+
+class RecordReplayBackend:
+    """
+    Wraps an LLM backend with a response recording
+
+    record: call the wrapped backend and append each response (with its
+        latency) to the recording file
+    replay: answer from the recording, sleeping latency_scale x the
+        recorded latency plus latency_ms; a missing key raises
+        ReplayMissError, or calls the wrapped backend when on_miss is
+        'fallback'
+    passthrough: call the wrapped backend only
+    """
+
+    def __init__(
+        self,
+        backend,
+        path: str = "data/llm_recordings.jsonl",
+        mode: str = "passthrough",
+        on_miss: str = "fail",
+        latency_scale: float = 1.0,
+        latency_ms: float = 0.0,
+    ):
+        """
+        Initialize wrapper
+
+        Args:
+            backend: Backend that makes the real calls
+            path: JSONL recording file (one call per line; later lines win)
+            mode: 'record', 'replay' or 'passthrough'
+            on_miss: Replay miss handling - 'fail' or 'fallback'
+            latency_scale: Multiplier of recorded latency when replaying
+                (0 replays instantly)
+            latency_ms: Fixed latency added to every replayed call
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown LLM replay mode: {mode}")
+        if on_miss not in ('fail', 'fallback'):
+            raise ValueError(f"Unknown replay miss handling: {on_miss}")
+
+        self.backend = backend
+        self.path = Path(path)
+        self.mode = mode
+        self.on_miss = on_miss
+        self.latency_scale = latency_scale
+        self.latency_ms = latency_ms
+
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger("MultiAgent.LLMReplay")
+        self.recordings: Dict[str, Dict[str, Any]] = {}
+
+        self.stats = {
+            'recorded': 0,
+            'replayed': 0,
+            'misses': 0,
+            'fallbacks': 0,
+            'passthrough': 0,
+        }
+
+        if mode != 'passthrough':
+            self.load()
+
+    def load(self):
+        """Read the recording file (missing file = empty recording)"""
+        if not self.path.exists():
+            return
+
+        loaded = 0
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    self.recordings[entry['key']] = entry
+                    loaded += 1
+                except (ValueError, KeyError) as e:
+                    self.logger.warning(f"Skipping unreadable recording line: {e}")
+
+        self.logger.info(f"Loaded {loaded} LLM recordings from {self.path}")
+
+    def generate(self, model: str, prompt: str, timeout: float, json_mode: bool = False) -> LLMResponse:
+        params = {'json_mode': json_mode, 'stream': False}
+        entry = self._lookup(model, prompt, params)
+        if entry is not None:
+            self._sleep(self._replay_delay(entry['latency']), timeout)
+            return LLMResponse(entry['response'], entry.get('input_tokens'), entry.get('output_tokens'))
+
+        start = time.perf_counter()
+        response = self.backend.generate(model, prompt, timeout, json_mode)
+        self._record(model, prompt, params, response, None, time.perf_counter() - start)
+        return response
+
+    def stream(self, model: str, prompt: str, timeout: float) -> Iterator[str]:
+        params = {'json_mode': False, 'stream': True}
+        entry = self._lookup(model, prompt, params)
+        if entry is not None:
+            chunks = entry.get('chunks') or [entry['response']]
+            # The whole call's delay, checked against the timeout once and
+            # spread over the chunks
+            delay = self._replay_delay(entry['latency'])
+            self._check_timeout(delay, timeout)
+            for chunk in chunks:
+                if delay > 0:
+                    time.sleep(delay / len(chunks))
+                yield chunk
+            return
+
+        start = time.perf_counter()
+        chunks: List[str] = []
+        for chunk in self.backend.stream(model, prompt, timeout):
+            chunks.append(chunk)
+            yield chunk
+        self._record(model, prompt, params, LLMResponse(''.join(chunks)), chunks, time.perf_counter() - start)
+
+    def _lookup(self, model: str, prompt: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Recorded entry to replay, or None to call the wrapped backend"""
+        if self.mode != 'replay':
+            if self.mode == 'passthrough':
+                with self.lock:
+                    self.stats['passthrough'] += 1
+            return None
+
+        key = recording_key(model, prompt, params)
+        with self.lock:
+            entry = self.recordings.get(key)
+            if entry is not None:
+                self.stats['replayed'] += 1
+                return entry
+
+            self.stats['misses'] += 1
+            if self.on_miss == 'fail':
+                raise ReplayMissError(f"No LLM recording for prompt {hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]}")
+            self.stats['fallbacks'] += 1
+            return None
+
+    def _record(self, model: str, prompt: str, params: Dict[str, Any], response: LLMResponse, chunks: Optional[List[str]], latency: float):
+        if self.mode != 'record':
+            return
+
+        entry = {
+            'key': recording_key(model, prompt, params),
+            'model': model,
+            'params': params,
+            'prompt': prompt,
+            'response': response.text,
+            'input_tokens': response.input_tokens,
+            'output_tokens': response.output_tokens,
+            'chunks': chunks,
+            'latency': round(latency, 4),
+            'recorded_at': time.time(),
+        }
+
+        with self.lock:
+            self.recordings[entry['key']] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self.stats['recorded'] += 1
+
+    def _replay_delay(self, recorded_latency: float) -> float:
+        """Seconds a replayed call takes: scaled recorded latency plus the fixed latency"""
+        return recorded_latency * self.latency_scale + self.latency_ms / 1000
+
+    @staticmethod
+    def _check_timeout(delay: float, timeout: float):
+        if delay > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f"Replayed LLM call took longer than {timeout}s")
+
+    def _sleep(self, delay: float, timeout: float):
+        self._check_timeout(delay, timeout)
+        if delay > 0:
+            time.sleep(delay)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get record/replay statistics"""
+        with self.lock:
+            return {
+                'mode': self.mode,
+                'recordings': len(self.recordings),
+                **self.stats,
+            }
@@ -0,0 +1,194 @@
+"""
+LLM Telemetry
+Tokens, cost, latency and outcome of LLM calls per prompt type, for the
+stats endpoint and Prometheus
+"""
+
+import threading
+from typing import Dict, Any, List
+
+
+LATENCY_BUCKETS = (0.25, 0.5, 1, 2, 5, 10, 30, 60)
+TOKEN_BUCKETS = (256, 512, 1024, 2048, 4096, 8192, 16384, 32768)
+
+OUTCOMES = ('ok', 'error', 'timeout', 'quota')
+
+
+def _histogram(buckets: tuple) -> Dict[str, Any]:
+    return {'buckets': [0] * len(buckets), 'count': 0, 'sum': 0.0}
+
+
+def _observe(histogram: Dict[str, Any], bounds: tuple, value: float):
+    for i, bound in enumerate(bounds):
+        if value <= bound:
+            histogram['buckets'][i] += 1
+    histogram['count'] += 1
+    histogram['sum'] += value
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class LLMTelemetry:
+    """
+    Per prompt type (query_parse, ranking, summary, ...) counters
+
+    Token counts come from the model's usage metadata when the backend
+    reports it, else from the local estimate; 'estimated_calls' says how
+    many calls used the estimate. 'items' is the number of articles the
+    prompts covered, so tokens per item show how prompts grow with
+    max_results.
+    """
+
+    def __init__(self, input_price_per_1m: float = 0.0, output_price_per_1m: float = 0.0):
+        """
+        Initialize telemetry
+
+        Args:
+            input_price_per_1m: USD per million input tokens
+            output_price_per_1m: USD per million output tokens
+        """
+        self.input_price = input_price_per_1m / 1_000_000
+        self.output_price = output_price_per_1m / 1_000_000
+        self.lock = threading.Lock()
+        self.prompts: Dict[str, Dict[str, Any]] = {}
+
+    def _entry(self, prompt_type: str) -> Dict[str, Any]:
+        if prompt_type not in self.prompts:
+            self.prompts[prompt_type] = {
+                'outcomes': {outcome: 0 for outcome in OUTCOMES},
+                'input_tokens': 0,
+                'output_tokens': 0,
+                'estimated_calls': 0,
+                'items': 0,
+                'json_errors': 0,
+                'max_input_tokens': 0,
+                'latency': _histogram(LATENCY_BUCKETS),
+                'input_token_sizes': _histogram(TOKEN_BUCKETS),
+            }
+        return self.prompts[prompt_type]
+
+    def record(
+        self,
+        prompt_type: str,
+        outcome: str,
+        latency: float,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        estimated: bool = False,
+        items: int = 1,
+    ):
+        """
+        Record one LLM call
+
+        Args:
+            prompt_type: Prompt family the call belongs to
+            outcome: 'ok', 'error', 'timeout' or 'quota'
+            latency: Seconds the caller waited (quota, retries included)
+            input_tokens: Prompt tokens (0 when the call failed)
+            output_tokens: Response tokens (0 when the call failed)
+            estimated: Token counts are local estimates
+            items: Articles the prompt covered (counted for successful calls)
+        """
+        with self.lock:
+            entry = self._entry(prompt_type)
+            entry['outcomes'][outcome] += 1
+            _observe(entry['latency'], LATENCY_BUCKETS, latency)
+
+            if outcome == 'ok':
+                entry['items'] += items
+                entry['input_tokens'] += input_tokens
+                entry['output_tokens'] += output_tokens
+                entry['estimated_calls'] += estimated
+                entry['max_input_tokens'] = max(entry['max_input_tokens'], input_tokens)
+                _observe(entry['input_token_sizes'], TOKEN_BUCKETS, input_tokens)
+
+    def record_json_error(self, prompt_type: str):
+        """A response that was not the JSON the prompt asked for"""
+        with self.lock:
+            self._entry(prompt_type)['json_errors'] += 1
+
+    def _cost(self, entry: Dict[str, Any]) -> float:
+        return entry['input_tokens'] * self.input_price + entry['output_tokens'] * self.output_price
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per prompt type summary"""
+        with self.lock:
+            stats = {}
+            for prompt_type, entry in sorted(self.prompts.items()):
+                calls = entry['latency']['count']
+                succeeded = entry['outcomes']['ok']
+                stats[prompt_type] = {
+                    'calls': calls,
+                    **entry['outcomes'],
+                    'input_tokens': entry['input_tokens'],
+                    'output_tokens': entry['output_tokens'],
+                    'avg_input_tokens': round(entry['input_tokens'] / succeeded) if succeeded else 0,
+                    'avg_output_tokens': round(entry['output_tokens'] / succeeded) if succeeded else 0,
+                    'max_input_tokens': entry['max_input_tokens'],
+                    'input_tokens_per_item': round(entry['input_tokens'] / entry['items']) if entry['items'] else 0,
+                    'estimated_calls': entry['estimated_calls'],
+                    'json_errors': entry['json_errors'],
+                    'avg_latency': f"{(entry['latency']['sum'] / calls) if calls else 0:.3f}s",
+                    'cost_usd': round(self._cost(entry), 6),
+                }
+            return stats
+
+    def prometheus(self, prefix: str = "news_llm") -> List[str]:
+        """Metric lines in the Prometheus text exposition format"""
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def sample(name: str, labels: Dict[str, str], value: float, suffix: str = ''):
+            label_text = ','.join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+            lines.append(f"{prefix}_{name}{suffix}{{{label_text}}} {value}")
+
+        def histogram(name: str, labels: Dict[str, str], data: Dict[str, Any], bounds: tuple):
+            for bound, count in zip(bounds, data['buckets']):
+                sample(name, {**labels, 'le': str(bound)}, count, '_bucket')
+            sample(name, {**labels, 'le': '+Inf'}, data['count'], '_bucket')
+            sample(name, labels, round(data['sum'], 6), '_sum')
+            sample(name, labels, data['count'], '_count')
+
+        with self.lock:
+            prompts = sorted(self.prompts.items())
+
+            family('calls_total', 'counter', 'LLM calls by prompt type and outcome')
+            for prompt_type, entry in prompts:
+                for outcome, count in entry['outcomes'].items():
+                    sample('calls_total', {'prompt_type': prompt_type, 'outcome': outcome}, count)
+
+            family('tokens_total', 'counter', 'LLM tokens by prompt type and direction')
+            for prompt_type, entry in prompts:
+                sample('tokens_total', {'prompt_type': prompt_type, 'direction': 'input'}, entry['input_tokens'])
+                sample('tokens_total', {'prompt_type': prompt_type, 'direction': 'output'}, entry['output_tokens'])
+
+            family('estimated_calls_total', 'counter', 'LLM calls whose tokens were estimated locally')
+            for prompt_type, entry in prompts:
+                sample('estimated_calls_total', {'prompt_type': prompt_type}, entry['estimated_calls'])
+
+            family('prompt_items_total', 'counter', 'Articles covered by successful LLM prompts')
+            for prompt_type, entry in prompts:
+                sample('prompt_items_total', {'prompt_type': prompt_type}, entry['items'])
+
+            family('json_errors_total', 'counter', 'LLM responses that were not valid JSON')
+            for prompt_type, entry in prompts:
+                sample('json_errors_total', {'prompt_type': prompt_type}, entry['json_errors'])
+
+            family('cost_usd_total', 'counter', 'Estimated LLM cost in USD')
+            for prompt_type, entry in prompts:
+                sample('cost_usd_total', {'prompt_type': prompt_type}, round(self._cost(entry), 6))
+
+            family('latency_seconds', 'histogram', 'LLM call latency including quota waits and retries')
+            for prompt_type, entry in prompts:
+                histogram('latency_seconds', {'prompt_type': prompt_type}, entry['latency'], LATENCY_BUCKETS)
+
+            family('input_tokens', 'histogram', 'Input tokens per successful LLM call')
+            for prompt_type, entry in prompts:
+                histogram('input_tokens', {'prompt_type': prompt_type}, entry['input_token_sizes'], TOKEN_BUCKETS)
+
+        return lines
@@ -5,7 +5,7 @@ Coordinates all specialized agents to fetch and process news
 
 import logging
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
@@ -19,6 +19,14 @@ from agents.rss_feed_agent import RSSFeedAgent
 from agents.content_agent import ContentAgent
 from agents.ranking_agent import RankingAgent
 from agents.summary_agent import SummaryAgent
+from services.article_store import ArticleStore
+from services.content_store import get_content_store
+from services.article_extractor import extract_article
+from services.page_cache import get_page_cache
+from services.domain_health import get_domain_scoreboard
+from services.dedup import StoryDeduplicator
+from services.llm_gateway import get_llm_gateway
+from config import Config
 
 
 class MultiAgentOrchestrator:
@@ -40,11 +48,17 @@ class MultiAgentOrchestrator:
         
         self.logger.info("Initializing Multi-Agent System...")
         
+        # Shared store of every ingested article (keyword search)
+        self.article_store = ArticleStore(Config.ARTICLE_DB_PATH)
+        
+        # One article per story goes on to ranking and enrichment
+        self.deduplicator = StoryDeduplicator()
+        
         # Initialize all agents
         self.agents = {
             'query': QueryAgent(api_key, show_loading),
-            'google_news': GoogleNewsAgent(show_loading),
-            'rss_feed': RSSFeedAgent(show_loading),
+            'google_news': GoogleNewsAgent(show_loading, self.article_store),
+            'rss_feed': RSSFeedAgent(show_loading, self.article_store),
             'content': ContentAgent(show_loading),
             'ranking': RankingAgent(api_key, show_loading),
             'summary': SummaryAgent(api_key, show_loading),
@@ -67,7 +81,8 @@ class MultiAgentOrchestrator:
         query: str, 
         max_results: int = 10,
         enrich: bool = True,
-        parallel: bool = True
+        parallel: bool = True,
+        summary_mode: str = 'ai'
     ) -> Dict[str, Any]:
         """
         Fetch news using multi-agent system
@@ -77,6 +92,8 @@ class MultiAgentOrchestrator:
             max_results: Maximum results to return (default, can be overridden by query)
             enrich: Whether to enrich with summaries
             parallel: Use parallel processing for search agents
+            summary_mode: 'ai', 'fast' (extractive summaries, no LLM) or
+                'digest' (one shared summary per story)
             
         Returns:
             Dict with success, data, metrics, agent_stats
@@ -129,12 +146,16 @@ class MultiAgentOrchestrator:
             
             self.logger.info(f"Total articles collected: {len(all_articles)}")
             
+            # Same story from several outlets (or twice) -> one representative
+            all_articles = self.deduplicator.collapse(all_articles)
+            
             # ==========================================
             # STEP 3: RANK BY RELEVANCE
             # ==========================================
             ranking_result = self.agents['ranking'].execute({
                 'articles': all_articles,
-                'query': query
+                'query': query,
+                'keywords': intent.get('keywords', [])
             }, top_n=max_results * 2)  # Get more for filtering
             
             if not ranking_result['success']:
@@ -147,9 +168,11 @@ class MultiAgentOrchestrator:
             # STEP 4: EXTRACT CONTENT (if enrich)
             # ==========================================
             if enrich:
+                # Race over the 2x ranked candidates, keep the first N that extract
                 content_result = self.agents['content'].execute(
                     ranked_articles,
-                    max_to_extract=max_results
+                    max_to_extract=max_results,
+                    race=True
                 )
                 
                 if content_result['success']:
@@ -166,7 +189,8 @@ class MultiAgentOrchestrator:
             if enrich:
                 summary_result = self.agents['summary'].execute(
                     articles_with_content,
-                    max_to_summarize=max_results
+                    max_to_summarize=max_results,
+                    summary_mode=summary_mode
                 )
                 
                 if summary_result['success']:
@@ -225,7 +249,8 @@ class MultiAgentOrchestrator:
             rss_future = executor.submit(
                 self.agents['rss_feed'].execute,
                 {
-                    'category': intent['category']
+                    'category': intent['category'],
+                    'keywords': intent.get('keywords', [])
                 },
                 max_results_per_feed=8
             )
@@ -257,7 +282,8 @@ class MultiAgentOrchestrator:
         
         # RSS Feeds
         rss_result = self.agents['rss_feed'].execute({
-            'category': intent['category']
+            'category': intent['category'],
+            'keywords': intent.get('keywords', [])
         }, max_results_per_feed=8)
         
         if rss_result['success']:
@@ -288,6 +314,24 @@ class MultiAgentOrchestrator:
             'agent_stats': self.get_agent_metrics()
         }
     
+    def stream_summary(self, url: str, title: str = '') -> Iterator[Dict[str, Any]]:
+        """
+        Summarize one article, yielding the summary as it is generated
+        
+        Content comes from the content store (already there for articles
+        delivered with enrich=True), else it is extracted first.
+        """
+        content = extract_article(url)
+        
+        article = {
+            'url': url,
+            'title': title or content['title'],
+            'full_text': content['full_text'],
+            'description': '',
+        }
+        
+        yield from self.agents['summary'].stream_summary(article)
+    
     def get_agent_metrics(self) -> Dict[str, Any]:
         """Get metrics from all agents"""
         
@@ -307,8 +351,39 @@ class MultiAgentOrchestrator:
             'failed_requests': self.system_metrics['failed_requests'],
             'success_rate': f"{(self.system_metrics['successful_requests'] / max(1, self.system_metrics['total_requests']) * 100):.2f}%",
             'total_articles_delivered': self.system_metrics['total_articles_delivered'],
+            'article_store': self.article_store.get_stats(),
+            'content_store': get_content_store().get_stats(),
+            'page_cache': get_page_cache().get_stats(),
+            'domain_health': get_domain_scoreboard().get_stats(),
+            'dedup': self.deduplicator.get_stats(),
+            'llm': get_llm_gateway().get_stats(),
         }
     
+    def get_prometheus_metrics(self) -> str:
+        """Request counters and LLM telemetry in the Prometheus text format"""
+        lines = []
+        for name, help_text in (
+            ('total_requests', 'Searches handled'),
+            ('successful_requests', 'Searches that succeeded'),
+            ('failed_requests', 'Searches that failed'),
+            ('total_articles_delivered', 'Articles returned to clients'),
+        ):
+            lines.append(f"# HELP news_{name} {help_text}")
+            lines.append(f"# TYPE news_{name} counter")
+            lines.append(f"news_{name} {self.system_metrics[name]}")
+        
+        lines.extend(get_llm_gateway().telemetry.prometheus())
+        return '\n'.join(lines) + '\n'
+    
+    def start_background_ingestion(self):
+        """Poll feeds in the background so searches never wait on feed I/O"""
+        self.agents['rss_feed'].start_background_polling()
+    
+    def stop_background_ingestion(self):
+        """Stop background feed polling and persist domain health"""
+        self.agents['rss_feed'].stop_background_polling()
+        get_domain_scoreboard().save()
+    
     def health_check(self) -> Dict[str, Any]:
         """Check health of all agents"""
         
@@ -0,0 +1,233 @@
+"""
+Page Cache
+Keeps downloaded article pages so URL resolution, image extraction, content
+extraction and preview all parse the same bytes instead of re-downloading
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+import requests
+
+from config import Config
+from services.domain_health import DomainBlockedError, get_domain_scoreboard
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+
+class PageCache:
+    """
+    Short-lived, size-bounded cache of HTTP responses
+
+    Pages are stored under both the requested and the final (redirected)
+    URL. Concurrent fetches of the same URL share one download. Every
+    download is reported to the domain scoreboard under the host that
+    answered (the redirect target, not a redirector like news.google.com);
+    domains in its negative cache are not contacted.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 300,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_page_bytes: int = 5 * 1024 * 1024,
+        error_ttl_seconds: float = 10,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            ttl_seconds: How long a downloaded page is reused
+            max_bytes: Upper bound of cached page bodies
+            max_page_bytes: Larger pages are returned but not cached
+            error_ttl_seconds: How long a non-2xx response is reused (long
+                enough for one request's stages to share it, short enough
+                that a 429 or 503 is retried soon)
+        """
+        self.ttl = ttl_seconds
+        self.error_ttl = error_ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_page_bytes = max_page_bytes
+
+        self.pages: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.total_bytes = 0
+        self.inflight: Dict[str, threading.Event] = {}
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger("MultiAgent.PageCache")
+
+        self.stats = {
+            'network_requests': 0,
+            'cache_hits': 0,
+            'shared_inflight': 0,
+            'bytes_downloaded': 0,
+            'bytes_saved': 0,
+        }
+
+    def _lookup(self, url: str) -> Optional[Dict[str, Any]]:
+        page = self.pages.get(url)
+        if page is None:
+            return None
+        if time.time() - page['fetched_at'] > page['ttl']:
+            self._remove(url)
+            return None
+        self.pages.move_to_end(url)
+        return page
+
+    def _remove(self, url: str):
+        page = self.pages.get(url)
+        if page is None:
+            return
+        for alias in page['aliases']:
+            self.pages.pop(alias, None)
+        self.total_bytes -= len(page['content'])
+
+    def _store(self, page: Dict[str, Any]):
+        size = len(page['content'])
+        if size > self.max_page_bytes:
+            return
+
+        for url in page['aliases']:
+            self._remove(url)
+        for url in page['aliases']:
+            self.pages[url] = page
+        self.total_bytes += size
+
+        while self.total_bytes > self.max_bytes and self.pages:
+            oldest = next(iter(self.pages))
+            self._remove(oldest)
+
+    def fetch(
+        self,
+        url: str,
+        timeout: float = 5,
+        allow_redirects: bool = True,
+        share_inflight: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Get a page, downloading it only if it is not cached
+
+        Args:
+            url: Page URL
+            timeout: Request timeout in seconds
+            allow_redirects: Follow redirects
+            share_inflight: Wait for a download of the same URL already in
+                progress (False for hedged requests, which must not wait)
+
+        Returns:
+            Dict with url (final), status, content (bytes), encoding
+
+        Raises:
+            DomainBlockedError: When the domain is in the negative cache
+            requests.RequestException: When the download fails
+        """
+        scoreboard = get_domain_scoreboard()
+        waited = False
+
+        while True:
+            with self.lock:
+                page = self._lookup(url)
+                if page is not None:
+                    self.stats['shared_inflight' if waited else 'cache_hits'] += 1
+                    self.stats['bytes_saved'] += len(page['content'])
+                    return page
+
+                waiter = self.inflight.get(url)
+                if waiter is None:
+                    self.inflight[url] = event = threading.Event()
+                    break
+                if not share_inflight:
+                    event = None
+                    break
+
+            # Another thread is downloading this URL - wait, then re-check
+            waiter.wait(timeout)
+            waited = True
+
+        start = time.time()
+
+        try:
+            if scoreboard.should_skip(url):
+                raise DomainBlockedError(f"Skipping failing domain: {url[:60]}")
+
+            try:
+                response = requests.get(
+                    url,
+                    timeout=scoreboard.timeout_for(url, timeout),
+                    allow_redirects=allow_redirects,
+                    headers=DEFAULT_HEADERS
+                )
+            except requests.RequestException as e:
+                # Failures after a redirect belong to the redirect target
+                failed_url = getattr(e.request, 'url', None) or url
+                scoreboard.record(failed_url, False, time.time() - start, type(e).__name__)
+                raise
+
+            # A missing article says nothing about the domain; blocks and
+            # server errors do
+            ok = response.status_code not in (401, 403, 429) and response.status_code < 500
+            scoreboard.record(
+                response.url, ok, time.time() - start,
+                None if ok else f"HTTP {response.status_code}"
+            )
+
+            page = {
+                'url': response.url,
+                'status': response.status_code,
+                'content': response.content,
+                'encoding': response.encoding or response.apparent_encoding,
+                'fetched_at': time.time(),
+                'ttl': self.ttl if 200 <= response.status_code < 300 else self.error_ttl,
+                'aliases': list(dict.fromkeys([url, response.url])),
+            }
+
+            with self.lock:
+                self.stats['network_requests'] += 1
+                self.stats['bytes_downloaded'] += len(page['content'])
+                self._store(page)
+
+            return page
+
+        finally:
+            if event is not None:
+                with self.lock:
+                    if self.inflight.get(url) is event:
+                        del self.inflight[url]
+                event.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics (requests avoided = hits + shared downloads)"""
+        with self.lock:
+            return {
+                'cached_pages': len({id(p) for p in self.pages.values()}),
+                'size': f"{self.total_bytes / 1024 / 1024:.2f}MB",
+                'requests_avoided': self.stats['cache_hits'] + self.stats['shared_inflight'],
+                **self.stats,
+            }
+
+
+def page_text(page: Dict[str, Any]) -> str:
+    """Decode a cached page body to text"""
+    return page['content'].decode(page.get('encoding') or 'utf-8', errors='replace')
+
+
+_cache: Optional[PageCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_page_cache() -> PageCache:
+    """Process-wide page cache shared by every fetch path"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PageCache(
+                ttl_seconds=Config.PAGE_CACHE_TTL_SECONDS,
+                max_bytes=int(Config.PAGE_CACHE_MAX_MB * 1024 * 1024),
+                error_ttl_seconds=Config.PAGE_CACHE_ERROR_TTL_SECONDS,
+            )
+        return _cache
@@ -0,0 +1,280 @@
+"""
+Prompts
+Builds every LLM prompt: markup stripped, boilerplate and repeated sentences
+dropped, and each field fitted to its prompt type's token budget
+"""
+
+import hashlib
+import html
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from config import Config
+from services.rate_limiter import estimate_tokens
+from services.textrank import condense, split_sentences
+
+
+CHARS_PER_TOKEN = 4  # Same ratio as estimate_tokens
+
+# Bump when the cleaning rules (markup, boilerplate, repeats, condensing)
+# change - summary cache keys include it through the prompt versions
+CLEANING_VERSION = 2
+
+SCRIPT_STYLE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+BLOCK_TAG = re.compile(r'<\s*(?:br|/p|/div|/li|/h\d)\b[^>]*>', re.IGNORECASE)
+TAG = re.compile(r'<[^>]*>')
+SPACES = re.compile(r'[ \t\r\f\v\u00a0]+')
+
+# Whole sentences that carry no news (feed footers, page furniture)
+BOILERPLATE = re.compile(
+    r'^(?:'
+    r'the post .+ appeared first on .+'
+    r'|(?:continue reading|read more|read the full (?:story|article)|full story)\b.*'
+    r'|advertisement|sponsored(?: content)?|supported by'
+    r'|(?:sign up|subscribe)\b.*(?:newsletter|inbox|updates|subscription).*'
+    r'|click here\b.*'
+    r'|(?:share|follow us) (?:on|this)\b.*'
+    r'|all rights reserved\b.*'
+    r'|(?:©|copyright)(?:\s*©)?\s*(?:(?:19|20)\d\d|all rights reserved)\b.*'
+    r'|\[?(?:…|\.\.\.)\]?'
+    r')$',
+    re.IGNORECASE
+)
+# Credit lines - only as the last sentence of a line, so "Video: ..." prose
+# inside a paragraph is kept
+CAPTION = re.compile(r'^(?:photo|image|video)(?: credit)?:[^.!?]*[.!?]?$', re.IGNORECASE)
+TRAILING_ELLIPSIS = re.compile(r'\s*\[(?:…|\.\.\.|&#8230;)\]\s*$')
+
+
+def strip_markup(text: str) -> str:
+    """Plain text from HTML/RSS markup, with entities decoded and whitespace collapsed"""
+    if not text:
+        return ''
+
+    if '<' in text:
+        text = SCRIPT_STYLE.sub(' ', text)
+        text = BLOCK_TAG.sub('\n', text)
+        text = TAG.sub(' ', text)
+    text = html.unescape(text)
+
+    lines = (SPACES.sub(' ', line).strip() for line in text.split('\n'))
+    return '\n'.join(line for line in lines if line)
+
+
+def _sentence_key(sentence: str) -> str:
+    return re.sub(r'\W+', ' ', sentence.lower()).strip()
+
+
+def clean_text(text: str, seen: Optional[Set[str]] = None) -> str:
+    """
+    Markup-free text without boilerplate or repeated sentences
+
+    Args:
+        text: Raw text (HTML allowed)
+        seen: Sentence keys already used elsewhere in the prompt; updated,
+            so sentences shared between texts (syndicated copy) appear once
+    """
+    seen = set() if seen is None else seen
+    text = TRAILING_ELLIPSIS.sub('', strip_markup(text))
+
+    kept_lines = []
+    for line in text.split('\n'):
+        kept = []
+        sentences = split_sentences(line)
+        for i, sentence in enumerate(sentences):
+            key = _sentence_key(sentence)
+            if not key or key in seen or BOILERPLATE.match(sentence):
+                continue
+            if i == len(sentences) - 1 and CAPTION.match(sentence):
+                continue
+            seen.add(key)
+            kept.append(sentence)
+        if kept:
+            kept_lines.append(' '.join(kept))
+
+    return '\n'.join(kept_lines)
+
+
+def truncate_tokens(text: str, budget: int) -> str:
+    """Cut text to about budget tokens at a word boundary"""
+    if estimate_tokens(text) <= budget:
+        return text
+
+    cut = text[:budget * CHARS_PER_TOKEN]
+    if ' ' in cut:
+        cut = cut.rsplit(' ', 1)[0]
+    return cut.rstrip(' ,;:-') + '…'
+
+
+def fit_article(text: str, budget: int, seen: Optional[Set[str]] = None) -> str:
+    """
+    Article text for a prompt within budget tokens
+
+    Cleaned first; text still over budget keeps its lead and most central
+    sentences (TextRank), so nothing is sent just because it fits.
+    """
+    text = clean_text(text, seen)
+    if estimate_tokens(text) <= budget:
+        return text
+    return condense(text, budget * CHARS_PER_TOKEN)
+
+
+def summary_prompt(title: str, article_text: str, budget: Optional[int] = None) -> str:
+    """Prompt for summarizing one article"""
+    budget = Config.PROMPT_BUDGET_SUMMARY if budget is None else budget
+    return f"""
+Generate a comprehensive 4-5 sentence summary of this news article:
+
+Title: {strip_markup(title)}
+
+Article: {fit_article(article_text, budget)}
+
+Summary should:
+- Cover all key points
+- Be clear and informative
+- Include important details, names, and numbers
+- Be written in a professional news style
+"""
+
+
+def batch_summary_prompt(jobs: List[Tuple[str, str]], budget: Optional[int] = None) -> str:
+    """Prompt for summarizing several (title, text) articles at once (budget is per article)"""
+    budget = Config.PROMPT_BUDGET_SUMMARY if budget is None else budget
+    articles = "\n\n".join(
+        f"[Article {i}]\nTitle: {strip_markup(title)}\nArticle: {fit_article(text, budget)}"
+        for i, (title, text) in enumerate(jobs, 1)
+    )
+
+    return f"""
+Generate a comprehensive 4-5 sentence summary of each news article below.
+
+Each summary should:
+- Cover all key points
+- Be clear and informative
+- Include important details, names, and numbers
+- Be written in a professional news style
+
+Return ONLY a JSON array with one object per article, in order:
+[{{"id": 1, "summary": "..."}}, {{"id": 2, "summary": "..."}}]
+
+{articles}
+"""
+
+
+def digest_prompt(sources: List[Tuple[str, str, str]], budget: Optional[int] = None) -> str:
+    """
+    Prompt for one digest of a story covered by several (source, title, text) reports
+
+    The reports share budget tokens, and sentences repeated across reports
+    (wire copy) are sent once.
+    """
+    budget = Config.PROMPT_BUDGET_DIGEST if budget is None else budget
+    per_report = max(1, budget // max(1, len(sources)))
+    seen: Set[str] = set()
+
+    reports = "\n\n".join(
+        f"[Report {i} - {source or 'Unknown source'}]\nTitle: {strip_markup(title)}\nArticle: {fit_article(text, per_report, seen)}"
+        for i, (source, title, text) in enumerate(sources, 1)
+    )
+
+    return f"""
+The reports below are different outlets' coverage of the same news story.
+Generate one comprehensive 4-5 sentence summary of the story.
+
+Summary should:
+- Combine the key points from all reports
+- Note where the reports disagree on facts or numbers
+- Include important details, names, and numbers
+- Be written in a professional news style
+
+{reports}
+"""
+
+
+def ranking_line(number: int, article: Dict, title_budget: int, description_budget: int) -> str:
+    """One candidate of the ranking prompt: cleaned title and new information from the description"""
+    title = truncate_tokens(strip_markup(article.get('title', '')).replace('\n', ' '), title_budget)
+    description = strip_markup(article.get('description', '')).replace('\n', ' ')
+
+    # Google News descriptions repeat the title (plus the outlet name):
+    # keep only what follows a repeated title, if it says something
+    title_key = _sentence_key(title.rstrip('…'))
+    if title_key and _sentence_key(description).startswith(title_key):
+        words = list(re.finditer(r'\w+', description))
+        repeated = len(title_key.split())
+        rest = description[words[repeated - 1].end():].strip(' -–—:|.,') if len(words) > repeated else ''
+        description = rest if len(rest.split()) >= 6 else ''
+
+    description = clean_text(description).replace('\n', ' ')
+    if description:
+        return f"{number}. {title} - {truncate_tokens(description, description_budget)}"
+    return f"{number}. {title}"
+
+
+def ranking_prompt(
+    query: str,
+    articles: List[Dict],
+    want: int,
+    title_budget: Optional[int] = None,
+    description_budget: Optional[int] = None,
+) -> str:
+    """Prompt asking for the want most relevant of the numbered articles"""
+    title_budget = Config.PROMPT_BUDGET_RANKING_TITLE if title_budget is None else title_budget
+    description_budget = Config.PROMPT_BUDGET_RANKING_DESCRIPTION if description_budget is None else description_budget
+
+    lines = [ranking_line(i, article, title_budget, description_budget) for i, article in enumerate(articles, 1)]
+
+    return f"""
+User query: "{truncate_tokens(strip_markup(query), Config.PROMPT_BUDGET_QUERY)}"
+
+Rank these articles by relevance (most to least relevant).
+Return ONLY a JSON array of article numbers in order: [5, 2, 8, 1, ...]
+Include the top {want} most relevant articles.
+
+Articles:
+{chr(10).join(lines)}
+"""
+
+
+def query_parse_prompt(query: str) -> str:
+    """Prompt extracting structured search intent from a user query"""
+    return f"""
+Analyze this news search query and extract structured information:
+
+Query: "{truncate_tokens(strip_markup(query).replace(chr(10), ' '), Config.PROMPT_BUDGET_QUERY)}"
+
+Return ONLY a JSON object with these fields:
+{{
+    "keywords": ["list", "of", "keywords"],
+    "location": "country/state/city or null",
+    "category": "technology/sports/politics/business/health/entertainment or general",
+    "timeframe": "latest/today/recent or null",
+    "search_term": "optimized search term for news search",
+    "intent": "what the user wants to find"
+}}
+"""
+
+
+def _prompt_version(*parts) -> str:
+    return hashlib.sha1('\x00'.join(str(part) for part in parts).encode('utf-8')).hexdigest()[:12]
+
+
+# Summary cache keys include these: they change with the templates, the
+# token budgets and the cleaning rules, so no summary made from a
+# differently built prompt is served
+SUMMARY_PROMPT_VERSION = _prompt_version(
+    summary_prompt('{title}', '{text}'),
+    batch_summary_prompt([('{title}', '{text}')]),
+    Config.PROMPT_BUDGET_SUMMARY,
+    CLEANING_VERSION,
+    BOILERPLATE.pattern,
+    CAPTION.pattern,
+)
+
+DIGEST_PROMPT_VERSION = _prompt_version(
+    digest_prompt([('{source}', '{title}', '{text}')]),
+    Config.PROMPT_BUDGET_DIGEST,
+    CLEANING_VERSION,
+    BOILERPLATE.pattern,
+    CAPTION.pattern,
+)
@@ -0,0 +1,145 @@
+"""
+Rate Limiter
+Token-bucket limiter for LLM quota (requests per minute and tokens per minute)
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from config import Config
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a prompt (about 4 characters per token)"""
+    return max(1, len(text or '') // 4)
+
+
+class TokenBucketLimiter:
+    """
+    Two token buckets - requests and LLM tokens - refilled continuously
+
+    A bucket holds burst_seconds worth of quota and refills at the rest of
+    the per-minute quota, so no 60 second window can exceed the quota even
+    when a full bucket is spent at once.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        burst_seconds: float = 10,
+    ):
+        """
+        Initialize limiter
+
+        Args:
+            requests_per_minute: Request quota
+            tokens_per_minute: Token quota (prompt + expected output)
+            burst_seconds: Quota that may be used at once, in seconds of quota
+        """
+        self.buckets = {}
+        for name, quota in (('requests', requests_per_minute), ('tokens', tokens_per_minute)):
+            capacity = max(1.0, quota * burst_seconds / 60)
+            self.buckets[name] = {
+                'capacity': capacity,
+                'rate': max(quota - capacity, 1.0) / 60,  # per second
+                'level': capacity,
+            }
+
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger("MultiAgent.RateLimiter")
+
+        self.stats = {
+            'acquired': 0,
+            'waited': 0,
+            'timeouts': 0,
+            'wait_time': 0.0,
+            'tokens': 0,
+        }
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.updated
+        self.updated = now
+        for bucket in self.buckets.values():
+            bucket['level'] = min(bucket['capacity'], bucket['level'] + elapsed * bucket['rate'])
+
+    def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Take one request and some tokens, waiting until both are available
+
+        Args:
+            tokens: Estimated tokens of the call (clamped to the bucket size)
+            timeout: Give up after this many seconds (None = wait as long
+                as needed)
+
+        Returns:
+            True if acquired, False on timeout
+        """
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+
+        while True:
+            with self.lock:
+                self._refill()
+
+                need = {
+                    'requests': 1.0,
+                    'tokens': min(float(tokens), self.buckets['tokens']['capacity']),
+                }
+                wait = max(
+                    (need[name] - bucket['level']) / bucket['rate']
+                    for name, bucket in self.buckets.items()
+                )
+
+                if wait <= 0:
+                    for name, bucket in self.buckets.items():
+                        bucket['level'] -= need[name]
+
+                    waited = time.monotonic() - start
+                    self.stats['acquired'] += 1
+                    self.stats['tokens'] += tokens
+                    if waited > 0.001:
+                        self.stats['waited'] += 1
+                        self.stats['wait_time'] += waited
+                    return True
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    with self.lock:
+                        self.stats['timeouts'] += 1
+                    return False
+                wait = min(wait, remaining)
+
+            time.sleep(min(wait, 1.0))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics"""
+        with self.lock:
+            self._refill()
+            return {
+                'available_requests': round(self.buckets['requests']['level'], 2),
+                'available_tokens': int(self.buckets['tokens']['level']),
+                **self.stats,
+                'wait_time': f"{self.stats['wait_time']:.2f}s",
+            }
+
+
+_limiter: Optional[TokenBucketLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_llm_limiter() -> TokenBucketLimiter:
+    """Process-wide limiter for the Gemini quota"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = TokenBucketLimiter(
+                requests_per_minute=Config.GEMINI_REQUESTS_PER_MINUTE,
+                tokens_per_minute=Config.GEMINI_TOKENS_PER_MINUTE,
+            )
+        return _limiter
@@ -0,0 +1,159 @@
+"""
+Summary Batcher
+Collects summary jobs from concurrent requests for a short window and sends
+them to the LLM as one multi-article prompt
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Tuple
+
+from services.llm_gateway import parse_json_text
+from services.prompts import summary_prompt, batch_summary_prompt
+
+
+def parse_batch_response(text: str, count: int) -> Dict[int, str]:
+    """
+    Summaries by article number (1-based) from a batch response
+
+    Accepts [{"id": n, "summary": "..."}] or a plain array of strings.
+    Missing or malformed entries are left out.
+    """
+    items = parse_json_text(text)
+
+    summaries = {}
+    for position, item in enumerate(items if isinstance(items, list) else [], 1):
+        if isinstance(item, dict):
+            number, summary = item.get('id', position), item.get('summary')
+        else:
+            number, summary = position, item
+        if isinstance(number, int) and 1 <= number <= count and isinstance(summary, str) and summary.strip():
+            summaries[number] = summary.strip()
+
+    return summaries
+
+
+class SummaryBatcher:
+    """
+    Micro-batcher in front of the summary LLM calls
+
+    The first pending job opens a window; the batch is sent when the window
+    ends or max_batch jobs are waiting. Each batch is one LLM call whose
+    JSON array is fanned back out to the waiting futures. Articles missing
+    from the response are retried on their own.
+    """
+
+    def __init__(
+        self,
+        call_model: Callable[[str, int], str],
+        window: float = 0.05,
+        max_batch: int = 8,
+        max_inflight: int = 4,
+    ):
+        """
+        Initialize batcher
+
+        Args:
+            call_model: Sends a prompt covering n articles to the LLM (quota
+                included) and returns its text
+            window: Seconds to wait for more jobs after the first one
+            max_batch: Articles per prompt
+            max_inflight: Batches sent concurrently
+        """
+        self.call_model = call_model
+        self.window = window
+        self.max_batch = max_batch
+
+        self.jobs: "queue.Queue[Tuple[str, str, Future]]" = queue.Queue()
+        self.sender = ThreadPoolExecutor(max_workers=max_inflight, thread_name_prefix="summary-batch")
+        self.collector = None
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger("MultiAgent.SummaryBatcher")
+
+        self.stats = {
+            'jobs': 0,
+            'batches': 0,
+            'llm_calls': 0,
+            'single_retries': 0,
+        }
+
+    def submit(self, title: str, article_text: str) -> Future:
+        """Queue an article; the future resolves to its summary"""
+        future: Future = Future()
+
+        with self.lock:
+            if self.collector is None:
+                self.collector = threading.Thread(target=self._collect, daemon=True, name="summary-collector")
+                self.collector.start()
+            self.stats['jobs'] += 1
+
+        self.jobs.put((title, article_text, future))
+        return future
+
+    def _collect(self):
+        while True:
+            batch = [self.jobs.get()]
+            deadline = time.monotonic() + self.window
+
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.jobs.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self.sender.submit(self._send, batch)
+
+    def _call(self, prompt: str, articles: int = 1) -> str:
+        with self.lock:
+            self.stats['llm_calls'] += 1
+        return self.call_model(prompt, articles)
+
+    def _send(self, batch: List[Tuple[str, str, Future]]):
+        with self.lock:
+            self.stats['batches'] += 1
+
+        if len(batch) == 1:
+            title, text, future = batch[0]
+            self._send_single(title, text, future)
+            return
+
+        try:
+            response = self._call(batch_summary_prompt([(title, text) for title, text, _ in batch]), len(batch))
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        try:
+            summaries = parse_batch_response(response, len(batch))
+        except (ValueError, TypeError) as e:
+            self.logger.debug(f"Unreadable batch response, retrying singly: {e}")
+            summaries = {}
+
+        for number, (title, text, future) in enumerate(batch, 1):
+            if number in summaries:
+                future.set_result(summaries[number])
+            else:
+                with self.lock:
+                    self.stats['single_retries'] += 1
+                self._send_single(title, text, future)
+
+    def _send_single(self, title: str, text: str, future: Future):
+        try:
+            future.set_result(self._call(summary_prompt(title, text)).strip())
+        except Exception as e:
+            future.set_exception(e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics"""
+        with self.lock:
+            return {
+                'avg_batch_size': f"{(self.stats['jobs'] / self.stats['batches']) if self.stats['batches'] else 0:.2f}",
+                **self.stats,
+            }
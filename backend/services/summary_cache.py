@@ -0,0 +1,139 @@
+"""
+Summary Cache
+Persistent LRU cache of AI summaries keyed by a hash of the article text,
+prompt version and model
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+
+def summary_key(title: str, text: str, prompt_version: str, model: str) -> str:
+    """Cache key of a summary - any change to text, prompt or model misses"""
+    digest = hashlib.sha256()
+    for part in (prompt_version, model, title, text):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """
+    Summaries by content hash, with least-recently-used eviction
+
+    Keys come from summary_key, so a new prompt template or model simply
+    stops matching old entries; those age out through LRU eviction.
+    """
+
+    def __init__(self, db_path: str = "data/summaries.db", max_entries: int = 20000):
+        """
+        Initialize cache
+
+        Args:
+            db_path: SQLite file (":memory:" for a throwaway cache)
+            max_entries: Entries kept before the least recently used go
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.logger = logging.getLogger("MultiAgent.SummaryCache")
+        self.lock = threading.Lock()
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS summaries (
+                    key TEXT PRIMARY KEY,
+                    summary TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_summaries_access ON summaries (last_access)"
+            )
+
+        self.count = self.conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'writes': 0,
+            'evictions': 0,
+        }
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached summary for a key, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT summary FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.stats['misses'] += 1
+                return None
+
+            with self.conn:
+                self.conn.execute(
+                    "UPDATE summaries SET last_access = ? WHERE key = ?", (time.time(), key)
+                )
+            self.stats['hits'] += 1
+            return row[0]
+
+    def put(self, key: str, summary: str):
+        """Store a summary"""
+        now = time.time()
+
+        with self.lock:
+            with self.conn:
+                inserted = self.conn.execute(
+                    "INSERT OR IGNORE INTO summaries (key, summary, created, last_access) "
+                    "VALUES (?, ?, ?, ?)", (key, summary, now, now)
+                ).rowcount
+                if not inserted:
+                    self.conn.execute(
+                        "UPDATE summaries SET summary = ?, last_access = ? WHERE key = ?",
+                        (summary, now, key)
+                    )
+
+            self.count += inserted
+            self.stats['writes'] += 1
+
+            if self.count > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries down to 90% of max_entries"""
+        excess = self.count - int(self.max_entries * 0.9)
+
+        with self.conn:
+            removed = self.conn.execute("""
+                DELETE FROM summaries WHERE key IN (
+                    SELECT key FROM summaries ORDER BY last_access LIMIT ?
+                )
+            """, (excess,)).rowcount
+
+        self.count -= removed
+        self.stats['evictions'] += removed
+        self.logger.debug(f"Evicted {removed} summaries")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics (every hit is an LLM call saved)"""
+        with self.lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                'entries': self.count,
+                'hit_rate': f"{(self.stats['hits'] / lookups * 100) if lookups else 0:.2f}%",
+                'saved_llm_calls': self.stats['hits'],
+                **self.stats,
+            }
@@ -0,0 +1,127 @@
+"""
+TextRank
+CPU-only extractive summarizer: sentence segmentation, TF-IDF sentence
+vectors and PageRank over their cosine similarity matrix
+"""
+
+import re
+from typing import List
+
+import numpy as np
+
+from services.bm25 import tokenize
+
+
+# Sentence end: . ! ? (optionally closing quote/bracket), whitespace, then
+# an uppercase letter, digit or opening quote
+SENTENCE_END = re.compile(r'(?<=[.!?])["\'”’)\]]?\s+(?=["“‘(\[]?[A-Z0-9])')
+
+ABBREVIATIONS = {
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'gen', 'col', 'lt',
+    'sgt', 'gov', 'sen', 'rep', 'inc', 'ltd', 'co', 'corp', 'vs', 'no',
+    'u.s', 'u.k', 'u.n', 'e.g', 'i.e', 'jan', 'feb', 'mar', 'apr', 'jun',
+    'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec',
+}
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences, keeping abbreviations (Mr., U.S.) intact"""
+    sentences = []
+    for paragraph in re.split(r'\n\s*\n|\n', text or ''):
+        pending = ''
+        for piece in SENTENCE_END.split(paragraph.strip()):
+            pending = f"{pending} {piece}".strip() if pending else piece.strip()
+            last_word = pending.rsplit(None, 1)[-1].rstrip('.').lower() if pending else ''
+            if last_word in ABBREVIATIONS or (len(last_word) == 1 and last_word.isalpha()):
+                continue  # "Mr. Smith", "John F. Kennedy"
+            if pending:
+                sentences.append(pending)
+            pending = ''
+        if pending:
+            sentences.append(pending)
+    return sentences
+
+
+def rank_sentences(sentences: List[str], damping: float = 0.85, iterations: int = 50) -> np.ndarray:
+    """
+    TextRank score of every sentence
+
+    Sentences become L2-normalized TF-IDF vectors; the similarity graph is
+    their Gram matrix (diagonal removed), and scores come from power
+    iteration on the row-normalized graph.
+    """
+    count = len(sentences)
+    if count < 3:
+        return np.ones(count, dtype=np.float32)
+
+    tokens = [tokenize(sentence) for sentence in sentences]
+    vocabulary = {term: i for i, term in enumerate(sorted({t for ts in tokens for t in ts}))}
+    if not vocabulary:
+        return np.ones(count, dtype=np.float32)
+
+    tf = np.zeros((count, len(vocabulary)), dtype=np.float32)
+    for row, sentence_tokens in enumerate(tokens):
+        for term in sentence_tokens:
+            tf[row, vocabulary[term]] += 1
+
+    df = np.count_nonzero(tf, axis=0)
+    vectors = np.log1p(tf) * np.log((1 + count) / (1 + df) + 1).astype(np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= np.where(norms > 0, norms, 1)
+
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, 0)
+
+    row_sums = similarity.sum(axis=1, keepdims=True)
+    # Sentences unlike any other link uniformly
+    transition = np.where(row_sums > 0, similarity / np.where(row_sums > 0, row_sums, 1), 1.0 / count)
+
+    scores = np.full(count, 1.0 / count, dtype=np.float32)
+    for _ in range(iterations):
+        updated = (1 - damping) / count + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < 1e-6:
+            scores = updated
+            break
+        scores = updated
+
+    return scores
+
+
+def extractive_summary(text: str, max_sentences: int = 3) -> str:
+    """The max_sentences most central sentences, in article order"""
+    sentences = [s for s in split_sentences(text) if len(s.split()) >= 4]
+    if not sentences:
+        return (text or '').strip()[:500]
+
+    scores = rank_sentences(sentences)
+    chosen = sorted(np.argsort(-scores, kind='stable')[:max_sentences])
+    return ' '.join(sentences[i] for i in chosen)
+
+
+def condense(text: str, max_chars: int) -> str:
+    """
+    Shorten text to max_chars by keeping its most central sentences
+
+    The lead sentence is always kept and the result stays in article
+    order. Texts already within max_chars are returned unchanged.
+    """
+    if len(text) <= max_chars:
+        return text
+
+    sentences = split_sentences(text)
+    if len(sentences) < 2:
+        return text[:max_chars]
+
+    scores = rank_sentences(sentences)
+    chosen = {0}
+    used = len(sentences[0])
+
+    for i in np.argsort(-scores, kind='stable'):
+        if i in chosen:
+            continue
+        if used + len(sentences[i]) + 1 > max_chars:
+            continue
+        chosen.add(int(i))
+        used += len(sentences[i]) + 1
+
+    return ' '.join(sentences[i] for i in sorted(chosen))[:max_chars]
@@ -0,0 +1,53 @@
+"""
+Domain health negative cache - block, probe and cooldown escalation
+"""
+
+from services import domain_health
+from services.domain_health import DomainScoreboard
+
+URL = "https://flaky.example.com/story"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cooldown_doubles_only_when_probe_fails(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(domain_health.time, 'time', clock)
+    board = DomainScoreboard(path=None, min_samples=4, cooldown_seconds=600)
+    entry = lambda: board.domains[f"fetch:{domain_health.domain_of(URL)}"]
+
+    # Four failures block the domain for the base cooldown
+    for _ in range(4):
+        board.record(URL, success=False)
+    assert entry()['block_count'] == 1
+    assert entry()['blocked_until'] == clock.now + 600
+    assert board.should_skip(URL)
+
+    # Requests that were in flight keep failing - the block stays as it was
+    for _ in range(6):
+        board.record(URL, success=False)
+    assert entry()['block_count'] == 1
+    assert entry()['blocked_until'] == clock.now + 600
+
+    # Cooldown over: one probe goes through, the rest wait for it
+    clock.now += 600
+    assert not board.should_skip(URL)
+    assert board.should_skip(URL)
+
+    # The probe fails - next cooldown is twice as long
+    board.record(URL, success=False)
+    assert entry()['block_count'] == 2
+    assert entry()['blocked_until'] == clock.now + 1200
+
+    # Next probe succeeds - the block is lifted
+    clock.now += 1200
+    assert not board.should_skip(URL)
+    board.record(URL, success=True)
+    assert entry()['block_count'] == 0
+    assert not board.should_skip(URL)
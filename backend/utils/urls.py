@@ -0,0 +1,57 @@
+"""
+URL helpers
+Canonical form of article URLs so the same article gets one cache key
+"""
+
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+# Query parameters that only track the click, never change the article
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ocid', 'cmpid', 'smid', 'smtyp', 'ref_src', 'ref_url', 'ito',
+    'ns_mchannel', 'ns_source', 'ns_campaign', 'ns_linkname', 'ns_fee',
+    'guccounter',
+}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Canonical form of an article URL
+
+    Lowercases scheme/host, drops "www.", default ports, fragments,
+    tracking parameters (utm_*, fbclid, ...) and trailing slashes, and
+    sorts the remaining query parameters.
+    """
+    if not url:
+        return ''
+
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    scheme = (parts.scheme or 'http').lower()
+    if scheme == 'http':
+        scheme = 'https'  # Same article on both schemes
+
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    netloc = host
+    if parts.port and parts.port not in (80, 443):
+        netloc = f"{host}:{parts.port}"
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(('utm_', 'at_')) and key.lower() not in TRACKING_PARAMS
+    ]
+    query.sort()
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ''))